@@ -0,0 +1,27 @@
+import os
+import timeit
+
+_django_ready = False
+
+
+def setup_django() -> None:
+    """Configure Django with benchmarks.settings and create the schema in memory (once)."""
+    global _django_ready
+    if _django_ready:
+        return
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.settings")
+
+    import django
+    from django.core.management import call_command
+
+    django.setup()
+    call_command("migrate", run_syncdb=True, verbosity=0)
+    _django_ready = True
+
+
+def measure(fn, *, repeat: int = 5, number: int | None = None) -> float:
+    """Best-of-`repeat` seconds per call of `fn`."""
+    timer = timeit.Timer(fn)
+    if number is None:
+        number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
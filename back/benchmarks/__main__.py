@@ -0,0 +1,79 @@
+"""
+Run the benchmark suite and compare against the stored baselines.
+
+    python -m benchmarks                    run everything, fail on regressions
+    python -m benchmarks parsers pdf        run a subset
+    python -m benchmarks --save             record the current numbers as the baseline
+
+Baselines are per machine: record them with --save on the machine you
+compare on (and commit them if that machine is shared, e.g. CI). A
+benchmark without a baseline fails the run too, so an empty baselines.json
+can't pass as "no regressions".
+"""
+import argparse
+import importlib
+import json
+import sys
+from pathlib import Path
+
+SUITES = ["parsers", "prompts", "pdf", "serializers", "services", "search"]
+BASELINES = Path(__file__).with_name("baselines.json")
+
+
+def load_baselines() -> dict:
+    if BASELINES.exists():
+        return json.loads(BASELINES.read_text())
+    return {"threshold": 0.25, "thresholds": {}, "results": {}}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("suites", nargs="*", metavar="suite", help=f"any of: {', '.join(SUITES)} (default: all)")
+    parser.add_argument("--save", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--threshold", type=float, help="allowed slowdown ratio, overrides baselines.json")
+    args = parser.parse_args(argv)
+    unknown = set(args.suites) - set(SUITES)
+    if unknown:
+        parser.error(f"unknown suite(s): {', '.join(sorted(unknown))}")
+
+    baselines = load_baselines()
+    results: dict[str, float] = {}
+    for suite in args.suites or SUITES:
+        module = importlib.import_module(f"benchmarks.bench_{suite}")
+        results.update(module.run())
+
+    regressions = []
+    missing = []
+    print(f"{'benchmark':<24} {'current':>12} {'baseline':>12} {'change':>8}")
+    for name, seconds in results.items():
+        baseline = baselines["results"].get(name)
+        if baseline is None:
+            print(f"{name:<24} {seconds * 1e6:10.1f}µs {'-':>12} {'new':>8}")
+            missing.append(name)
+            continue
+        change = seconds / baseline - 1
+        allowed = args.threshold if args.threshold is not None else baselines["thresholds"].get(name, baselines["threshold"])
+        flag = "  REGRESSION" if change > allowed else ""
+        print(f"{name:<24} {seconds * 1e6:10.1f}µs {baseline * 1e6:10.1f}µs {change:+8.0%}{flag}")
+        if flag:
+            regressions.append(name)
+
+    if args.save:
+        baselines["results"].update(results)
+        BASELINES.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        print(f"Saved {len(results)} baseline(s) to {BASELINES.name}.")
+        return 0
+
+    if missing:
+        print(
+            f"{len(missing)} benchmark(s) without a baseline: {', '.join(missing)}\n"
+            "Record them with `python -m benchmarks --save` on this machine.",
+            file=sys.stderr,
+        )
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}", file=sys.stderr)
+    return 1 if missing or regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,33 @@
+"""
+LLM output parsers on realistic replies.
+
+    python -m benchmarks.bench_parsers      (from back/)
+"""
+from benchmarks import measure, setup_django
+
+setup_django()
+
+from src.agent.parsers import parse_json_response, parse_questions  # noqa: E402
+
+from benchmarks.fixtures import evaluation_output, questions_output  # noqa: E402
+
+
+def run() -> dict[str, float]:
+    questions = questions_output(15)
+    qa_ids = list(range(1, 16))
+    fenced = evaluation_output(qa_ids, fenced=True)
+    chatty = evaluation_output(qa_ids, fenced=False, chatter=True)
+
+    assert len(parse_questions(questions)) == 15
+    assert len(parse_json_response(chatty)["evaluations"]) == 15
+
+    return {
+        "parse_questions.15": measure(lambda: parse_questions(questions)),
+        "parse_json.fenced": measure(lambda: parse_json_response(fenced)),
+        "parse_json.fallback": measure(lambda: parse_json_response(chatty)),
+    }
+
+
+if __name__ == "__main__":
+    for name, seconds in run().items():
+        print(f"{name:<22} {seconds * 1e6:10.1f} µs")
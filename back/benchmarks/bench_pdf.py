@@ -0,0 +1,26 @@
+"""
+CV text extraction with pdfplumber on generated sample CVs.
+
+    python -m benchmarks.bench_pdf      (from back/)
+"""
+from benchmarks import measure, setup_django
+
+setup_django()
+
+from src.interview.cv_service import extract_text_from_pdf  # noqa: E402
+
+from benchmarks.fixtures import cv_pdf  # noqa: E402
+
+
+def run() -> dict[str, float]:
+    results = {}
+    for pages in (1, 3):
+        pdf = cv_pdf(pages)
+        assert "Senior Software Engineer" in extract_text_from_pdf(pdf)
+        results[f"pdf.extract.{pages}p"] = measure(lambda: extract_text_from_pdf(pdf), repeat=3)
+    return results
+
+
+if __name__ == "__main__":
+    for name, seconds in run().items():
+        print(f"{name:<22} {seconds * 1e3:10.2f} ms")
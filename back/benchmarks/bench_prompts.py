@@ -0,0 +1,37 @@
+"""
+Prompt builders for question generation, evaluation and CV analysis.
+
+    python -m benchmarks.bench_prompts      (from back/)
+"""
+from benchmarks import measure, setup_django
+
+setup_django()
+
+from src.agent.prompts import (  # noqa: E402
+    build_full_evaluation_messages,
+    build_question_generation_messages,
+)
+from src.interview.cv_prompts import build_cv_analysis_messages  # noqa: E402
+
+from benchmarks.fixtures import AGENT_PROMPT, ANSWER, JOB_DESCRIPTION, QUESTIONS, cv_text  # noqa: E402
+
+
+def run() -> dict[str, float]:
+    qa_pairs = [
+        {"qa_id": n, "question": text, "answer": ANSWER}
+        for n, text in enumerate(QUESTIONS, start=1)
+    ]
+    cv = cv_text(pages=3)
+
+    return {
+        "prompt.questions": measure(
+            lambda: build_question_generation_messages(AGENT_PROMPT, JOB_DESCRIPTION, 15)
+        ),
+        "prompt.evaluation.15": measure(lambda: build_full_evaluation_messages(AGENT_PROMPT, qa_pairs)),
+        "prompt.cv": measure(lambda: build_cv_analysis_messages(cv)),
+    }
+
+
+if __name__ == "__main__":
+    for name, seconds in run().items():
+        print(f"{name:<22} {seconds * 1e6:10.1f} µs")
@@ -0,0 +1,50 @@
+"""
+Full-text question search on a generated bank. The bank size defaults to
+200k rows; set BENCH_SEARCH_ROWS=1000000 for the full-size check.
+
+    python -m benchmarks.bench_search      (from back/)
+"""
+import os
+import random
+
+from benchmarks import measure, setup_django
+
+setup_django()
+
+from src.interview.models import Question  # noqa: E402
+from src.interview.search import search_questions  # noqa: E402
+
+WORDS = (
+    "design scale cache database queue latency replica index shard deploy rollback "
+    "incident monitor alert team mentor conflict deadline estimate review test "
+    "refactor migration schema api contract outage budget hire feedback goal"
+).split()
+
+
+def seed(rows: int) -> None:
+    rng = random.Random(0)
+    batch = []
+    for n in range(rows):
+        words = " ".join(rng.choice(WORDS) for _ in range(12))
+        batch.append(Question(text=f"How would you {words} in project {n}?"))
+        if len(batch) == 5000:
+            Question.objects.bulk_create(batch)
+            batch = []
+    Question.objects.bulk_create(batch)
+
+
+def run() -> dict[str, float]:
+    seed(int(os.environ.get("BENCH_SEARCH_ROWS", 200_000)))
+    assert search_questions("database replica", 20)
+
+    return {
+        "search.common": measure(lambda: search_questions("database", 21), repeat=3),
+        "search.two_terms": measure(lambda: search_questions("replica outage", 21), repeat=3),
+        "search.prefix": measure(lambda: search_questions("shard migr", 21), repeat=3),
+        "search.page10": measure(lambda: search_questions("cache latency", 21, offset=200), repeat=3),
+    }
+
+
+if __name__ == "__main__":
+    for name, seconds in run().items():
+        print(f"{name:<22} {seconds * 1e3:10.2f} ms")
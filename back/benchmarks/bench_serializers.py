@@ -0,0 +1,82 @@
+"""
+Interview read paths: DRF ModelSerializer + JSONRenderer versus the
+hand-written serializers + ORJSONRenderer.
+
+    python -m benchmarks.bench_serializers      (from back/)
+"""
+from benchmarks import measure, setup_django
+
+setup_django()
+
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from core.renderers import ORJSONRenderer  # noqa: E402
+from src.interview.models import Agent, Interview, InterviewQA, Question  # noqa: E402
+from src.interview.serializers import (  # noqa: E402
+    InterviewDetailSerializer,
+    InterviewListSerializer,
+    interview_detail_data,
+    interview_list_data,
+)
+from src.user.models import CustomUser  # noqa: E402
+
+FEEDBACK = (
+    "Clear structure and a concrete example, but the answer skipped the trade-offs "
+    "you considered and how you measured the outcome. "
+) * 3
+
+
+def seed(questions: int = 15, interviews: int = 50) -> tuple[Interview, list[Interview]]:
+    user = CustomUser.objects.create_user(email="bench@example.invalid")
+    agent = Agent.objects.create(name="Bench agent", prompt="You are a demanding interviewer. " * 100)
+
+    for n in range(interviews):
+        interview = Interview.objects.create(
+            user=user,
+            agent=agent,
+            job_description="Senior backend engineer, Python and Django. " * 10,
+            number_of_questions=questions,
+            status=Interview.Status.COMPLETED,
+            overall_score=7,
+            overall_feedback=FEEDBACK,
+        )
+        for order in range(1, questions + 1):
+            question = Question.objects.create(text=f"Question {n}-{order}: describe a hard problem you solved?")
+            InterviewQA.objects.create(
+                interview=interview,
+                question=question,
+                order=order,
+                answer="I profiled the service, found the N+1 and fixed it. " * 8,
+                score=7,
+                feedback=FEEDBACK,
+                timings={"tts_first_audio": 420, "tts_end": 3900, "silence_cutoff": 21000, "publish_max": 4},
+            )
+
+    detail = (
+        Interview.objects.select_related("agent").prefetch_related("qa_pairs__question").get(pk=interview.pk)
+    )
+    listing = list(Interview.objects.select_related("agent").order_by("-created_at")[:20])
+    return detail, listing
+
+
+def run() -> dict[str, float]:
+    detail, listing = seed()
+    drf, fast = JSONRenderer(), ORJSONRenderer()
+
+    assert interview_detail_data(detail) == InterviewDetailSerializer(detail).data
+    assert [interview_list_data(i) for i in listing] == InterviewListSerializer(listing, many=True).data
+
+    return {
+        "detail.drf": measure(lambda: drf.render(InterviewDetailSerializer(detail).data)),
+        "detail.fast": measure(lambda: fast.render(interview_detail_data(detail))),
+        "list20.drf": measure(lambda: drf.render(InterviewListSerializer(listing, many=True).data)),
+        "list20.fast": measure(lambda: fast.render([interview_list_data(i) for i in listing])),
+    }
+
+
+if __name__ == "__main__":
+    results = run()
+    for name, seconds in results.items():
+        print(f"{name:<14} {seconds * 1e6:10.1f} µs")
+    for path in ("detail", "list20"):
+        print(f"{path} speed-up: {results[f'{path}.drf'] / results[f'{path}.fast']:.1f}x")
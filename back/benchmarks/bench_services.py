@@ -0,0 +1,76 @@
+"""
+Question generation and evaluation services end to end, with call_llm
+replaced by a canned reply so only our own parsing and DB work is timed.
+Each call runs in a transaction that is rolled back, so every iteration
+sees the same data.
+
+    python -m benchmarks.bench_services      (from back/)
+"""
+from benchmarks import measure, setup_django
+
+setup_django()
+
+from django.db import transaction  # noqa: E402
+
+from src.agent import service  # noqa: E402
+from src.interview.models import Agent, Interview, InterviewQA, Question  # noqa: E402
+from src.user.models import CustomUser  # noqa: E402
+
+from benchmarks.fixtures import (  # noqa: E402
+    AGENT_PROMPT,
+    ANSWER,
+    JOB_DESCRIPTION,
+    QUESTIONS,
+    evaluation_output,
+    questions_output,
+)
+
+
+def seed() -> tuple[Interview, Interview]:
+    user = CustomUser.objects.create_user(email="bench-services@example.invalid")
+    agent = Agent.objects.create(name="Bench services agent", prompt=AGENT_PROMPT)
+
+    pending = Interview.objects.create(
+        user=user, agent=agent, job_description=JOB_DESCRIPTION, number_of_questions=15,
+    )
+    in_progress = Interview.objects.create(
+        user=user, agent=agent, job_description=JOB_DESCRIPTION, number_of_questions=15,
+        status=Interview.Status.IN_PROGRESS,
+    )
+    for order, text in enumerate(QUESTIONS, start=1):
+        InterviewQA.objects.create(interview=in_progress, question=Question.objects.create(text=text), order=order)
+    return pending, in_progress
+
+
+def rolled_back(fn, *args):
+    def call():
+        with transaction.atomic():
+            fn(*args)
+            transaction.set_rollback(True)
+    return call
+
+
+def run() -> dict[str, float]:
+    pending, in_progress = seed()
+    qa_ids = list(in_progress.qa_pairs.values_list("pk", flat=True))
+    answers = [{"qa_id": qa_id, "answer": ANSWER} for qa_id in qa_ids]
+
+    real_call_llm = service.call_llm
+    try:
+        service.call_llm = lambda messages, model=None: questions_output(15)
+        generate = measure(rolled_back(service.generate_and_save_questions, pending), repeat=3)
+
+        service.call_llm = lambda messages, model=None: evaluation_output(qa_ids)
+        evaluate = measure(rolled_back(service.evaluate_and_save_all, in_progress, answers), repeat=3)
+    finally:
+        service.call_llm = real_call_llm
+
+    return {
+        "service.generate.15": generate,
+        "service.evaluate.15": evaluate,
+    }
+
+
+if __name__ == "__main__":
+    for name, seconds in run().items():
+        print(f"{name:<22} {seconds * 1e3:10.2f} ms")
@@ -0,0 +1,79 @@
+"""
+Silero VAD throughput, one ONNX call per session window vs one batched call
+per step across all sessions (src/livekit/batched_vad.py). Reports how many
+real-time sessions one core sustains. Needs the agent's dependencies
+(livekit-plugins-silero), so it is not part of the default suite.
+
+    python -m benchmarks.bench_vad          (from back/)
+"""
+import time
+
+import numpy as np
+from livekit.plugins.silero import onnx_model
+
+from src.livekit.batched_vad import BatchedInference, BatchedWindowModel
+
+SAMPLE_RATE = 16000
+AUDIO_SECONDS = 10.0
+SESSIONS = (1, 8, 32, 64)
+
+
+def windows(count: int, size: int, seed: int) -> np.ndarray:
+    """Noise with speech-like bursts, one row per VAD window."""
+    rng = np.random.default_rng(seed)
+    audio = rng.normal(0, 0.02, (count, size)).astype(np.float32)
+    audio[rng.random(count) < 0.4] *= 15
+    return np.clip(audio, -1, 1)
+
+
+def unbatched(session, audio: list[np.ndarray]) -> float:
+    models = [onnx_model.OnnxModel(onnx_session=session, sample_rate=SAMPLE_RATE) for _ in audio]
+    start = time.process_time()
+    for step in range(len(audio[0])):
+        for model, stream in zip(models, audio):
+            model(stream[step])
+    return time.process_time() - start
+
+
+class _Result:
+    """Stands in for the Future the batcher thread would resolve."""
+
+    def set_result(self, value):
+        self.value = value
+
+    def set_exception(self, exc):
+        raise exc
+
+
+def batched(batcher: BatchedInference, audio: list[np.ndarray]) -> float:
+    models = [BatchedWindowModel(batcher, SAMPLE_RATE) for _ in audio]
+    start = time.process_time()
+    for step in range(len(audio[0])):
+        batch = [(model, stream[step], _Result()) for model, stream in zip(models, audio)]
+        batcher.infer(batch)
+    elapsed = time.process_time() - start
+    for model in models:
+        model.close()
+    return elapsed
+
+
+def run() -> dict[str, float]:
+    session = onnx_model.new_inference_session(True)
+    batcher = BatchedInference(session, SAMPLE_RATE)
+    steps = int(AUDIO_SECONDS * SAMPLE_RATE / batcher.window_size)
+
+    results = {}
+    for count in SESSIONS:
+        audio = [windows(steps, batcher.window_size, seed) for seed in range(count)]
+        for name, fn in (("unbatched", lambda: unbatched(session, audio)), ("batched", lambda: batched(batcher, audio))):
+            cpu = min(fn() for _ in range(3))
+            results[f"{name}.{count}"] = count * AUDIO_SECONDS / cpu
+    return results
+
+
+if __name__ == "__main__":
+    results = run()
+    print(f"{'sessions':>8} {'unbatched':>14} {'batched':>14}   (real-time sessions per core)")
+    for count in SESSIONS:
+        before, after = results[f"unbatched.{count}"], results[f"batched.{count}"]
+        print(f"{count:>8} {before:>14.0f} {after:>14.0f}   x{after / before:.1f}")
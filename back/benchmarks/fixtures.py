@@ -0,0 +1,109 @@
+"""Canned inputs shared by the benchmarks: LLM outputs and sample CVs."""
+import json
+
+JOB_DESCRIPTION = (
+    "We are hiring a senior backend engineer to own our Python/Django services. "
+    "You will design APIs, tune PostgreSQL, run async workers and mentor two juniors. "
+) * 6
+
+AGENT_PROMPT = "You are a demanding but fair technical interviewer. " * 60
+
+QUESTIONS = [
+    f"Describe a time you had to debug a production incident involving subsystem {n}?"
+    for n in range(1, 16)
+]
+
+ANSWER = (
+    "I started from the metrics, narrowed it to one endpoint, reproduced it locally "
+    "and found an N+1 query that only showed up with large accounts. "
+) * 4
+
+FEEDBACK = "Good structure and a concrete example; quantify the impact next time."
+
+
+def questions_output(count: int = 15) -> str:
+    """Question-generation reply with the chatter models add despite the prompt."""
+    lines = ["Sure! Here are the questions:", ""]
+    lines += [f"{n}. {text}" for n, text in enumerate(QUESTIONS[:count], start=1)]
+    lines += ["", "Good luck with the interview!"]
+    return "\n".join(lines)
+
+
+def evaluation_output(qa_ids: list[int], fenced: bool = True, chatter: bool = False) -> str:
+    data = {
+        "evaluations": [{"qa_id": qa_id, "score": 7, "feedback": FEEDBACK} for qa_id in qa_ids],
+        "overall_score": 7,
+        "overall_feedback": FEEDBACK * 3,
+    }
+    raw = json.dumps(data, indent=2)
+    if fenced:
+        raw = f"```json\n{raw}\n```"
+    if chatter:
+        raw = f"Here is the evaluation you asked for:\n{raw}\nLet me know if you need more."
+    return raw
+
+
+CV_LINES = [
+    "Jane Doe - Senior Software Engineer",
+    "jane.doe@example.invalid | Berlin | github.com/janedoe",
+    "",
+    "EXPERIENCE",
+    "Acme Corp, Staff Engineer, 2019 - present",
+    "- Led migration of the billing platform from a monolith to services.",
+    "- Cut p95 API latency from 900 ms to 180 ms by reworking the ORM layer.",
+    "- Mentored six engineers; ran the backend guild.",
+    "Globex, Backend Engineer, 2015 - 2019",
+    "- Built the event ingestion pipeline processing 40k events per second.",
+    "- Introduced contract tests between twelve internal services.",
+    "",
+    "SKILLS",
+    "Python, Django, PostgreSQL, Redis, Kafka, Kubernetes, Terraform",
+    "",
+    "EDUCATION",
+    "MSc Computer Science, Technical University, 2015",
+]
+
+
+def cv_text(pages: int = 1) -> str:
+    return "\n".join(CV_LINES * pages)
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def cv_pdf(pages: int = 1) -> bytes:
+    """A minimal text-only PDF (Helvetica, one CV per page) built by hand."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # page tree, filled in once the page object numbers are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_ids = []
+    for _ in range(pages):
+        ops = ["BT", "/F1 11 Tf", "14 TL", "50 790 Td"]
+        ops += [f"({_pdf_escape(line)}) '" for line in CV_LINES]
+        ops.append("ET")
+        stream = "\n".join(ops).encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        page_ids.append(len(objects))
+
+    kids = " ".join(f"{n} 0 R" for n in page_ids).encode()
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, pages)
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
@@ -0,0 +1,25 @@
+"""Offline settings for the benchmarks: in-memory SQLite, no external services."""
+import os
+
+for _name in (
+    "CLOUDINARY_CLOUD_NAME", "CLOUDINARY_API_KEY", "CLOUDINARY_API_SECRET",
+    "LIVEKIT_URL", "LIVEKIT_API_KEY", "LIVEKIT_API_SECRET",
+    "OPEN_ROUTER_API_KEY", "OPEN_ROUTER_LLM_MODEL", "OPEN_ROUTER_ENDPOINT",
+    "SITE_URL", "SITE_NAME", "GEMINI_API_KEY",
+):
+    os.environ.setdefault(_name, "benchmark")
+
+from core.settings.base import *  # noqa: E402,F401,F403
+
+DEBUG = False
+SECRET_KEY = "benchmark"
+ALLOWED_HOSTS = ["*"]
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+    }
+}
+
+LOGGING = {"version": 1, "disable_existing_loggers": False}
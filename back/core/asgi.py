@@ -1,3 +1,7 @@
+# Production entry point, e.g.:
+#   uvicorn core.asgi:application --workers 4
+# The I/O-bound views (start, complete, CV analysis, LiveKit token) are async
+# and only hold a thread for their short database work.
 import os
 from django.core.asgi import get_asgi_application
 
@@ -0,0 +1,70 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+
+@dataclass
+class RequestMetrics:
+    """Costs accumulated while serving one request (times in seconds)."""
+
+    db_count: int = 0
+    db_time: float = 0.0
+    llm_count: int = 0
+    llm_time: float = 0.0
+    serialize_time: float = 0.0
+
+
+# Set by RequestProfilingMiddleware for the duration of a request. asgiref
+# copies the context into sync_to_async threads, so DB work done there is
+# attributed to the right request.
+_current: ContextVar[RequestMetrics | None] = ContextVar("request_metrics", default=None)
+
+
+def begin() -> tuple[RequestMetrics, object]:
+    metrics = RequestMetrics()
+    return metrics, _current.set(metrics)
+
+
+def end(token) -> None:
+    _current.reset(token)
+
+
+def current() -> RequestMetrics | None:
+    return _current.get()
+
+
+def db_execute_wrapper(execute, sql, params, many, context):
+    """connection.execute_wrappers hook; a no-op outside a profiled request."""
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.db_count += 1
+        metrics.db_time += time.perf_counter() - started
+
+
+@contextmanager
+def track_llm():
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics = _current.get()
+        if metrics is not None:
+            metrics.llm_count += 1
+            metrics.llm_time += time.perf_counter() - started
+
+
+@contextmanager
+def track_serialize():
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics = _current.get()
+        if metrics is not None:
+            metrics.serialize_time += time.perf_counter() - started
@@ -0,0 +1,163 @@
+import json
+import logging
+import random
+import re
+import time
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db.backends.signals import connection_created
+
+from . import instrumentation, throttling
+from .profiling import StackSampler
+
+logger = logging.getLogger("request.metrics")
+
+
+def _install_db_wrapper(sender, connection, **kwargs):
+    # Fires on every (re)connect of the same wrapper object, hence the check.
+    if instrumentation.db_execute_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(instrumentation.db_execute_wrapper)
+
+
+connection_created.connect(_install_db_wrapper)
+
+
+class RequestProfilingMiddleware:
+    """
+    Records wall time, DB, LLM and serialization cost for every request,
+    logs them as one JSON line and returns them in a Server-Timing header.
+
+    A fraction of requests (REQUEST_PROFILING["SAMPLE_RATE"]) and every
+    request running longer than SLOW_REQUEST_MS are also stack-sampled; the
+    collapsed stacks are written to PROFILE_DIR (flamegraph.pl / speedscope
+    format). For async views the sampled thread is the event loop's, so
+    stacks may include other requests served concurrently.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+        config = settings.REQUEST_PROFILING
+        self.sample_rate = config["SAMPLE_RATE"]
+        slow_ms = config["SLOW_REQUEST_MS"]
+        self.slow_after = slow_ms / 1000 if slow_ms else None
+        self.profile_dir = Path(config["PROFILE_DIR"])
+        self.max_profiles = config["MAX_PROFILES"]
+        self.sampler = None
+        if self.sample_rate > 0 or self.slow_after is not None:
+            self.sampler = StackSampler(config["INTERVAL_MS"] / 1000, self.slow_after)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        metrics, token = instrumentation.begin()
+        watch = self._watch()
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            elapsed = time.perf_counter() - started
+            stacks = self.sampler.unwatch(watch) if watch else None
+            instrumentation.end(token)
+
+        if stacks:
+            self._write_profile(request, elapsed, stacks)
+        return self._finish(request, response, metrics, elapsed)
+
+    async def __acall__(self, request):
+        metrics, token = instrumentation.begin()
+        watch = self._watch()
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            elapsed = time.perf_counter() - started
+            stacks = self.sampler.unwatch(watch) if watch else None
+            instrumentation.end(token)
+
+        if stacks:
+            await sync_to_async(self._write_profile, thread_sensitive=False)(request, elapsed, stacks)
+        return self._finish(request, response, metrics, elapsed)
+
+    def _watch(self):
+        if self.sampler is None:
+            return None
+        return self.sampler.watch(sampled=random.random() < self.sample_rate)
+
+    def _finish(self, request, response, metrics, elapsed):
+        timings = {
+            "db": (metrics.db_time, f"{metrics.db_count} queries"),
+            "llm": (metrics.llm_time, f"{metrics.llm_count} calls"),
+            "serialize": (metrics.serialize_time, None),
+            "total": (elapsed, None),
+        }
+        response["Server-Timing"] = ", ".join(
+            f'{name};dur={seconds * 1000:.1f}' + (f';desc="{desc}"' if desc else "")
+            for name, (seconds, desc) in timings.items()
+        )
+
+        logger.info(json.dumps({
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "duration_ms": round(elapsed * 1000, 1),
+            "db_queries": metrics.db_count,
+            "db_ms": round(metrics.db_time * 1000, 1),
+            "llm_calls": metrics.llm_count,
+            "llm_ms": round(metrics.llm_time * 1000, 1),
+            "serialize_ms": round(metrics.serialize_time * 1000, 1),
+        }))
+        return response
+
+    def _write_profile(self, request, elapsed, stacks):
+        slug = re.sub(r"[^A-Za-z0-9]+", "-", request.path).strip("-") or "root"
+        name = f"{time.strftime('%Y%m%dT%H%M%S')}-{request.method}-{slug}-{elapsed * 1000:.0f}ms.folded"
+        try:
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.profile_dir / name, "w") as fh:
+                for stack, count in stacks.most_common():
+                    fh.write(f"{stack} {count}\n")
+            # Names start with a timestamp, so sorting puts the oldest first.
+            for old in sorted(self.profile_dir.glob("*.folded"))[:-self.max_profiles]:
+                old.unlink(missing_ok=True)
+        except OSError:
+            logger.exception("Could not write request profile %s.", name)
+
+
+class AdmissionMiddleware:
+    """
+    Releases the concurrency slots taken by core.throttling.ConcurrencyThrottle
+    once the view has produced its response (or failed).
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        try:
+            return self.get_response(request)
+        finally:
+            throttling.release(request.__dict__.pop("admission_slots", []))
+
+    async def __acall__(self, request):
+        try:
+            return await self.get_response(request)
+        finally:
+            await throttling.arelease(request.__dict__.pop("admission_slots", []))
@@ -0,0 +1,76 @@
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Watch:
+    thread_id: int
+    started: float
+    sampled: bool
+    stacks: Counter = field(default_factory=Counter)
+
+
+def _collapse(frame) -> str:
+    """Render a frame chain in collapsed-stack format (root first, ';'-separated)."""
+    parts = []
+    while frame is not None:
+        code = frame.f_code
+        parts.append(f"{code.co_name} ({code.co_filename}:{frame.f_lineno})")
+        frame = frame.f_back
+    return ";".join(reversed(parts))
+
+
+class StackSampler:
+    """
+    Statistical profiler shared by all requests of a process.
+
+    Requests register the thread serving them. A single daemon thread wakes
+    every `interval` seconds and records the stack of each registered thread
+    that is either sampled or has been running longer than `slow_after`.
+    Requests that are neither cost one dict insert and delete. While no
+    request is registered the thread sleeps until the next one is.
+    """
+
+    def __init__(self, interval: float, slow_after: float | None):
+        self.interval = interval
+        self.slow_after = slow_after
+        self._watches: dict[int, Watch] = {}
+        self._lock = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def watch(self, sampled: bool) -> Watch:
+        watch = Watch(thread_id=threading.get_ident(), started=time.monotonic(), sampled=sampled)
+        with self._lock:
+            self._watches[id(watch)] = watch
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+                self._thread.start()
+            self._lock.notify()
+        return watch
+
+    def unwatch(self, watch: Watch) -> Counter:
+        with self._lock:
+            self._watches.pop(id(watch), None)
+        return watch.stacks
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                self._lock.wait_for(lambda: self._watches)
+            time.sleep(self.interval)
+            now = time.monotonic()
+            with self._lock:
+                targets = [
+                    w for w in self._watches.values()
+                    if w.sampled or (self.slow_after is not None and now - w.started >= self.slow_after)
+                ]
+            if not targets:
+                continue
+            frames = sys._current_frames()
+            for watch in targets:
+                frame = frames.get(watch.thread_id)
+                if frame is not None:
+                    watch.stacks[_collapse(frame)] += 1
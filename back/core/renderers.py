@@ -0,0 +1,51 @@
+from decimal import Decimal
+
+import orjson
+from django.utils.functional import Promise
+from rest_framework.renderers import BaseRenderer
+
+from .instrumentation import track_serialize
+
+
+def _default(obj):
+    # Lazy translation strings show up in validation error messages.
+    if isinstance(obj, Promise):
+        return str(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(data) -> bytes:
+    return orjson.dumps(data, default=_default)
+
+
+class ORJSONRenderer(BaseRenderer):
+    """Compact UTF-8 JSON via orjson; a drop-in for DRF's JSONRenderer."""
+
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        with track_serialize():
+            return dumps(data)
+
+
+class EventStreamRenderer(BaseRenderer):
+    """
+    Lets event-stream views pass content negotiation. The stream itself is
+    a StreamingHttpResponse; anything rendered here is an error response,
+    sent as a single "error" event.
+    """
+
+    media_type = "text/event-stream"
+    format = "event-stream"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return b"event: error\ndata: " + dumps(data) + b"\n\n"
@@ -28,6 +28,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "core.middleware.RequestProfilingMiddleware",
+    "core.middleware.AdmissionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -54,6 +56,7 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "core.wsgi.application"
+ASGI_APPLICATION = "core.asgi.application"
 ROOT_URLCONF = "core.urls"
 AUTH_USER_MODEL = "user.CustomUser"
 
@@ -95,14 +98,109 @@ LOGGING = {
 }
 
 
+# Cache
+# Local memory by default; set REDIS_URL to share the cache across worker processes.
+REDIS_URL = config("REDIS_URL", default="")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+# Whether cache writes (invalidations included) reach every worker process.
+CACHE_SHARED = bool(REDIS_URL)
+
+
+# Token -> user cache used by CachedTokenAuthentication. Invalidation only
+# reaches other workers through a shared cache; without one, entries live
+# just long enough to absorb a burst of requests.
+AUTH_TOKEN_CACHE = "default"
+AUTH_TOKEN_CACHE_TTL = 300 if CACHE_SHARED else 5
+
+
+# Per-request cost logging (always on) and stack sampling (off by default).
+# SAMPLE_RATE is the fraction of requests profiled; requests slower than
+# SLOW_REQUEST_MS are profiled regardless (0 disables). Profiles go to
+# PROFILE_DIR as .folded files, keeping the newest MAX_PROFILES.
+REQUEST_PROFILING = {
+    "SAMPLE_RATE": config("PROFILE_SAMPLE_RATE", default=0.0, cast=float),
+    "SLOW_REQUEST_MS": config("PROFILE_SLOW_REQUEST_MS", default=0, cast=int),
+    "INTERVAL_MS": config("PROFILE_INTERVAL_MS", default=5, cast=int),
+    "PROFILE_DIR": config("PROFILE_DIR", default=str(BASE_DIR / "profiles")),
+    "MAX_PROFILES": config("PROFILE_MAX_FILES", default=200, cast=int),
+}
+
+
+# Per-agent score distributions behind the percentile endpoint
+# (src/interview/cohorts.py).
+SCORE_COHORTS = {
+    "SNAPSHOT_PATH": config("SCORE_COHORTS_SNAPSHOT", default=str(BASE_DIR / "cache" / "score_cohorts.npz")),
+    "REFRESH_INTERVAL": 300,
+    "SNAPSHOT_MAX_AGE": 24 * 3600,
+}
+
+
+# Admission control for LLM-heavy endpoints (core/throttling.py). Concurrency
+# limits count requests in flight across all workers through the cache (use
+# Redis with more than one process); over the global limit a request is
+# refused with 503 rather than queued. RETRY_AFTER is the Retry-After hint.
+# In-flight counters expire after SLOT_TTL without new requests, which frees
+# slots leaked by a killed worker once the scope goes quiet.
+ADMISSION = {
+    "SCOPES": {
+        "interview_start": {
+            "USER_CONCURRENCY": 1,
+            "GLOBAL_CONCURRENCY": config("ADMISSION_START_CONCURRENCY", default=32, cast=int),
+            "RETRY_AFTER": 15,
+        },
+        "interview_complete": {
+            "USER_CONCURRENCY": 1,
+            "GLOBAL_CONCURRENCY": config("ADMISSION_COMPLETE_CONCURRENCY", default=32, cast=int),
+            "RETRY_AFTER": 20,
+        },
+        "cv_analysis": {
+            "USER_CONCURRENCY": 1,
+            "GLOBAL_CONCURRENCY": config("ADMISSION_CV_CONCURRENCY", default=8, cast=int),
+            "RETRY_AFTER": 30,
+        },
+    },
+    "SLOT_TTL": 600,
+}
+
+
 # REST Framework
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.TokenAuthentication",
+        "src.user.authentication.CachedTokenAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
-    ]
+    ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "core.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "core.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+    # Per user ("<scope>") and for everyone ("<scope>_global"); see ADMISSION.
+    "DEFAULT_THROTTLE_RATES": {
+        "interview_start": "20/hour",
+        "interview_start_global": "600/minute",
+        "interview_complete": "20/hour",
+        "interview_complete_global": "600/minute",
+        "cv_analysis": "10/hour",
+        "cv_analysis_global": "60/minute",
+    },
 }
 
 # Cloudinary 
@@ -124,12 +222,25 @@ STATICFILES_STORAGE = "django.contrib.staticfiles.storage.StaticFilesStorage"
 LIVEKIT_URL = config("LIVEKIT_URL")
 LIVEKIT_API_KEY = config("LIVEKIT_API_KEY")
 LIVEKIT_API_SECRET = config("LIVEKIT_API_SECRET")
+# Set (here and for the agent worker) to dispatch the agent explicitly at
+# interview start instead of LiveKit's automatic dispatch to every new room.
+LIVEKIT_AGENT_NAME = config("LIVEKIT_AGENT_NAME", default="")
 
 # OpenRouter API (LLM)
 OPEN_ROUTER_API_KEY = config("OPEN_ROUTER_API_KEY")
 OPEN_ROUTER_LLM_MODEL = config("OPEN_ROUTER_LLM_MODEL")
 OPEN_ROUTER_ENDPOINT = config("OPEN_ROUTER_ENDPOINT")
 
+# Record/replay of LLM calls (src/agent/cassette.py). MODE: "" (off),
+# "record" (call OpenRouter and store every response) or "replay" (serve
+# stored responses only, no network); REPLAY_LATENCY also replays the
+# recorded response times.
+LLM_CASSETTE = {
+    "MODE": config("LLM_CASSETTE_MODE", default=""),
+    "PATH": config("LLM_CASSETTE_PATH", default=str(BASE_DIR / "cassettes" / "llm.sqlite3")),
+    "REPLAY_LATENCY": config("LLM_CASSETTE_LATENCY", default=False, cast=bool),
+}
+
 # Site
 SITE_URL = config("SITE_URL")
 SITE_NAME = config("SITE_NAME")
@@ -147,4 +258,5 @@ from corsheaders.defaults import default_headers
 
 CORS_ALLOW_HEADERS = list(default_headers) + [
     "Authorization",
+    "Idempotency-Key",
 ]
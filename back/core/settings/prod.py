@@ -4,10 +4,27 @@ DEBUG = True
 SECRET_KEY = None
 ALLOWED_HOSTS = []
 
+# PostgreSQL through psycopg's connection pool. Connections are kept open
+# and shared between requests, including async views under ASGI, where
+# CONN_MAX_AGE persistence doesn't apply. The pool replaces CONN_MAX_AGE,
+# which must stay 0.
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": config("DB_NAME"),
+        "USER": config("DB_USER"),
+        "PASSWORD": config("DB_PASSWORD"),
+        "HOST": config("DB_HOST", default="localhost"),
+        "PORT": config("DB_PORT", default="5432"),
+        "CONN_MAX_AGE": 0,
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            "pool": {
+                "min_size": config("DB_POOL_MIN_SIZE", default=2, cast=int),
+                "max_size": config("DB_POOL_MAX_SIZE", default=20, cast=int),
+                "timeout": config("DB_POOL_TIMEOUT", default=10, cast=int),
+            },
+        },
     }
 }
 
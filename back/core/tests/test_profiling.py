@@ -0,0 +1,55 @@
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from unittest import mock
+
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from core.middleware import RequestProfilingMiddleware
+from core.profiling import StackSampler
+
+
+class StackSamplerTest(SimpleTestCase):
+    def test_idle_sampler_parks(self):
+        real_sleep = time.sleep
+        wakeups = []
+
+        def sleep(seconds):
+            wakeups.append(seconds)
+            real_sleep(seconds)
+
+        with mock.patch("core.profiling.time.sleep", sleep):
+            sampler = StackSampler(interval=0.001, slow_after=None)
+            sampler.unwatch(sampler.watch(sampled=False))
+            real_sleep(0.02)
+            settled = len(wakeups)
+            real_sleep(0.05)
+            # Blocked until the next watch() instead of waking every interval.
+            self.assertEqual(len(wakeups), settled)
+
+    def test_sampled_request_collects_stacks(self):
+        sampler = StackSampler(interval=0.001, slow_after=None)
+        watch = sampler.watch(sampled=True)
+        time.sleep(0.05)
+        self.assertTrue(sampler.unwatch(watch))
+
+
+class ProfileRetentionTest(SimpleTestCase):
+    def test_only_newest_profiles_are_kept(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            profile_dir = Path(tmp)
+            for n in range(5):
+                (profile_dir / f"20260101T00000{n}-GET-old-1ms.folded").write_text("")
+            config = {
+                "SAMPLE_RATE": 0.0, "SLOW_REQUEST_MS": 0, "INTERVAL_MS": 5,
+                "PROFILE_DIR": tmp, "MAX_PROFILES": 3,
+            }
+            with override_settings(REQUEST_PROFILING=config):
+                middleware = RequestProfilingMiddleware(lambda request: HttpResponse())
+            middleware._write_profile(RequestFactory().get("/new/"), 0.5, Counter({"main": 1}))
+
+            names = sorted(path.name for path in profile_dir.iterdir())
+            self.assertEqual(len(names), 3)
+            self.assertTrue(names[-1].endswith("GET-new-500ms.folded"))
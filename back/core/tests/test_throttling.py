@@ -0,0 +1,74 @@
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework.views import APIView
+
+from core import throttling
+
+ADMISSION = {
+    "SCOPES": {"test": {"USER_CONCURRENCY": 1, "GLOBAL_CONCURRENCY": 2, "RETRY_AFTER": 7}},
+    "SLOT_TTL": 60,
+}
+INFLIGHT = "admission:inflight:test"
+USER = SimpleNamespace(pk=1, is_authenticated=True)
+
+
+class AdmittedView(APIView):
+    throttle_classes = throttling.ADMISSION_THROTTLES
+    throttle_scope = "test"
+
+    def post(self, request):
+        return Response({})
+
+
+@override_settings(ADMISSION=ADMISSION)
+@mock.patch.object(throttling.WindowRateThrottle, "THROTTLE_RATES", {"test": "2/hour", "test_global": "100/hour"})
+class AdmissionThrottleTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def post(self):
+        request = APIRequestFactory().post("/admitted/")
+        force_authenticate(request, USER)
+        response = AdmittedView.as_view()(request)
+        # What AdmissionMiddleware does once the response is out.
+        throttling.release(request.__dict__.pop("admission_slots", []))
+        return response
+
+    def test_rate_limit(self):
+        self.assertEqual([self.post().status_code for _ in range(3)], [200, 200, 429])
+        self.assertLessEqual(int(self.post()["Retry-After"]), 3600)
+
+    def test_user_concurrency_refusal_keeps_rate_quota(self):
+        cache.set(f"{INFLIGHT}:{USER.pk}", 1)  # another request of this user in flight
+
+        response = self.post()
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], "7")
+
+        cache.delete(f"{INFLIGHT}:{USER.pk}")
+        self.assertEqual([self.post().status_code for _ in range(2)], [200, 200])
+
+    def test_global_concurrency_refusal_keeps_rate_quota(self):
+        cache.set(INFLIGHT, 2)
+
+        response = self.post()
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], "7")
+
+        cache.delete(INFLIGHT)
+        self.assertEqual([self.post().status_code for _ in range(2)], [200, 200])
+
+    def test_taking_a_slot_refreshes_its_ttl(self):
+        cache.set(INFLIGHT, 1, 1)
+        request = APIRequestFactory().post("/admitted/")
+        force_authenticate(request, USER)
+        AdmittedView.as_view()(request)  # slot kept, as while the view is still running
+
+        with mock.patch("django.core.cache.backends.locmem.time.time", return_value=time.time() + 30):
+            self.assertEqual(cache.get(INFLIGHT), 2)
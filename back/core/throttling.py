@@ -0,0 +1,163 @@
+import math
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.throttling import BaseThrottle, SimpleRateThrottle
+
+# Admission control for the LLM-heavy endpoints. Views opt in with a
+# `throttle_scope` and `throttle_classes = ADMISSION_THROTTLES`.
+#
+# All counters live in the default cache, so limits hold across worker
+# processes once REDIS_URL is set (LocMem only counts per process). Rates
+# come from REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"] as "<scope>" (per
+# user) and "<scope>_global"; concurrency limits from settings.ADMISSION.
+#
+# DRF asks every throttle even after one has refused, so a refused request
+# marks itself (`admission_refused`) and the rate throttles after it leave
+# their windows alone: a 429/503 doesn't use up the caller's quota.
+
+
+class ServiceOverloaded(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "The service is busy. Please retry shortly."
+    default_code = "overloaded"
+
+    def __init__(self, wait: int):
+        super().__init__()
+        # Picked up by DRF's exception handler as the Retry-After header.
+        self.wait = wait
+
+
+def _incr(key: str, timeout: int) -> int:
+    """Atomically increment a shared counter, creating it (with `timeout`) if missing."""
+    cache.add(key, 0, timeout)
+    try:
+        return cache.incr(key)
+    except ValueError:  # expired between add() and incr()
+        cache.add(key, 1, timeout)
+        return 1
+
+
+def _take(key: str, ttl: int) -> int:
+    """Take a concurrency slot, keeping the in-flight counter alive while requests keep coming."""
+    taken = _incr(key, ttl)
+    cache.touch(key, ttl)
+    return taken
+
+
+def _refuse(request) -> bool:
+    request._request.admission_refused = True
+    return False
+
+
+def _refused(request) -> bool:
+    return getattr(request._request, "admission_refused", False)
+
+
+def release(slots: list[str]) -> None:
+    """Give back concurrency slots taken by ConcurrencyThrottle (see AdmissionMiddleware)."""
+    for key in slots:
+        try:
+            if cache.decr(key) < 0:
+                cache.set(key, 0, settings.ADMISSION["SLOT_TTL"])
+        except ValueError:  # counter expired; nothing to give back
+            pass
+
+
+async def arelease(slots: list[str]) -> None:
+    for key in slots:
+        try:
+            if await cache.adecr(key) < 0:
+                await cache.aset(key, 0, settings.ADMISSION["SLOT_TTL"])
+        except ValueError:
+            pass
+
+
+class WindowRateThrottle(SimpleRateThrottle):
+    """
+    Per-user rate limit for the view's `throttle_scope`, counted in fixed
+    windows with an atomic cache increment. SimpleRateThrottle keeps a
+    timestamp list per user, which concurrent workers overwrite.
+    """
+    scope_suffix = ""
+
+    def __init__(self):
+        # The scope comes from the view, so rate lookup waits for allow_request().
+        pass
+
+    def allow_request(self, request, view):
+        scope = getattr(view, "throttle_scope", None)
+        if not scope:
+            return True
+        self.scope = scope + self.scope_suffix
+        if self.scope not in self.THROTTLE_RATES:
+            return True
+        self.num_requests, self.duration = self.parse_rate(self.get_rate())
+
+        key = self.get_cache_key(request, view)
+        if key is None or _refused(request):
+            return True
+        now = self.timer()
+        window = int(now // self.duration)
+        self.remaining = self.duration - now % self.duration
+        if _incr(f"{key}:{window}", self.duration) > self.num_requests:
+            return _refuse(request)
+        return True
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            ident = request.user.pk
+        else:
+            ident = self.get_ident(request)
+        return f"admission:rate:{self.scope}:{ident}"
+
+    def wait(self):
+        return math.ceil(self.remaining)
+
+
+class GlobalRateThrottle(WindowRateThrottle):
+    """Rate limit for the scope across all users ("<scope>_global")."""
+    scope_suffix = "_global"
+
+    def get_cache_key(self, request, view):
+        return f"admission:rate:{self.scope}"
+
+
+class ConcurrencyThrottle(BaseThrottle):
+    """
+    Caps requests in flight for the view's `throttle_scope`, per user
+    (429) and overall (503, without queueing: work accepted beyond the
+    global limit would only time out). Slots are taken here and released
+    by AdmissionMiddleware once the response is produced.
+    """
+
+    def allow_request(self, request, view):
+        scope = getattr(view, "throttle_scope", None)
+        limits = settings.ADMISSION["SCOPES"].get(scope)
+        if not limits:
+            return True
+        self.retry_after = limits["RETRY_AFTER"]
+        ttl = settings.ADMISSION["SLOT_TTL"]
+        slots = request._request.__dict__.setdefault("admission_slots", [])
+
+        global_key = f"admission:inflight:{scope}"
+        slots.append(global_key)
+        if _take(global_key, ttl) > limits["GLOBAL_CONCURRENCY"]:
+            raise ServiceOverloaded(self.retry_after)
+
+        if request.user and request.user.is_authenticated:
+            user_key = f"{global_key}:{request.user.pk}"
+            slots.append(user_key)
+            if _take(user_key, ttl) > limits["USER_CONCURRENCY"]:
+                return _refuse(request)
+        return True
+
+    def wait(self):
+        return self.retry_after
+
+
+# Concurrency first, so only admitted requests count against the rate windows;
+# slots taken by a request the rate limit refuses go back with its response.
+ADMISSION_THROTTLES = [ConcurrencyThrottle, WindowRateThrottle, GlobalRateThrottle]
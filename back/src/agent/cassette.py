@@ -0,0 +1,122 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Record/replay store for LLM calls (settings.LLM_CASSETTE). In "record"
+# mode every successful OpenRouter response is saved under the hash of its
+# request payload; in "replay" mode responses come from the store only and
+# a request that was never recorded fails like a network error would.
+#
+# One SQLite file, one row per distinct request, zlib-compressed JSON body.
+
+RECORD = "record"
+REPLAY = "replay"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_calls (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    body BLOB NOT NULL,
+    latency REAL NOT NULL,
+    recorded_at REAL NOT NULL
+)
+"""
+
+
+@dataclass
+class Recording:
+    """A completion (`content`) or a stream (`chunks`, each with its offset in seconds)."""
+    latency: float
+    content: str | None = None
+    chunks: list[str] = field(default_factory=list)
+    offsets: list[float] = field(default_factory=list)
+
+
+_local = threading.local()
+
+
+def mode() -> str:
+    return settings.LLM_CASSETTE["MODE"]
+
+
+def replay_latency() -> bool:
+    return settings.LLM_CASSETTE["REPLAY_LATENCY"]
+
+
+def _connection() -> sqlite3.Connection:
+    # One connection per thread; sync_to_async and the ASGI loop use different ones.
+    path = settings.LLM_CASSETTE["PATH"]
+    connection = getattr(_local, "connection", None)
+    if connection is None or _local.path != path:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(path, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(_SCHEMA)
+        _local.connection, _local.path = connection, path
+    return connection
+
+
+def request_key(payload: dict) -> str:
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def lookup(payload: dict) -> Recording | None:
+    """The recorded response when replaying, None otherwise. Replay misses raise RuntimeError."""
+    if mode() != REPLAY:
+        return None
+    row = _connection().execute(
+        "SELECT body, latency FROM llm_calls WHERE key = ?", (request_key(payload),)
+    ).fetchone()
+    if row is None:
+        logger.error("No recorded LLM response for this request (model %s).", payload.get("model"))
+        raise RuntimeError("LLM request not found in the cassette.")
+    body = json.loads(zlib.decompress(row[0]))
+    return Recording(latency=row[1], **body)
+
+
+def record(payload: dict, recording: Recording) -> None:
+    if mode() != RECORD:
+        return
+    body = {"content": recording.content} if recording.content is not None else {
+        "chunks": recording.chunks,
+        "offsets": [round(offset, 4) for offset in recording.offsets],
+    }
+    try:
+        _connection().execute(
+            "INSERT OR REPLACE INTO llm_calls (key, model, body, latency, recorded_at) VALUES (?, ?, ?, ?, ?)",
+            (
+                request_key(payload),
+                payload.get("model", ""),
+                zlib.compress(json.dumps(body, separators=(",", ":")).encode()),
+                recording.latency,
+                time.time(),
+            ),
+        )
+    except sqlite3.Error:
+        # Recording is best effort; the live response is still returned.
+        logger.exception("Could not record LLM response.")
+
+
+async def alookup(payload: dict) -> Recording | None:
+    """lookup() for the async client, with the SQLite read off the event loop."""
+    if mode() != REPLAY:
+        return None
+    return await sync_to_async(lookup, thread_sensitive=False)(payload)
+
+
+async def arecord(payload: dict, recording: Recording) -> None:
+    if mode() != RECORD:
+        return
+    await sync_to_async(record, thread_sensitive=False)(payload, recording)
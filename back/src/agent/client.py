@@ -1,10 +1,59 @@
+import asyncio
+import contextlib
 import httpx
+import json
 import logging
+import threading
+import time
+import weakref
 from django.conf import settings
 
+from core.instrumentation import track_llm
+from . import cassette
+
 logger = logging.getLogger(__name__)
 
-def call_llm(messages: list[dict], model: str = None) -> str:
+LLM_TIMEOUT = 60
+
+# Shared clients keep TLS connections to OpenRouter alive between calls.
+# httpx.AsyncClient is bound to the event loop it was first used on, so
+# there is one per long-lived loop (in practice: one per ASGI worker
+# process, whose server loop runs in the main thread). Under WSGI each async
+# view runs on a fresh loop in a worker thread (async_to_sync); a client
+# cached there would never be closed, so those calls get their own.
+_sync_client: httpx.Client | None = None
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def _get_client() -> httpx.Client:
+    global _sync_client
+    if _sync_client is None:
+        _sync_client = httpx.Client(timeout=LLM_TIMEOUT)
+    return _sync_client
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            timeout=LLM_TIMEOUT,
+            limits=httpx.Limits(max_connections=500, max_keepalive_connections=50),
+        )
+        _async_clients[loop] = client
+    return client
+
+
+@contextlib.asynccontextmanager
+async def _async_client():
+    if threading.current_thread() is threading.main_thread():
+        yield _get_async_client()
+        return
+    async with httpx.AsyncClient(timeout=LLM_TIMEOUT) as client:
+        yield client
+
+
+def _build_request(messages: list[dict], model: str = None) -> tuple[dict, dict]:
     api_key = settings.OPEN_ROUTER_API_KEY
     model = model or settings.OPEN_ROUTER_LLM_MODEL
 
@@ -19,22 +68,125 @@ def call_llm(messages: list[dict], model: str = None) -> str:
         "model": model,
         "messages": messages,
     }
+    return payload, headers
 
-    try:
-        with httpx.Client(timeout=60) as client:
-            response = client.post(settings.OPEN_ROUTER_ENDPOINT, json=payload, headers=headers)
-            response.raise_for_status()
-    except httpx.HTTPStatusError as exc:
+
+def _raise_for_error(exc: httpx.HTTPError):
+    if isinstance(exc, httpx.HTTPStatusError):
         logger.error("OpenRouter HTTP error %s: %s", exc.response.status_code, exc.response.text)
         raise RuntimeError(f"LLM request failed with status {exc.response.status_code}.") from exc
-    except httpx.RequestError as exc:
-        logger.error("OpenRouter request error: %s", exc)
-        raise RuntimeError("LLM request failed due to a network error.") from exc
+    logger.error("OpenRouter request error: %s", exc)
+    raise RuntimeError("LLM request failed due to a network error.") from exc
 
+
+def _extract_content(response: httpx.Response) -> str:
     data = response.json()
     try:
         return data["choices"][0]["message"]["content"]
     except (KeyError, IndexError) as exc:
         logger.error("Unexpected OpenRouter response structure: %s", data)
         raise RuntimeError("Unexpected response from LLM.") from exc
-    
\ No newline at end of file
+
+
+def call_llm(messages: list[dict], model: str = None) -> str:
+    payload, headers = _build_request(messages, model)
+
+    recording = cassette.lookup(payload)
+    if recording is not None:
+        with track_llm():
+            if cassette.replay_latency():
+                time.sleep(recording.latency)
+        return recording.content
+
+    started = time.perf_counter()
+    try:
+        with track_llm():
+            response = _get_client().post(settings.OPEN_ROUTER_ENDPOINT, json=payload, headers=headers)
+        response.raise_for_status()
+    except (httpx.HTTPStatusError, httpx.RequestError) as exc:
+        _raise_for_error(exc)
+
+    content = _extract_content(response)
+    cassette.record(payload, cassette.Recording(latency=time.perf_counter() - started, content=content))
+    return content
+
+
+async def acall_llm(messages: list[dict], model: str = None) -> str:
+    """Async call_llm: the wait for the LLM holds no thread."""
+    payload, headers = _build_request(messages, model)
+
+    recording = await cassette.alookup(payload)
+    if recording is not None:
+        with track_llm():
+            if cassette.replay_latency():
+                await asyncio.sleep(recording.latency)
+        return recording.content
+
+    started = time.perf_counter()
+    try:
+        with track_llm():
+            async with _async_client() as client:
+                response = await client.post(settings.OPEN_ROUTER_ENDPOINT, json=payload, headers=headers)
+        response.raise_for_status()
+    except (httpx.HTTPStatusError, httpx.RequestError) as exc:
+        _raise_for_error(exc)
+
+    content = _extract_content(response)
+    await cassette.arecord(payload, cassette.Recording(latency=time.perf_counter() - started, content=content))
+    return content
+
+
+async def astream_llm(messages: list[dict], model: str = None):
+    """
+    Async generator over the content deltas of a streamed completion
+    (OpenRouter's OpenAI-compatible SSE format).
+    """
+    payload, headers = _build_request(messages, model)
+    payload["stream"] = True
+
+    recording = await cassette.alookup(payload)
+    if recording is not None:
+        with track_llm():
+            elapsed = 0.0
+            for chunk, offset in zip(recording.chunks, recording.offsets):
+                if cassette.replay_latency() and offset > elapsed:
+                    await asyncio.sleep(offset - elapsed)
+                    elapsed = offset
+                yield chunk
+        return
+
+    started = time.perf_counter()
+    recording = cassette.Recording(latency=0.0)
+    try:
+        with track_llm():
+            async with _async_client() as client, client.stream(
+                "POST", settings.OPEN_ROUTER_ENDPOINT, json=payload, headers=headers,
+            ) as response:
+                if response.is_error:
+                    await response.aread()
+                response.raise_for_status()
+
+                async for line in response.aiter_lines():
+                    # Blank lines separate events; ':' lines are keep-alive comments.
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        recording.latency = time.perf_counter() - started
+                        await cassette.arecord(payload, recording)
+                        return
+                    try:
+                        chunk = json.loads(data)
+                    except json.JSONDecodeError:
+                        logger.warning("Skipping malformed stream chunk: %s", data)
+                        continue
+                    if "error" in chunk:
+                        logger.error("OpenRouter stream error: %s", chunk["error"])
+                        raise RuntimeError("LLM stream failed.")
+                    delta = (chunk.get("choices") or [{}])[0].get("delta", {}).get("content")
+                    if delta:
+                        recording.chunks.append(delta)
+                        recording.offsets.append(time.perf_counter() - started)
+                        yield delta
+    except (httpx.HTTPStatusError, httpx.RequestError) as exc:
+        _raise_for_error(exc)
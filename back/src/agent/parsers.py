@@ -5,15 +5,20 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-def parse_questions(raw_text: str) -> list[str]:
-    lines = raw_text.strip().splitlines()
-    questions = []
+_QUESTION_LINE_RE = re.compile(r"^\d+[.)]\s*(.+)")
+
 
+def _questions_from_lines(lines) -> list[str]:
+    questions = []
     for line in lines:
-        line = line.strip()
-        match = re.match(r"^\d+[.)]\s*(.+)", line)
+        match = _QUESTION_LINE_RE.match(line.strip())
         if match:
             questions.append(match.group(1).strip())
+    return questions
+
+
+def parse_questions(raw_text: str) -> list[str]:
+    questions = _questions_from_lines(raw_text.strip().splitlines())
 
     if not questions:
         logger.warning("Could not parse any questions from LLM output:\n%s", raw_text)
@@ -36,3 +41,84 @@ def parse_json_response(raw_text: str) -> dict:
 
     logger.error("Failed to parse JSON from LLM output:\n%s", raw_text)
     raise ValueError(f"Could not extract valid JSON from LLM response: {raw_text!r}")
+
+
+class QuestionStreamParser:
+    """
+    parse_questions for a streamed reply: each call to feed() returns the
+    questions whose line was completed by that text; close() flushes the
+    last line.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+
+    def feed(self, text: str) -> list[str]:
+        *lines, self.buffer = (self.buffer + text).split("\n")
+        return _questions_from_lines(lines)
+
+    def close(self) -> list[str]:
+        lines, self.buffer = [self.buffer], ""
+        return _questions_from_lines(lines)
+
+
+class EvaluationStreamParser:
+    """
+    Pulls completed objects out of the "evaluations" array of a JSON
+    evaluation while it is still being streamed. Feed text as it arrives;
+    each call returns the evaluations completed by that text. The full
+    reply should still go through parse_json_response at the end.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self.pos = 0            # scan position in buffer
+        self.in_array = False
+        self.done = False
+        self.depth = 0          # object nesting inside the array
+        self.in_string = False
+        self.escaped = False
+        self.start = None       # buffer index of the current object's "{"
+
+    def feed(self, text: str) -> list[dict]:
+        found = []
+        if self.done:
+            return found
+        self.buffer += text
+
+        if not self.in_array:
+            match = re.search(r'"evaluations"\s*:\s*\[', self.buffer)
+            if not match:
+                return found
+            self.in_array = True
+            self.pos = match.end()
+
+        buffer = self.buffer
+        while self.pos < len(buffer):
+            char = buffer[self.pos]
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char == "{":
+                if self.depth == 0:
+                    self.start = self.pos
+                self.depth += 1
+            elif char == "}":
+                self.depth -= 1
+                if self.depth == 0:
+                    try:
+                        found.append(json.loads(buffer[self.start:self.pos + 1]))
+                    except json.JSONDecodeError:
+                        logger.warning("Skipping unparseable streamed evaluation: %s", buffer[self.start:self.pos + 1])
+            elif char == "]" and self.depth == 0:
+                self.done = True
+                break
+            self.pos += 1
+
+        return found
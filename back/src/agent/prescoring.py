@@ -0,0 +1,102 @@
+import re
+from dataclasses import dataclass
+
+import numpy as np
+
+# Local answer statistics, computed for a whole interview at once:
+#
+# - words: answer length in words
+# - wpm: speaking rate, from the agent's first/last transcript marks (NaN if unknown)
+# - filler_rate: share of words that are fillers ("um", "like", "you know", ...)
+# - overlap: share of the question's content words that the answer reuses
+#
+# Empty and trivial answers get a final score from these alone and never
+# reach the LLM; every answer gets a provisional score right away.
+
+TRIVIAL_WORDS = 4
+# Below this, the transcript span is too short to derive a speaking rate.
+MIN_SPEAKING_MS = 1500
+# Comfortable conversational pace; outside it the provisional score drops.
+WPM_RANGE = (100.0, 190.0)
+
+_WORD_RE = re.compile(r"[a-z0-9']+")
+
+FILLERS = {"um", "uh", "erm", "er", "ah", "hmm", "like", "basically", "actually", "literally", "so", "well"}
+FILLER_PHRASES = {("you", "know"), ("i", "mean"), ("sort", "of"), ("kind", "of")}
+
+STOPWORDS = {
+    "a", "an", "the", "and", "or", "but", "if", "of", "to", "in", "on", "at", "for", "with", "by",
+    "from", "as", "is", "are", "was", "were", "be", "been", "do", "does", "did", "have", "has", "had",
+    "you", "your", "i", "me", "my", "we", "our", "it", "its", "this", "that", "these", "those",
+    "what", "which", "who", "how", "why", "when", "where", "can", "could", "would", "should", "will",
+    "about", "describe", "tell", "time", "give", "example", "there", "their", "they", "them",
+}
+
+EMPTY_FEEDBACK = "No answer was given to this question."
+TRIVIAL_FEEDBACK = "The answer was too short to assess; expand on it with specifics and an example."
+
+
+@dataclass
+class AnswerStats:
+    words: np.ndarray
+    wpm: np.ndarray
+    filler_rate: np.ndarray
+    overlap: np.ndarray
+
+
+def _tokens(text: str) -> list[str]:
+    return _WORD_RE.findall((text or "").lower())
+
+
+def _filler_count(tokens: list[str]) -> int:
+    single = sum(token in FILLERS for token in tokens)
+    phrases = sum(pair in FILLER_PHRASES for pair in zip(tokens, tokens[1:]))
+    return single + 2 * phrases
+
+
+def answer_stats(questions: list[str], answers: list[str], timings: list[dict | None]) -> AnswerStats:
+    answer_tokens = [_tokens(answer) for answer in answers]
+    words = np.array([len(tokens) for tokens in answer_tokens], dtype=np.float64)
+    fillers = np.array([_filler_count(tokens) for tokens in answer_tokens], dtype=np.float64)
+
+    content = [set(_tokens(question)) - STOPWORDS for question in questions]
+    shared = np.array([len(c & set(tokens)) for c, tokens in zip(content, answer_tokens)], dtype=np.float64)
+    asked = np.array([len(c) for c in content], dtype=np.float64)
+
+    first = np.array([(t or {}).get("first_transcript", np.nan) for t in timings], dtype=np.float64)
+    last = np.array([(t or {}).get("last_transcript", np.nan) for t in timings], dtype=np.float64)
+    speaking_ms = last - first
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        wpm = np.where(speaking_ms >= MIN_SPEAKING_MS, words / (speaking_ms / 60000), np.nan)
+        filler_rate = np.where(words > 0, fillers / words, 0.0)
+        overlap = np.where(asked > 0, shared / asked, 0.0)
+    return AnswerStats(words=words, wpm=wpm, filler_rate=filler_rate, overlap=overlap)
+
+
+def provisional_scores(stats: AnswerStats) -> np.ndarray:
+    """Rough 1-10 scores from the statistics alone, shown until the LLM's arrive."""
+    # Length carries most of the signal: ~60 substantive words reach the middle band.
+    substance = np.clip(np.log1p(stats.words * (1 - stats.filler_rate)) / np.log1p(150), 0, 1)
+    relevance = np.clip(stats.overlap * 2, 0, 1)
+    low, high = WPM_RANGE
+    pace = np.where(
+        np.isnan(stats.wpm),
+        1.0,
+        np.clip(1 - np.maximum(low - stats.wpm, stats.wpm - high).clip(min=0) / low, 0, 1),
+    )
+    raw = 1 + 6 * substance + 2 * relevance + 1 * pace - 4 * np.clip(stats.filler_rate, 0, 0.5)
+    scores = np.clip(np.rint(raw), 1, 10).astype(int)
+    # Same as final_evaluation() for the answers that never reach the LLM.
+    trivial = stats.words < TRIVIAL_WORDS
+    scores[trivial] = np.where(stats.words[trivial] == 0, 1, 2)
+    return scores
+
+
+def final_evaluation(words: float) -> tuple[int, str] | None:
+    """The local (score, feedback) for an empty or trivial answer; None if the LLM should judge it."""
+    if words == 0:
+        return 1, EMPTY_FEEDBACK
+    if words < TRIVIAL_WORDS:
+        return 2, TRIVIAL_FEEDBACK
+    return None
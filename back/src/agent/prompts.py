@@ -31,6 +31,7 @@ def build_question_generation_messages(
 def build_full_evaluation_messages(
     agent_prompt: str,
     qa_pairs: list[dict],
+    unanswered: int = 0,
 ) -> list[dict]:
     
     system_content = agent_prompt.strip()
@@ -46,6 +47,13 @@ def build_full_evaluation_messages(
         lines.append(f"Answer: {qa.get('answer') or '(no answer given)'}")
         lines.append("")
 
+    if unanswered:
+        lines += [
+            f"The candidate gave no substantive answer to {unanswered} further question(s); "
+            "those are already scored and not listed. Take them into account in the overall score.",
+            "",
+        ]
+
     lines += [
         "For each question-answer pair, provide a score (1-10) and one or two sentences of feedback.",
         "Then provide an overall score (1-10) and a short overall feedback paragraph (2-4 sentences) "
@@ -1,26 +1,101 @@
 import logging
 
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.utils import timezone
+
 from src.interview.models import Interview, InterviewQA, Question
+from src.interview.cohorts import record_scores
+from src.interview.progress import record_interview
 
-from .client import call_llm
-from .parsers import parse_json_response, parse_questions
+from .client import acall_llm, astream_llm, call_llm
+from .parsers import EvaluationStreamParser, QuestionStreamParser, parse_json_response, parse_questions
+from .prescoring import answer_stats, final_evaluation, provisional_scores
 from .prompts import build_full_evaluation_messages, build_question_generation_messages
+from .similarity import find_similar_interview, remember_interview
 
 logger = logging.getLogger(__name__)
 
+# Each service has a sync and an async entry point sharing the same DB
+# helpers; they differ only in how the LLM is called. The async variants
+# never hold a thread while waiting for the LLM.
 
-def generate_and_save_questions(interview: Interview) -> list[InterviewQA]:
+# Evaluation progress marker read by the results event stream: a version
+# bumped on every saved score and on a failed run (Interview.evaluation_error).
+EVALUATION_STATE_TTL = 60 * 60
+
+NO_ANSWERS_FEEDBACK = (
+    "None of the questions received a substantive answer, so there was nothing to evaluate in depth. "
+    "Try again and answer each question with a concrete example."
+)
+
+
+def evaluation_version_key(interview_id: int) -> str:
+    return f"evaluation:version:{interview_id}"
+
+
+def _bump_evaluation_version(interview_id: int) -> None:
+    key = evaluation_version_key(interview_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, EVALUATION_STATE_TTL)
+
+
+def _question_generation_messages(interview: Interview) -> list[dict]:
     agent = interview.agent
     if agent is None:
         raise ValueError(f"Interview #{interview.pk} has no agent assigned.")
 
-    messages = build_question_generation_messages(
+    return build_question_generation_messages(
         agent_prompt=agent.prompt,
         job_description=interview.job_description,
         number_of_questions=interview.number_of_questions,
     )
 
-    raw = call_llm(messages)
+
+def _touch(interview: Interview) -> None:
+    # Bump updated_at so caches keyed on it (e.g. LiveKit room metadata) see the current questions.
+    interview.save(update_fields=["updated_at"])
+
+
+def _attach_questions(interview: Interview, questions: list[Question]) -> list[InterviewQA]:
+    qa_pairs = [
+        InterviewQA.objects.create(interview=interview, question=question, order=order)
+        for order, question in enumerate(questions, start=1)
+    ]
+    _touch(interview)
+    return qa_pairs
+
+
+def _get_or_create_question(text: str) -> Question:
+    question = Question.objects.filter(text_hash=Question.hash_text(text)).first()
+    if question is None:
+        # Rows from before text_hash existed (until backfill_question_hashes
+        # has run); saving one fills its hash in.
+        question = Question.objects.filter(text_hash__isnull=True, text=text).first()
+        if question is not None:
+            question.save(update_fields=["text_hash"])
+    return question or Question.objects.create(text=text)
+
+
+def _save_question(interview: Interview, text: str, order: int) -> InterviewQA:
+    return InterviewQA.objects.create(interview=interview, question=_get_or_create_question(text), order=order)
+
+
+def _finish_questions(interview: Interview, qa_pairs: list[InterviewQA]) -> None:
+    _touch(interview)
+    remember_interview(interview)
+    logger.info("Generated %d questions for Interview #%d.", len(qa_pairs), interview.pk)
+
+
+def discard_questions(interview: Interview) -> None:
+    """Delete the (possibly partial) questions of a failed start, so a retry begins from scratch."""
+    interview.qa_pairs.all().delete()
+    _touch(interview)
+
+
+def _save_questions(interview: Interview, raw: str) -> list[InterviewQA]:
     question_texts = parse_questions(raw)
 
     if not question_texts:
@@ -28,43 +103,129 @@ def generate_and_save_questions(interview: Interview) -> list[InterviewQA]:
 
     question_texts = question_texts[: interview.number_of_questions]
 
-    qa_pairs: list[InterviewQA] = []
-    for order, text in enumerate(question_texts, start=1):
-        question, _ = Question.objects.get_or_create(text=text)
-        qa = InterviewQA.objects.create(
-            interview=interview,
-            question=question,
-            order=order,
-        )
-        qa_pairs.append(qa)
+    qa_pairs = [_save_question(interview, text, order) for order, text in enumerate(question_texts, start=1)]
+    _finish_questions(interview, qa_pairs)
+    return qa_pairs
 
-    logger.info("Generated %d questions for Interview #%d.", len(qa_pairs), interview.pk)
+
+def _reuse_questions(interview: Interview) -> list[InterviewQA] | None:
+    """
+    Copy the question set of a recent interview with a near-identical job
+    description (same agent and question count), sparing the LLM call.
+    """
+    match = find_similar_interview(interview)
+    if match is None:
+        return None
+
+    source_id, similarity = match
+    questions = [
+        qa.question
+        for qa in InterviewQA.objects.filter(interview_id=source_id).select_related("question").order_by("order")
+    ]
+    if len(questions) != interview.number_of_questions:
+        return None
+
+    qa_pairs = _attach_questions(interview, questions)
+    logger.info(
+        "Reused %d questions from Interview #%d for Interview #%d (similarity %.2f).",
+        len(qa_pairs), source_id, interview.pk, similarity,
+    )
     return qa_pairs
 
 
-def evaluate_and_save_all(
-    interview: Interview,
-    answers: list[dict], 
-) -> Interview:
+def generate_and_save_questions(interview: Interview) -> list[InterviewQA]:
+    reused = _reuse_questions(interview)
+    if reused is not None:
+        return reused
+    messages = _question_generation_messages(interview)
+    raw = call_llm(messages)
+    return _save_questions(interview, raw)
+
+
+async def agenerate_and_save_questions(interview: Interview) -> list[InterviewQA]:
+    reused = await sync_to_async(_reuse_questions)(interview)
+    if reused is not None:
+        return reused
+    messages = await sync_to_async(_question_generation_messages)(interview)
+    raw = await acall_llm(messages)
+    return await sync_to_async(_save_questions)(interview, raw)
+
+
+async def astream_generate_and_save_questions(interview: Interview, on_question=None) -> list[InterviewQA]:
+    """
+    agenerate_and_save_questions over a streamed completion: each question
+    is saved as soon as its line is complete, then `on_question(qa_pairs)`
+    is awaited with the questions saved so far.
+    """
+    reused = await sync_to_async(_reuse_questions)(interview)
+    if reused is not None:
+        if on_question is not None:
+            await on_question(reused)
+        return reused
+
+    messages = await sync_to_async(_question_generation_messages)(interview)
+    parser = QuestionStreamParser()
+    qa_pairs: list[InterviewQA] = []
+
+    async def save(texts: list[str]) -> None:
+        for text in texts:
+            if len(qa_pairs) >= interview.number_of_questions:
+                return
+            qa_pairs.append(await sync_to_async(_save_question)(interview, text, len(qa_pairs) + 1))
+            if on_question is not None:
+                await on_question(qa_pairs)
 
+    async for delta in astream_llm(messages):
+        await save(parser.feed(delta))
+    await save(parser.close())
+
+    if not qa_pairs:
+        raise RuntimeError("LLM returned no parseable questions.")
+
+    await sync_to_async(_finish_questions)(interview, qa_pairs)
+    return qa_pairs
+
+
+def _save_answers(interview: Interview, answers: list[dict]) -> tuple[list[InterviewQA], list[dict] | None, set[int]]:
+    """
+    Store the submitted answers with their provisional scores, score empty
+    and trivial answers locally, and build the evaluation prompt for the
+    rest. Returns (all QAs, prompt or None if no answer needs the LLM,
+    ids of the QAs already scored).
+    """
     agent = interview.agent
     if agent is None:
         raise ValueError(f"Interview #{interview.pk} has no agent assigned.")
 
     answer_map: dict[int, str] = {item["qa_id"]: item["answer"] for item in answers}
+    timings_map: dict[int, dict] = {item["qa_id"]: item["timings"] for item in answers if item.get("timings")}
 
-    qa_rows = (
+    updated_qa: list[InterviewQA] = list(
         interview.qa_pairs
         .select_related("question")
         .order_by("order")
     )
+    for qa in updated_qa:
+        qa.answer = answer_map.get(qa.pk, "")
+        qa.timings = timings_map.get(qa.pk)
 
-    updated_qa: list[InterviewQA] = []
-    for qa in qa_rows:
-        answer_text = answer_map.get(qa.pk, "")
-        qa.answer = answer_text
-        qa.save(update_fields=["answer"])
-        updated_qa.append(qa)
+    stats = answer_stats(
+        [qa.question.text for qa in updated_qa],
+        [qa.answer for qa in updated_qa],
+        [qa.timings for qa in updated_qa],
+    )
+    prescored: set[int] = set()
+    for qa, provisional, words in zip(updated_qa, provisional_scores(stats), stats.words):
+        qa.provisional_score = int(provisional)
+        fields = ["answer", "timings", "provisional_score", "updated_at"]
+        local = final_evaluation(words)
+        if local is not None:
+            qa.score, qa.feedback = local
+            fields += ["score", "feedback"]
+            prescored.add(qa.pk)
+        qa.save(update_fields=fields)
+    if prescored:
+        _bump_evaluation_version(interview.pk)
 
     qa_payload = [
         {
@@ -73,34 +234,70 @@ def evaluate_and_save_all(
             "answer": qa.answer or "",
         }
         for qa in updated_qa
+        if qa.pk not in prescored
     ]
+    if not qa_payload:
+        return updated_qa, None, prescored
 
     messages = build_full_evaluation_messages(
         agent_prompt=agent.prompt,
         qa_pairs=qa_payload,
+        unanswered=len(prescored),
     )
+    return updated_qa, messages, prescored
 
-    raw = call_llm(messages)
+
+def _save_qa_evaluation(qa: InterviewQA, eval_entry: dict) -> None:
+    score = int(eval_entry.get("score", 0))
+    qa.score = max(1, min(10, score))
+    qa.feedback = str(eval_entry.get("feedback", ""))
+    qa.save(update_fields=["score", "feedback", "updated_at"])
+    _bump_evaluation_version(qa.interview_id)
+
+
+def _save_evaluation(
+    interview: Interview,
+    updated_qa: list[InterviewQA],
+    raw: str,
+    already_saved: set[int] = frozenset(),
+) -> Interview:
     data = parse_json_response(raw)
 
     evaluations: list[dict] = data.get("evaluations", [])
     eval_map: dict[int, dict] = {e["qa_id"]: e for e in evaluations}
 
     for qa in updated_qa:
+        if qa.pk in already_saved:
+            continue
         eval_entry = eval_map.get(qa.pk)
         if not eval_entry:
             logger.warning("No evaluation returned for QA #%d.", qa.pk)
             continue
+        _save_qa_evaluation(qa, eval_entry)
+
+    return _save_overall(
+        interview,
+        updated_qa,
+        int(data.get("overall_score", 0)),
+        str(data.get("overall_feedback", "")),
+    )
+
 
-        score = int(eval_entry.get("score", 0))
-        qa.score = max(1, min(10, score))
-        qa.feedback = str(eval_entry.get("feedback", ""))
-        qa.save(update_fields=["score", "feedback"])
+def _save_local_evaluation(interview: Interview, updated_qa: list[InterviewQA]) -> Interview:
+    """Overall result when every answer was empty or trivial, so no LLM call was made."""
+    scores = [qa.score for qa in updated_qa if qa.score is not None]
+    overall_score = round(sum(scores) / len(scores)) if scores else 1
+    return _save_overall(interview, updated_qa, overall_score, NO_ANSWERS_FEEDBACK)
 
-    overall_score = int(data.get("overall_score", 0))
+
+def _save_overall(interview: Interview, updated_qa: list[InterviewQA], overall_score: int, feedback: str) -> Interview:
     interview.overall_score = max(1, min(10, overall_score))
-    interview.overall_feedback = str(data.get("overall_feedback", ""))
-    interview.save(update_fields=["overall_score", "overall_feedback"])
+    interview.overall_feedback = feedback
+    interview.evaluation_error = None
+    interview.save(update_fields=["overall_score", "overall_feedback", "evaluation_error", "updated_at"])
+    _bump_evaluation_version(interview.pk)
+    record_interview(interview)
+    record_scores(interview, [qa.score for qa in updated_qa if qa.score is not None])
 
     logger.info(
         "Evaluated Interview #%d — overall score: %d/10.",
@@ -108,3 +305,94 @@ def evaluate_and_save_all(
         interview.overall_score,
     )
     return interview
+
+
+def evaluate_and_save_all(
+    interview: Interview,
+    answers: list[dict],
+) -> Interview:
+    updated_qa, messages, prescored = _save_answers(interview, answers)
+    if messages is None:
+        return _save_local_evaluation(interview, updated_qa)
+    raw = call_llm(messages)
+    return _save_evaluation(interview, updated_qa, raw, prescored)
+
+
+def save_evaluation_error(interview: Interview, error: str) -> None:
+    """Record a failed evaluation on the interview, where the results stream and re-evaluation find it."""
+    Interview.objects.filter(pk=interview.pk).update(evaluation_error=error, updated_at=timezone.now())
+    _bump_evaluation_version(interview.pk)
+
+
+def stored_answers(interview: Interview) -> list[dict]:
+    """The interview's saved answers, in the shape evaluate_and_save_all takes."""
+    return [
+        {"qa_id": pk, "answer": answer or "", "timings": timings}
+        for pk, answer, timings in interview.qa_pairs.order_by("order").values_list("pk", "answer", "timings")
+    ]
+
+
+async def aevaluate_and_save_all(
+    interview: Interview,
+    answers: list[dict],
+) -> Interview:
+    updated_qa, messages, prescored = await sync_to_async(_save_answers)(interview, answers)
+    if messages is None:
+        return await sync_to_async(_save_local_evaluation)(interview, updated_qa)
+    raw = await acall_llm(messages)
+    return await sync_to_async(_save_evaluation)(interview, updated_qa, raw, prescored)
+
+
+async def asave_answers(
+    interview: Interview,
+    answers: list[dict],
+) -> tuple[list[InterviewQA], list[dict] | None, set[int]]:
+    """
+    The part of an evaluation that needs no LLM: store the answers with
+    their provisional scores and score empty and trivial ones. If no answer
+    is left for the LLM the evaluation is finished here and the prompt
+    returned is None. Same return value as _save_answers.
+    """
+    updated_qa, messages, prescored = await sync_to_async(_save_answers)(interview, answers)
+    if messages is None:
+        await sync_to_async(_save_local_evaluation)(interview, updated_qa)
+    return updated_qa, messages, prescored
+
+
+async def astream_evaluate_saved(
+    interview: Interview,
+    updated_qa: list[InterviewQA],
+    messages: list[dict],
+    prescored: set[int],
+) -> Interview:
+    """
+    The LLM part of an evaluation prepared by asave_answers, over a streamed
+    completion: each QA's score is saved as soon as its object is complete
+    in the stream, the overall summary once the reply has finished.
+    """
+    qa_by_id = {qa.pk: qa for qa in updated_qa}
+
+    parser = EvaluationStreamParser()
+    parts: list[str] = []
+    saved: set[int] = set(prescored)
+    async for delta in astream_llm(messages):
+        parts.append(delta)
+        for eval_entry in parser.feed(delta):
+            qa = qa_by_id.get(eval_entry.get("qa_id"))
+            if qa is None or qa.pk in saved:
+                continue
+            await sync_to_async(_save_qa_evaluation)(qa, eval_entry)
+            saved.add(qa.pk)
+
+    return await sync_to_async(_save_evaluation)(interview, updated_qa, "".join(parts), saved)
+
+
+async def astream_evaluate_and_save_all(
+    interview: Interview,
+    answers: list[dict],
+) -> Interview:
+    """aevaluate_and_save_all over a streamed completion (asave_answers, then astream_evaluate_saved)."""
+    updated_qa, messages, prescored = await asave_answers(interview, answers)
+    if messages is None:
+        return interview
+    return await astream_evaluate_saved(interview, updated_qa, messages, prescored)
@@ -0,0 +1,168 @@
+import re
+import threading
+import time
+import zlib
+from datetime import timedelta
+
+import numpy as np
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from src.interview.models import Interview, InterviewQA
+
+# MinHash signatures over word 3-gram shingles, banded for LSH lookup.
+# With 16 bands of 4 rows a pair becomes a candidate from a Jaccard
+# similarity of about 0.5; candidates are then checked against REUSE_THRESHOLD.
+SHINGLE_SIZE = 3
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+
+REUSE_THRESHOLD = 0.8
+REUSE_MAX_AGE = timedelta(days=30)
+# Each process refreshes a key from the DB at most this often, to pick up
+# interviews generated by other workers.
+REFRESH_INTERVAL = 300
+# Each refresh re-reads rows touched this long before the last one seen, for
+# saves that commit after a newer row was already loaded. add() is idempotent.
+REFRESH_OVERLAP = timedelta(minutes=1)
+MIN_SHINGLES = 5
+
+_PRIME = np.uint64(4294967291)  # largest prime below 2**32
+_rng = np.random.default_rng(20240601)
+_A = _rng.integers(1, 2 ** 31, size=NUM_PERM, dtype=np.uint64)
+_B = _rng.integers(0, 2 ** 31, size=NUM_PERM, dtype=np.uint64)
+
+_WORD_RE = re.compile(r"[a-z0-9+#]+")
+
+
+def shingles(text: str) -> np.ndarray:
+    """Hashed word 3-grams of the normalised text (lower-case, punctuation dropped)."""
+    words = _WORD_RE.findall(text.lower())
+    grams = {" ".join(words[i:i + SHINGLE_SIZE]) for i in range(max(1, len(words) - SHINGLE_SIZE + 1))}
+    return np.fromiter((zlib.crc32(g.encode()) for g in grams if g), dtype=np.uint64, count=-1)
+
+
+def signature(hashes: np.ndarray) -> np.ndarray:
+    # (a*x + b) mod p for every permutation/shingle pair; a*x < 2**63, no overflow.
+    return ((np.outer(_A, hashes) + _B[:, None]) % _PRIME).min(axis=1)
+
+
+class JobDescriptionIndex:
+    """
+    MinHash-LSH index of recent job descriptions for one (agent, question
+    count) pair. Entries map to the interview whose questions would be reused.
+    """
+
+    def __init__(self):
+        self.signatures: dict[int, np.ndarray] = {}
+        self.created: dict[int, float] = {}
+        self.buckets: dict[tuple[int, bytes], set[int]] = {}
+        # updated_at of the newest row loaded: attaching questions touches
+        # the interview, so a set saved after a newer one is still picked up.
+        self.loaded_until = None
+        self.refreshed_at = 0.0
+
+    def add(self, interview_id: int, text: str, created: float) -> None:
+        hashes = shingles(text)
+        if len(hashes) < MIN_SHINGLES or interview_id in self.signatures:
+            return
+        sig = signature(hashes)
+        self.signatures[interview_id] = sig
+        self.created[interview_id] = created
+        for band in range(BANDS):
+            key = (band, sig[band * ROWS:(band + 1) * ROWS].tobytes())
+            self.buckets.setdefault(key, set()).add(interview_id)
+
+    def prune(self, not_before: float) -> None:
+        """Drop entries created before `not_before`, too old to be reused."""
+        expired = [interview_id for interview_id, created in self.created.items() if created < not_before]
+        for interview_id in expired:
+            sig = self.signatures.pop(interview_id)
+            del self.created[interview_id]
+            for band in range(BANDS):
+                key = (band, sig[band * ROWS:(band + 1) * ROWS].tobytes())
+                bucket = self.buckets[key]
+                bucket.discard(interview_id)
+                if not bucket:
+                    del self.buckets[key]
+
+    def query(self, text: str, not_before: float) -> tuple[int, float] | None:
+        """Most similar recent entry at or above REUSE_THRESHOLD, as (interview_id, similarity)."""
+        hashes = shingles(text)
+        if len(hashes) < MIN_SHINGLES:
+            return None
+        sig = signature(hashes)
+
+        candidates = set()
+        for band in range(BANDS):
+            candidates |= self.buckets.get((band, sig[band * ROWS:(band + 1) * ROWS].tobytes()), set())
+
+        best = None
+        for interview_id in candidates:
+            if self.created[interview_id] < not_before:
+                continue
+            similarity = float(np.mean(self.signatures[interview_id] == sig))
+            if similarity >= REUSE_THRESHOLD and (best is None or similarity > best[1]):
+                best = (interview_id, similarity)
+        return best
+
+
+_indexes: dict[tuple[int, int], JobDescriptionIndex] = {}
+_lock = threading.Lock()
+
+
+def _refresh(index: JobDescriptionIndex, agent_id: int, number_of_questions: int) -> None:
+    """Load recent interviews with a question set updated since the last refresh, and drop expired ones."""
+    not_before = timezone.now() - REUSE_MAX_AGE
+    index.prune(not_before.timestamp())
+
+    rows = (
+        Interview.objects
+        .filter(
+            agent_id=agent_id,
+            number_of_questions=number_of_questions,
+            created_at__gte=not_before,
+        )
+        .exclude(job_description__isnull=True)
+        .exclude(job_description="")
+        .filter(Exists(InterviewQA.objects.filter(interview=OuterRef("pk"))))
+    )
+    if index.loaded_until is not None:
+        rows = rows.filter(updated_at__gte=index.loaded_until - REFRESH_OVERLAP)
+
+    for pk, text, created_at, updated_at in (
+        rows.values_list("pk", "job_description", "created_at", "updated_at").order_by("updated_at")
+    ):
+        index.add(pk, text, created_at.timestamp())
+        index.loaded_until = updated_at
+    index.refreshed_at = time.monotonic()
+
+
+def find_similar_interview(interview: Interview) -> tuple[int, float] | None:
+    """A recent interview with the same agent and question count whose job description is near-identical."""
+    if not interview.job_description or interview.agent_id is None:
+        return None
+
+    key = (interview.agent_id, interview.number_of_questions)
+    with _lock:
+        index = _indexes.setdefault(key, JobDescriptionIndex())
+        if time.monotonic() - index.refreshed_at >= REFRESH_INTERVAL:
+            _refresh(index, *key)
+        not_before = (timezone.now() - REUSE_MAX_AGE).timestamp()
+        match = index.query(interview.job_description, not_before)
+
+    if match is not None and match[0] == interview.pk:
+        return None
+    return match
+
+
+def remember_interview(interview: Interview) -> None:
+    """Register a freshly generated question set so later look-alikes can reuse it."""
+    if not interview.job_description or interview.agent_id is None:
+        return
+    key = (interview.agent_id, interview.number_of_questions)
+    with _lock:
+        index = _indexes.get(key)
+        if index is not None:
+            index.add(interview.pk, interview.job_description, interview.created_at.timestamp())
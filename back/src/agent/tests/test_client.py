@@ -0,0 +1,84 @@
+import asyncio
+import tempfile
+import threading
+from pathlib import Path
+from unittest import mock
+
+import httpx
+from django.test import SimpleTestCase, override_settings
+
+from src.agent import cassette, client
+
+COMPLETION = {"choices": [{"message": {"content": "Hello."}}]}
+
+
+async def respond(self, url, **kwargs):
+    """Stand-in for httpx.AsyncClient.post, recording the client it was called on."""
+    respond.clients.append(self)
+    return httpx.Response(200, json=COMPLETION, request=httpx.Request("POST", url))
+
+
+@override_settings(LLM_CASSETTE={"MODE": "", "PATH": "", "REPLAY_LATENCY": False})
+class AsyncClientLifetimeTest(SimpleTestCase):
+    def setUp(self):
+        respond.clients = []
+        patcher = mock.patch.object(httpx.AsyncClient, "post", respond)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_short_lived_loop_gets_its_own_closed_client(self):
+        # What async_to_sync does under WSGI: a new loop on a worker thread.
+        results = []
+        thread = threading.Thread(target=lambda: results.append(asyncio.run(client.acall_llm([]))))
+        thread.start()
+        thread.join()
+
+        self.assertEqual(results, ["Hello."])
+        (used,) = respond.clients
+        self.assertTrue(used.is_closed)
+        self.assertNotIn(used, client._async_clients.values())
+
+    def test_main_thread_loop_shares_one_client(self):
+        async def twice():
+            await client.acall_llm([])
+            await client.acall_llm([])
+
+        asyncio.run(twice())
+
+        first, second = respond.clients
+        self.assertIs(first, second)
+        self.assertFalse(first.is_closed)
+
+
+class CassetteTest(SimpleTestCase):
+    def setUp(self):
+        respond.clients = []
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = str(Path(directory.name) / "llm.sqlite3")
+
+    def cassette(self, mode):
+        return override_settings(LLM_CASSETTE={"MODE": mode, "PATH": self.path, "REPLAY_LATENCY": False})
+
+    def test_record_then_replay(self):
+        messages = [{"role": "user", "content": "Hi."}]
+        threads = []
+        connection = cassette._connection
+
+        def tracked():
+            threads.append(threading.current_thread())
+            return connection()
+
+        with mock.patch.object(cassette, "_connection", tracked):
+            with self.cassette(cassette.RECORD), mock.patch.object(httpx.AsyncClient, "post", respond):
+                self.assertEqual(asyncio.run(client.acall_llm(messages)), "Hello.")
+
+            with self.cassette(cassette.REPLAY), mock.patch.object(httpx.AsyncClient, "post", side_effect=AssertionError):
+                self.assertEqual(asyncio.run(client.acall_llm(messages)), "Hello.")
+                with self.assertRaises(RuntimeError):
+                    asyncio.run(client.acall_llm([{"role": "user", "content": "Never recorded."}]))
+
+        self.assertEqual(len(respond.clients), 1)
+        # The SQLite I/O ran off the event loop's thread.
+        self.assertEqual(len(threads), 3)
+        self.assertNotIn(threading.main_thread(), threads)
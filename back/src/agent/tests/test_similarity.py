@@ -0,0 +1,60 @@
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from src.agent import similarity
+from src.interview.models import Agent, Interview, InterviewQA, Question
+from src.user.models import CustomUser
+
+JOB = "Senior backend engineer building Django REST APIs with PostgreSQL, Redis and Celery on AWS."
+
+
+class SimilarityRefreshTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(email="similarity@example.invalid")
+        cls.agent = Agent.objects.create(name="Agent", prompt="-")
+        cls.question = Question.objects.create(text="Question?")
+
+    def setUp(self):
+        patcher = mock.patch.object(similarity, "_indexes", {})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create_interview(self, with_questions=True) -> Interview:
+        interview = Interview.objects.create(
+            user=self.user, agent=self.agent, job_description=JOB, number_of_questions=1,
+        )
+        if with_questions:
+            self.attach_questions(interview)
+        return interview
+
+    def attach_questions(self, interview: Interview) -> None:
+        InterviewQA.objects.create(interview=interview, question=self.question, order=1)
+        interview.save(update_fields=["updated_at"])
+
+    def find(self, interview: Interview):
+        with mock.patch.object(similarity, "REFRESH_INTERVAL", 0):
+            return similarity.find_similar_interview(interview)
+
+    def test_questions_saved_after_a_newer_interview_are_loaded(self):
+        late = self.create_interview(with_questions=False)
+        newer = self.create_interview()
+        self.assertIsNone(self.find(newer))  # loads `newer`, but not `late` yet
+
+        self.attach_questions(late)
+
+        self.assertEqual(self.find(newer), (late.pk, 1.0))
+
+    def test_refresh_drops_expired_entries(self):
+        old = self.create_interview()
+        probe = self.create_interview(with_questions=False)
+        self.assertEqual(self.find(probe), (old.pk, 1.0))
+        Interview.objects.filter(pk=old.pk).update(created_at=timezone.now() - similarity.REUSE_MAX_AGE * 2)
+        index = similarity._indexes[(self.agent.pk, 1)]
+        index.created[old.pk] = index.created[old.pk] - similarity.REUSE_MAX_AGE.total_seconds() * 2
+
+        self.assertIsNone(self.find(probe))
+        self.assertEqual(index.signatures, {})
+        self.assertEqual(index.buckets, {})
@@ -1,8 +1,10 @@
 from django.contrib import admin
-from .models import Interview, InterviewQA, Agent, Question
+from .models import Interview, InterviewQA, Agent, Question, UserProgress, IdempotencyRecord
 
 
 admin.site.register(Interview)
 admin.site.register(InterviewQA)
 admin.site.register(Agent)
 admin.site.register(Question)
+admin.site.register(UserProgress)
+admin.site.register(IdempotencyRecord)
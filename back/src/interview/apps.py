@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class InterviewConfig(AppConfig):
     name = "src.interview"
+
+    def ready(self):
+        from . import signals  # noqa: F401
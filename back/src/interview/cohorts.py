@@ -0,0 +1,176 @@
+import logging
+import os
+import threading
+import time
+
+import numpy as np
+from django.conf import settings
+from django.db import connections
+from django.db.models import Count
+
+from .models import Interview, InterviewQA
+
+logger = logging.getLogger(__name__)
+
+# Per-agent score distributions for percentile ranks. Scores are integers
+# 1..10, so each agent is one (2, 11) count array — row OVERALL for
+# interview scores, row QUESTION for per-question scores, indexed by score —
+# and a query is a lookup in its precomputed rank table.
+#
+# Evaluations written by this process are folded in as they happen; every
+# REFRESH_INTERVAL the counts are rebuilt from the database (one grouped
+# query per row) to pick up other workers, and snapshotted to disk so a new
+# process starts from the snapshot (if under SNAPSHOT_MAX_AGE) instead of
+# the database. The rebuild runs in a background thread while requests keep
+# reading the previous distribution; only the final swap takes the lock.
+
+OVERALL, QUESTION = 0, 1
+KINDS = {"overall": OVERALL, "question": QUESTION}
+MAX_SCORE = 10
+
+
+class ScoreDistribution:
+    def __init__(self, counts: dict[int, np.ndarray] | None = None):
+        self.counts: dict[int, np.ndarray] = counts or {}
+        self.ranks: dict[int, np.ndarray] = {}
+        for agent_id in self.counts:
+            self._rank(agent_id)
+
+    def _rank(self, agent_id: int) -> None:
+        # Midpoint percentile rank: share of the cohort scoring below, plus
+        # half of those scoring the same.
+        counts = self.counts[agent_id]
+        totals = counts.sum(axis=1, keepdims=True)
+        below = np.cumsum(counts, axis=1) - counts
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self.ranks[agent_id] = np.where(totals > 0, (below + counts / 2) / totals * 100, np.nan)
+
+    def add(self, agent_id: int, overall: int | None, question_scores: list[int]) -> None:
+        counts = self.counts.setdefault(agent_id, np.zeros((2, MAX_SCORE + 1), dtype=np.int64))
+        if overall is not None:
+            counts[OVERALL, overall] += 1
+        np.add.at(counts[QUESTION], np.asarray(question_scores, dtype=np.intp), 1)
+        self._rank(agent_id)
+
+    def percentile(self, agent_id: int, kind: int, score: int) -> float | None:
+        ranks = self.ranks.get(agent_id)
+        if ranks is None or not 0 <= score <= MAX_SCORE or np.isnan(ranks[kind, score]):
+            return None
+        return round(float(ranks[kind, score]), 1)
+
+    def size(self, agent_id: int, kind: int) -> int:
+        counts = self.counts.get(agent_id)
+        return 0 if counts is None else int(counts[kind].sum())
+
+    def save(self, path: str) -> None:
+        agent_ids = np.fromiter(self.counts, dtype=np.int64, count=len(self.counts))
+        stacked = np.zeros((len(agent_ids), 2, MAX_SCORE + 1), dtype=np.int64)
+        for i, agent_id in enumerate(agent_ids):
+            stacked[i] = self.counts[int(agent_id)]
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as fh:
+            np.savez(fh, agent_ids=agent_ids, counts=stacked)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "ScoreDistribution":
+        with np.load(path) as data:
+            return cls({int(a): c.copy() for a, c in zip(data["agent_ids"], data["counts"])})
+
+    @classmethod
+    def from_database(cls) -> "ScoreDistribution":
+        distribution = cls()
+        rows = [
+            (OVERALL, Interview.objects
+                .filter(agent__isnull=False, overall_score__isnull=False)
+                .values_list("agent_id", "overall_score")),
+            (QUESTION, InterviewQA.objects
+                .filter(interview__agent__isnull=False, score__isnull=False)
+                .values_list("interview__agent_id", "score")),
+        ]
+        for kind, pairs in rows:
+            for agent_id, score, count in pairs.annotate(n=Count("pk")).order_by():
+                if 0 <= score <= MAX_SCORE:
+                    counts = distribution.counts.setdefault(agent_id, np.zeros((2, MAX_SCORE + 1), dtype=np.int64))
+                    counts[kind, score] = count
+        for agent_id in distribution.counts:
+            distribution._rank(agent_id)
+        return distribution
+
+
+_distribution: ScoreDistribution | None = None
+_refreshed_at = 0.0
+_rebuilding = False
+# Guards the reference and in-place adds; never held across a rebuild.
+_lock = threading.Lock()
+# Serialises the first load of a process, which has nothing stale to serve.
+_first_load_lock = threading.Lock()
+
+
+def _build() -> ScoreDistribution:
+    distribution = ScoreDistribution.from_database()
+    path = settings.SCORE_COHORTS["SNAPSHOT_PATH"]
+    try:
+        distribution.save(path)
+    except OSError:
+        logger.exception("Could not write score cohort snapshot %s.", path)
+    return distribution
+
+
+def _load_snapshot() -> ScoreDistribution | None:
+    path = settings.SCORE_COHORTS["SNAPSHOT_PATH"]
+    try:
+        if time.time() - os.path.getmtime(path) < settings.SCORE_COHORTS["SNAPSHOT_MAX_AGE"]:
+            return ScoreDistribution.load(path)
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+
+def _swap(distribution: ScoreDistribution) -> None:
+    global _distribution, _refreshed_at
+    with _lock:
+        _distribution, _refreshed_at = distribution, time.monotonic()
+
+
+def _rebuild_in_background() -> None:
+    global _rebuilding, _refreshed_at
+    # Scores recorded between the queries and the swap are only counted again
+    # at the next rebuild.
+    try:
+        _swap(_build())
+    except Exception:
+        logger.exception("Could not rebuild score cohorts; keeping the previous distribution.")
+        with _lock:
+            _refreshed_at = time.monotonic()
+    finally:
+        with _lock:
+            _rebuilding = False
+        connections.close_all()
+
+
+def get_distribution() -> ScoreDistribution:
+    """This process's distribution: from the snapshot on first use, rebuilt in the background once stale."""
+    global _rebuilding
+    with _lock:
+        distribution = _distribution
+        if distribution is not None:
+            if not _rebuilding and time.monotonic() - _refreshed_at >= settings.SCORE_COHORTS["REFRESH_INTERVAL"]:
+                _rebuilding = True
+                threading.Thread(target=_rebuild_in_background, name="score-cohorts", daemon=True).start()
+            return distribution
+
+    with _first_load_lock:
+        if _distribution is None:
+            _swap(_load_snapshot() or _build())
+        return _distribution
+
+
+def record_scores(interview: Interview, question_scores: list[int]) -> None:
+    """Fold a freshly evaluated interview into this process's distribution."""
+    if interview.agent_id is None:
+        return
+    with _lock:
+        if _distribution is not None:
+            _distribution.add(interview.agent_id, interview.overall_score, question_scores)
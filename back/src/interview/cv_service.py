@@ -2,7 +2,9 @@ import logging
 import pdfplumber
 import io
 
-from src.agent.client import call_llm
+from asgiref.sync import sync_to_async
+
+from src.agent.client import acall_llm, call_llm
 from src.agent.parsers import parse_json_response
 from .cv_prompts import build_cv_analysis_messages
 
@@ -20,11 +22,7 @@ def extract_text_from_pdf(file_bytes: bytes) -> str:
     return "\n\n".join(text_parts)
 
 
-def analyse_cv(file_bytes: bytes, filename: str) -> dict:
-    """
-    Extract text from CV file, send to LLM, parse and return structured analysis.
-    Supports PDF and plain text files.
-    """
+def _cv_analysis_messages(file_bytes: bytes, filename: str) -> list[dict]:
     filename_lower = filename.lower()
 
     if filename_lower.endswith(".pdf"):
@@ -42,8 +40,10 @@ def analyse_cv(file_bytes: bytes, filename: str) -> dict:
         cv_text = cv_text[:15000]
         logger.warning("CV text truncated to 15000 characters.")
 
-    messages = build_cv_analysis_messages(cv_text)
-    raw = call_llm(messages)
+    return build_cv_analysis_messages(cv_text)
+
+
+def _parse_cv_analysis(raw: str) -> dict:
     data = parse_json_response(raw)
 
     # Clamp all scores 1-100
@@ -52,3 +52,20 @@ def analyse_cv(file_bytes: bytes, filename: str) -> dict:
         section["score"] = max(1, min(100, int(section.get("score", 50))))
 
     return data
+
+
+def analyse_cv(file_bytes: bytes, filename: str) -> dict:
+    """
+    Extract text from CV file, send to LLM, parse and return structured analysis.
+    Supports PDF and plain text files.
+    """
+    messages = _cv_analysis_messages(file_bytes, filename)
+    raw = call_llm(messages)
+    return _parse_cv_analysis(raw)
+
+
+async def aanalyse_cv(file_bytes: bytes, filename: str) -> dict:
+    """Async analyse_cv. PDF extraction runs in a worker thread, the LLM wait holds none."""
+    messages = await sync_to_async(_cv_analysis_messages, thread_sensitive=False)(file_bytes, filename)
+    raw = await acall_llm(messages)
+    return _parse_cv_analysis(raw)
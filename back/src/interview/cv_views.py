@@ -1,11 +1,12 @@
-from rest_framework.views import APIView
+from core.async_views import AsyncAPIView
+from core.throttling import ADMISSION_THROTTLES
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
 import logging
 
-from .cv_service import analyse_cv
+from .cv_service import aanalyse_cv
 
 logger = logging.getLogger(__name__)
 
@@ -13,11 +14,13 @@ ALLOWED_EXTENSIONS = {".pdf", ".txt", ".md"}
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5 MB
 
 
-class CVAnalysisView(APIView):
+class CVAnalysisView(AsyncAPIView):
     permission_classes = [IsAuthenticated]
     parser_classes = [MultiPartParser, FormParser]
+    throttle_classes = ADMISSION_THROTTLES
+    throttle_scope = "cv_analysis"
 
-    def post(self, request):
+    async def post(self, request):
         file = request.FILES.get("cv")
         if not file:
             return Response({"detail": "No file uploaded. Please attach a CV file."}, status=status.HTTP_400_BAD_REQUEST)
@@ -40,7 +43,7 @@ class CVAnalysisView(APIView):
         file_bytes = file.read()
 
         try:
-            result = analyse_cv(file_bytes, filename)
+            result = await aanalyse_cv(file_bytes, filename)
         except ValueError as exc:
             return Response({"detail": str(exc)}, status=status.HTTP_422_UNPROCESSABLE_ENTITY)
         except RuntimeError as exc:
@@ -0,0 +1,144 @@
+import csv
+import zlib
+
+from asgiref.sync import sync_to_async
+from django.db.models import Prefetch
+
+from core.renderers import dumps
+from .models import Interview, InterviewQA
+
+EXPORT_CHUNK_SIZE = 200
+# Output is handed to the client in pieces of at least this size.
+FLUSH_SIZE = 64 * 1024
+
+CSV_HEADER = [
+    "interview_id", "user", "agent", "status", "created_at", "completed_at",
+    "job_description", "overall_score", "overall_feedback",
+    "order", "question", "answer", "score", "feedback",
+]
+
+
+def export_queryset(user_id=None):
+    """Interviews (all users if `user_id` is None) with their QA rows prefetched per chunk."""
+    interviews = (
+        Interview.objects
+        .select_related("agent", "user")
+        .only(
+            "pk", "user", "agent", "status", "created_at", "completed_at", "job_description",
+            "overall_score", "overall_feedback", "agent__name", "user__email",
+        )
+        .prefetch_related(Prefetch(
+            "qa_pairs",
+            queryset=InterviewQA.objects.select_related("question").order_by("order"),
+        ))
+        .order_by("pk")
+    )
+    if user_id is not None:
+        interviews = interviews.filter(user_id=user_id)
+    return interviews
+
+
+def _isoformat(value):
+    return value.isoformat() if value else None
+
+
+def _interview_record(interview: Interview) -> dict:
+    return {
+        "id": interview.pk,
+        "user": interview.user.email,
+        "agent": interview.agent.name if interview.agent_id else None,
+        "status": interview.status,
+        "created_at": _isoformat(interview.created_at),
+        "completed_at": _isoformat(interview.completed_at),
+        "job_description": interview.job_description,
+        "overall_score": interview.overall_score,
+        "overall_feedback": interview.overall_feedback,
+        "qa_pairs": [
+            {
+                "order": qa.order,
+                "question": qa.question.text,
+                "answer": qa.answer,
+                "score": qa.score,
+                "feedback": qa.feedback,
+            }
+            for qa in interview.qa_pairs.all()
+        ],
+    }
+
+
+def ndjson_lines(interviews):
+    """One JSON object per interview, QA pairs nested."""
+    for interview in interviews.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield dumps(_interview_record(interview)) + b"\n"
+
+
+class _LineBuffer:
+    """csv.writer target that hands back each written row."""
+
+    def write(self, value):
+        return value
+
+
+def csv_lines(interviews):
+    """One row per QA pair; interviews without questions get a single row."""
+    writer = csv.writer(_LineBuffer())
+    yield writer.writerow(CSV_HEADER).encode()
+    for interview in interviews.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        record = _interview_record(interview)
+        head = [
+            record["id"], record["user"], record["agent"], record["status"],
+            record["created_at"], record["completed_at"], record["job_description"],
+            record["overall_score"], record["overall_feedback"],
+        ]
+        for qa in record["qa_pairs"] or [{}]:
+            row = head + [qa.get("order"), qa.get("question"), qa.get("answer"), qa.get("score"), qa.get("feedback")]
+            yield writer.writerow(row).encode()
+
+
+def batched(chunks):
+    """Join small chunks into pieces of about FLUSH_SIZE."""
+    pending = []
+    size = 0
+    for chunk in chunks:
+        pending.append(chunk)
+        size += len(chunk)
+        if size >= FLUSH_SIZE:
+            yield b"".join(pending)
+            pending, size = [], 0
+    if pending:
+        yield b"".join(pending)
+
+
+def gzipped(chunks):
+    """Gzip `chunks` on the fly, yielding compressed pieces of about FLUSH_SIZE."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    pending = []
+    size = 0
+    for chunk in chunks:
+        out = compressor.compress(chunk)
+        if out:
+            pending.append(out)
+            size += len(out)
+        if size >= FLUSH_SIZE:
+            yield b"".join(pending)
+            pending, size = [], 0
+    pending.append(compressor.flush())
+    yield b"".join(pending)
+
+
+async def aiterate(chunks):
+    """
+    Drive a sync (DB-backed) iterator from ASGI without buffering it.
+
+    StreamingHttpResponse consumes sync iterators in full before sending
+    under ASGI; pulling one chunk at a time on the request's sync thread
+    keeps memory flat and the cursor on the connection that opened it.
+    """
+    iterator = iter(chunks)
+    sentinel = object()
+    pull = sync_to_async(next)
+    while True:
+        chunk = await pull(iterator, sentinel)
+        if chunk is sentinel:
+            return
+        yield chunk
@@ -0,0 +1,89 @@
+import asyncio
+import hashlib
+import json
+from datetime import timedelta
+
+from django.db import IntegrityError
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+
+from .models import IdempotencyRecord
+
+HEADER = "Idempotency-Key"
+MAX_KEY_LENGTH = 255
+# A key can be reused for a new request once its record is this old.
+RECORD_TTL = timedelta(hours=24)
+# Retry-After for a retry that arrives while the first request is still running.
+IN_PROGRESS_RETRY_AFTER = 5
+
+
+def _fingerprint(request) -> str:
+    body = json.dumps(request.data, sort_keys=True, default=str)
+    return hashlib.sha256(f"{request.method} {request.get_full_path()}\n{body}".encode()).hexdigest()
+
+
+def purge_expired() -> int:
+    """Delete records older than RECORD_TTL (see the purge_idempotency_records command)."""
+    deleted, _ = IdempotencyRecord.objects.filter(created_at__lt=timezone.now() - RECORD_TTL).delete()
+    return deleted
+
+
+async def run_idempotent(request, handler) -> Response:
+    """
+    Run `handler()` (an async view body returning a Response) at most once
+    per user and Idempotency-Key: a retry gets the stored response of the
+    first request, a concurrent one 409 while it is still running. Without
+    the header the handler simply runs. 5xx responses and exceptions are
+    not stored, so the client may retry them with the same key.
+    """
+    key = request.headers.get(HEADER)
+    if not key:
+        return await handler()
+    if len(key) > MAX_KEY_LENGTH:
+        return Response(
+            {'detail': f'{HEADER} must be at most {MAX_KEY_LENGTH} characters.'},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    fingerprint = _fingerprint(request)
+    await IdempotencyRecord.objects.filter(
+        user=request.user, key=key, created_at__lt=timezone.now() - RECORD_TTL,
+    ).adelete()
+    try:
+        record = await IdempotencyRecord.objects.acreate(user=request.user, key=key, fingerprint=fingerprint)
+    except IntegrityError:
+        return await _replay(request.user, key, fingerprint)
+
+    try:
+        response = await handler()
+    except BaseException:
+        # Including cancellation (client disconnects), so the key is free to retry.
+        await asyncio.shield(record.adelete())
+        raise
+
+    if response.status_code >= 500:
+        await record.adelete()
+        return response
+
+    record.status_code = response.status_code
+    record.response = response.data
+    await record.asave(update_fields=['status_code', 'response'])
+    return response
+
+
+async def _replay(user, key: str, fingerprint: str) -> Response:
+    record = await IdempotencyRecord.objects.filter(user=user, key=key).afirst()
+    if record is None or record.status_code is None:
+        # Still running (or it just failed and the key is free again).
+        return Response(
+            {'detail': f'A request with this {HEADER} is already in progress.'},
+            status=status.HTTP_409_CONFLICT,
+            headers={'Retry-After': str(IN_PROGRESS_RETRY_AFTER)},
+        )
+    if record.fingerprint != fingerprint:
+        return Response(
+            {'detail': f'This {HEADER} was already used for a different request.'},
+            status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+    return Response(record.response, status=record.status_code, headers={'Idempotent-Replayed': 'true'})
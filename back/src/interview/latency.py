@@ -0,0 +1,73 @@
+import statistics
+from collections import defaultdict
+from datetime import timedelta
+
+from django.utils import timezone
+
+from .models import InterviewQA
+
+PERCENTILES = (50, 90, 99)
+
+# Stage name -> (start mark, end mark). Marks are ms offsets recorded by the
+# LiveKit agent's TurnTimeline; "origin" is the moment the question hit TTS.
+STAGES = {
+    "tts_first_audio": ("origin", "tts_first_audio"),
+    "tts_playout":     ("tts_first_audio", "tts_end"),
+    "echo_guard":      ("tts_end", "listen_open"),
+    "user_reaction":   ("listen_open", "first_transcript"),
+    "user_speaking":   ("first_transcript", "last_transcript"),
+    "silence_tail":    ("last_transcript", "silence_cutoff"),
+    "turn_total":      ("origin", "silence_cutoff"),
+}
+
+
+def turn_stages(timings: dict) -> dict[str, int]:
+    """Convert raw timeline marks into stage durations (ms). Missing marks are skipped."""
+    marks = {"origin": 0, **timings}
+    stages = {}
+    for stage, (start, end) in STAGES.items():
+        if start in marks and end in marks:
+            stages[stage] = marks[end] - marks[start]
+    if "publish_max" in timings:
+        stages["publish_max"] = timings["publish_max"]
+    return stages
+
+
+def _percentiles(values: list[int]) -> dict[str, float]:
+    if len(values) == 1:
+        return {f"p{p}": float(values[0]) for p in PERCENTILES}
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return {f"p{p}": round(cuts[p - 1], 1) for p in PERCENTILES}
+
+
+def latency_report(days: int = 7) -> list[dict]:
+    """
+    Aggregate per-turn stage percentiles for every (agent, voice) pair
+    over interviews completed in the last `days` days.
+    """
+    since = timezone.now() - timedelta(days=days)
+    rows = (
+        InterviewQA.objects
+        .filter(timings__isnull=False, interview__completed_at__gte=since)
+        .values_list("interview__agent__name", "interview__agent__voice", "timings")
+        .iterator(chunk_size=2000)
+    )
+
+    samples: dict[tuple, dict[str, list[int]]] = defaultdict(lambda: defaultdict(list))
+    turns: dict[tuple, int] = defaultdict(int)
+    for agent_name, voice, timings in rows:
+        key = (agent_name, voice)
+        turns[key] += 1
+        for stage, value in turn_stages(timings).items():
+            samples[key][stage].append(value)
+
+    report = []
+    for (agent_name, voice), stages in samples.items():
+        report.append({
+            "agent": agent_name,
+            "voice": voice,
+            "turns": turns[(agent_name, voice)],
+            "stages": {stage: _percentiles(values) for stage, values in stages.items()},
+        })
+    report.sort(key=lambda item: item["turns"], reverse=True)
+    return report
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from src.interview.progress import rebuild_progress
+
+
+class Command(BaseCommand):
+    help = "Rebuild the per-user progress rollups from existing completed interviews."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", type=int, action="append", dest="user_ids", help="Only this user id (repeatable).")
+        parser.add_argument("--chunk-size", type=int, default=500)
+
+    def handle(self, *args, user_ids=None, chunk_size=500, **options):
+        count = rebuild_progress(user_ids=user_ids, chunk_size=chunk_size)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt progress for {count} user(s)."))
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from src.interview.models import Question
+
+
+class Command(BaseCommand):
+    help = "Fill in text_hash for questions saved before it existed."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=500)
+
+    def handle(self, *args, chunk_size=500, **options):
+        count = 0
+        while True:
+            batch = list(Question.objects.filter(text_hash__isnull=True).only("pk", "text")[:chunk_size])
+            if not batch:
+                break
+            for question in batch:
+                question.text_hash = Question.hash_text(question.text)
+            Question.objects.bulk_update(batch, ["text_hash"])
+            count += len(batch)
+        self.stdout.write(self.style.SUCCESS(f"Hashed {count} question(s)."))
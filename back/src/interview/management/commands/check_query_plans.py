@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from src.interview.query_plans import FULL_SCAN_PATTERNS, full_scans, hot_queries, seed
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway dataset, EXPLAIN the hot interview queries and fail "
+        "if any of them is planned as a full table scan. Nothing is persisted. "
+        "The same check runs in the test suite (test_query_plans)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=200)
+        parser.add_argument("--interviews-per-user", type=int, default=25)
+        parser.add_argument("--questions-per-interview", type=int, default=5)
+
+    def handle(self, *args, **options):
+        if connection.vendor not in FULL_SCAN_PATTERNS:
+            raise CommandError(f"No plan rules for database vendor {connection.vendor!r}.")
+
+        failures = []
+        try:
+            with transaction.atomic():
+                seeded = seed(options["users"], options["interviews_per_user"], options["questions_per_interview"])
+                for name, queryset in hot_queries(*seeded):
+                    plan = queryset.explain()
+                    self.stdout.write(f"\n== {name}\n{plan}")
+                    if full_scans(plan):
+                        failures.append(name)
+                raise _Rollback
+        except _Rollback:
+            pass
+
+        if failures:
+            raise CommandError("Hot queries regressed to full scans: " + ", ".join(failures))
+        self.stdout.write(self.style.SUCCESS("\nAll hot queries use indexes."))
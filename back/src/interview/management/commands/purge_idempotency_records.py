@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from src.interview.idempotency import purge_expired
+
+
+class Command(BaseCommand):
+    help = "Delete Idempotency-Key records past their TTL. Run periodically (e.g. daily from cron)."
+
+    def handle(self, *args, **options):
+        count = purge_expired()
+        self.stdout.write(self.style.SUCCESS(f"Deleted {count} expired idempotency record(s)."))
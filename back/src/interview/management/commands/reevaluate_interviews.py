@@ -0,0 +1,43 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from src.agent.service import evaluate_and_save_all, save_evaluation_error, stored_answers
+from src.interview.models import Interview
+
+
+class Command(BaseCommand):
+    help = (
+        "Evaluate completed interviews left without a score by a failed or lost background evaluation. "
+        "Run periodically (e.g. every few minutes from cron)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than", type=int, default=10, metavar="MINUTES",
+            help="Skip interviews completed more recently, which may still be evaluating.",
+        )
+
+    def handle(self, *args, older_than=10, **options):
+        interviews = (
+            Interview.objects
+            .filter(
+                status=Interview.Status.COMPLETED,
+                overall_score__isnull=True,
+                completed_at__lte=timezone.now() - timedelta(minutes=older_than),
+            )
+            .select_related("agent")
+            .order_by("completed_at")
+        )
+        evaluated = failed = 0
+        for interview in interviews:
+            try:
+                evaluate_and_save_all(interview, stored_answers(interview))
+            except (RuntimeError, ValueError) as exc:
+                save_evaluation_error(interview, f"Evaluation failed: {exc}")
+                self.stderr.write(f"Interview #{interview.pk}: {exc}")
+                failed += 1
+            else:
+                evaluated += 1
+        self.stdout.write(self.style.SUCCESS(f"Evaluated {evaluated} interview(s), {failed} failed."))
@@ -1,4 +1,7 @@
+import hashlib
+
 from django.db import models
+from django.db.models import Q
 from src.user.models import CustomUser
 
 
@@ -26,6 +29,16 @@ class Agent(models.Model):
 
 class Question(models.Model):
     text = models.TextField()
+    # TextField can't be indexed portably, so exact-text lookups go through its digest.
+    text_hash = models.CharField(max_length=64, db_index=True, null=True, editable=False)
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def save(self, *args, **kwargs):
+        self.text_hash = self.hash_text(self.text)
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return self.text
@@ -63,10 +76,31 @@ class Interview(models.Model):
     status           = models.CharField(max_length=20, choices=Status, default=Status.PENDING)
     overall_score    = models.PositiveSmallIntegerField(blank=True, null=True)
     overall_feedback = models.TextField(blank=True, null=True)
+    # Why the last evaluation failed, cleared once it succeeds.
+    evaluation_error = models.TextField(blank=True, null=True)
 
     created_at   = models.DateTimeField(auto_now_add=True)
+    updated_at   = models.DateTimeField(auto_now=True)
     completed_at = models.DateTimeField(blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "-created_at"], name="interview_user_created_idx"),
+            # Only the few unfinished interviews are ever looked up by status.
+            # One partial index per status: SQLite only uses a partial index
+            # whose condition appears verbatim in the query.
+            models.Index(
+                fields=["status"],
+                name="interview_pending_idx",
+                condition=Q(status="pending"),
+            ),
+            models.Index(
+                fields=["status"],
+                name="interview_in_progress_idx",
+                condition=Q(status="in_progress"),
+            ),
+        ]
+
     def __str__(self):
         return f"{self.user}, Interview #{self.pk}"
 
@@ -76,11 +110,75 @@ class InterviewQA(models.Model):
     question  = models.ForeignKey(Question, on_delete=models.CASCADE)
     answer    = models.TextField(blank=True, null=True)
     score     = models.PositiveSmallIntegerField(blank=True, null=True)
+    provisional_score = models.PositiveSmallIntegerField(
+        blank=True,
+        null=True,
+        help_text="Local estimate from answer statistics, set on submission before the LLM score.",
+    )
     feedback  = models.TextField(blank=True, null=True)
     order     = models.PositiveSmallIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    timings   = models.JSONField(
+        blank=True,
+        null=True,
+        help_text="Per-turn latency marks from the LiveKit agent, in ms since the question was sent to TTS.",
+    )
 
     class Meta:
         ordering = ["order"]
+        indexes = [
+            models.Index(fields=["interview", "order"], name="interviewqa_order_idx"),
+        ]
+
+    def __str__(self):
+        return f"Q{self.order}: {self.question}"
+
+class UserProgress(models.Model):
+    """
+    Per-user rollup of completed interviews, maintained incrementally when an
+    evaluation is saved (see progress.record_interview) so reading a user's
+    progress is a single-row lookup.
+    """
+
+    # Number of recent (date, score) points kept for the trend chart.
+    RECENT_LIMIT = 50
+
+    user = models.OneToOneField(CustomUser, on_delete=models.CASCADE, related_name="progress")
+    interviews_completed = models.PositiveIntegerField(default=0)
+    interviews_scored    = models.PositiveIntegerField(default=0)
+    score_total    = models.PositiveIntegerField(default=0)
+    best_score     = models.PositiveSmallIntegerField(blank=True, null=True)
+    worst_score    = models.PositiveSmallIntegerField(blank=True, null=True)
+    recent_scores  = models.JSONField(default=list, help_text="[[date, overall_score, interview_id], ...], oldest first.")
+    agent_stats    = models.JSONField(default=dict, help_text="Per-agent interview and question score sums, keyed by agent id.")
+    current_streak = models.PositiveIntegerField(default=0)
+    longest_streak = models.PositiveIntegerField(default=0)
+    last_active_date = models.DateField(blank=True, null=True)
+    updated_at     = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Progress of {self.user}"
+
+
+class IdempotencyRecord(models.Model):
+    """
+    Outcome of a request sent with an Idempotency-Key header (see
+    idempotency.run_idempotent), replayed for retries with the same key.
+    `status_code` stays null while the first request is still running.
+    """
+
+    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name="idempotency_records")
+    key = models.CharField(max_length=255)
+    fingerprint = models.CharField(max_length=64, help_text="SHA-256 of the request method, full path and body.")
+    status_code = models.PositiveSmallIntegerField(blank=True, null=True)
+    response = models.JSONField(blank=True, null=True)
+    # Indexed for purge_idempotency_records.
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "key"], name="idempotency_user_key_uniq"),
+        ]
 
     def __str__(self):
-        return f"Q{self.order}: {self.question}"
\ No newline at end of file
+        return f"{self.user} {self.key}"
@@ -0,0 +1,95 @@
+import logging
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Interview, UserProgress
+
+logger = logging.getLogger(__name__)
+
+# Interviews that count towards progress: completed and evaluated. The
+# incremental path (record_interview) runs once evaluation has saved the
+# overall score; rebuild_progress must select the same set.
+COUNTED = Q(status=Interview.Status.COMPLETED, overall_score__isnull=False)
+
+
+def apply_interview(progress: UserProgress, interview: Interview, qa_scores: list[int]) -> None:
+    """Fold one evaluated interview into `progress` (in memory, not saved)."""
+    score = interview.overall_score
+    day = (interview.completed_at or timezone.now()).date()
+
+    progress.interviews_completed += 1
+    if score is not None:
+        progress.interviews_scored += 1
+        progress.score_total += score
+        progress.best_score = max(progress.best_score or score, score)
+        progress.worst_score = min(progress.worst_score or score, score)
+        progress.recent_scores = [
+            *progress.recent_scores,
+            [day.isoformat(), score, interview.pk],
+        ][-UserProgress.RECENT_LIMIT:]
+
+    if interview.agent_id is not None:
+        stats = progress.agent_stats.setdefault(str(interview.agent_id), {
+            "name": interview.agent.name,
+            "interviews": 0,
+            "score_total": 0,
+            "questions": 0,
+            "question_score_total": 0,
+        })
+        stats["interviews"] += 1
+        stats["score_total"] += score or 0
+        stats["questions"] += len(qa_scores)
+        stats["question_score_total"] += sum(qa_scores)
+
+    last = progress.last_active_date
+    if last is None or day > last:
+        progress.current_streak = progress.current_streak + 1 if last == day - timedelta(days=1) else 1
+        progress.last_active_date = day
+    progress.longest_streak = max(progress.longest_streak, progress.current_streak)
+
+
+def record_interview(interview: Interview) -> UserProgress:
+    """Incrementally update the owner's rollup after `interview` was evaluated."""
+    qa_scores = list(
+        interview.qa_pairs.filter(score__isnull=False).values_list("score", flat=True)
+    )
+    with transaction.atomic():
+        progress, _ = UserProgress.objects.select_for_update().get_or_create(user_id=interview.user_id)
+        apply_interview(progress, interview, qa_scores)
+        progress.save()
+    return progress
+
+
+def rebuild_progress(user_ids=None, chunk_size: int = 500) -> int:
+    """
+    Recompute rollups from scratch for `user_ids` (all users if None).
+    Returns the number of rollup rows written.
+    """
+    interviews = (
+        Interview.objects
+        .filter(COUNTED)
+        .select_related("agent")
+        .prefetch_related("qa_pairs")
+        .order_by("user_id", "completed_at", "pk")
+    )
+    if user_ids is not None:
+        interviews = interviews.filter(user_id__in=user_ids)
+
+    rollups: dict[int, UserProgress] = {}
+    for interview in interviews.iterator(chunk_size=chunk_size):
+        progress = rollups.setdefault(interview.user_id, UserProgress(user_id=interview.user_id))
+        qa_scores = [qa.score for qa in interview.qa_pairs.all() if qa.score is not None]
+        apply_interview(progress, interview, qa_scores)
+
+    with transaction.atomic():
+        existing = UserProgress.objects.all()
+        if user_ids is not None:
+            existing = existing.filter(user_id__in=user_ids)
+        existing.delete()
+        UserProgress.objects.bulk_create(rollups.values(), batch_size=chunk_size)
+
+    logger.info("Rebuilt progress rollups for %d user(s).", len(rollups))
+    return len(rollups)
@@ -0,0 +1,73 @@
+import re
+
+from django.db import connection
+
+from .models import Agent, Interview, InterviewQA, Question
+from src.user.models import CustomUser
+
+# EXPLAIN checks for the hot interview queries: seed() a dataset large
+# enough for the planner to prefer indexes, then full_scans() of each
+# hot_queries() plan must be empty. Used by the query plan tests and the
+# check_query_plans command.
+
+# Plan lines that mean a hot query is no longer served by an index.
+FULL_SCAN_PATTERNS = {
+    "sqlite": [
+        re.compile(r"\bSCAN (?!.*\bUSING (?:COVERING )?INDEX\b)\S+"),
+        re.compile(r"USE TEMP B-TREE FOR ORDER BY"),
+    ],
+    "postgresql": [
+        re.compile(r"\bSeq Scan on\b"),
+    ],
+}
+
+
+def full_scans(plan: str) -> list[str]:
+    """The lines of `plan` that are full scans on the current database."""
+    patterns = FULL_SCAN_PATTERNS[connection.vendor]
+    return [line for line in plan.splitlines() if any(p.search(line) for p in patterns)]
+
+
+def seed(users: int = 200, interviews_per_user: int = 25, questions_per_interview: int = 5):
+    """Create the dataset (call inside a transaction that is rolled back); returns a user, interview and question."""
+    agent = Agent.objects.create(name="__plan_check__", prompt="-")
+    questions = [Question(text=f"Plan check question {i}?") for i in range(50)]
+    for question in questions:
+        question.text_hash = Question.hash_text(question.text)
+    Question.objects.bulk_create(questions)
+    questions = list(Question.objects.filter(text__startswith="Plan check question"))
+
+    CustomUser.objects.bulk_create(CustomUser(email=f"plan-check-{i}@example.invalid") for i in range(users))
+    seeded_users = list(CustomUser.objects.filter(email__startswith="plan-check-"))
+
+    statuses = [Interview.Status.COMPLETED] * 8 + [Interview.Status.PENDING, Interview.Status.IN_PROGRESS]
+    Interview.objects.bulk_create(
+        Interview(user=u, agent=agent, status=statuses[n % len(statuses)])
+        for u in seeded_users
+        for n in range(interviews_per_user)
+    )
+    interviews = list(Interview.objects.filter(agent=agent).only("pk"))
+
+    InterviewQA.objects.bulk_create(
+        InterviewQA(interview=i, question=questions[(i.pk + n) % len(questions)], order=n + 1)
+        for i in interviews
+        for n in range(questions_per_interview)
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+        if connection.vendor == "postgresql":
+            # A small seeded table may legitimately be seq-scanned; only
+            # report a seq scan when no index can serve the query at all.
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+    return seeded_users[0], interviews[0], questions[0]
+
+
+def hot_queries(user, interview, question):
+    return [
+        ("interview list", Interview.objects.filter(user=user).order_by("-created_at")[:20]),
+        ("qa pairs by order", InterviewQA.objects.filter(interview=interview).order_by("order")),
+        ("question by text", Question.objects.filter(text_hash=Question.hash_text(question.text))),
+        ("open interviews by status", Interview.objects.filter(status=Interview.Status.IN_PROGRESS)),
+    ]
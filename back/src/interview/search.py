@@ -0,0 +1,133 @@
+import logging
+import re
+
+from django.db import connections
+
+from .models import Interview, InterviewQA, Question
+
+logger = logging.getLogger(__name__)
+
+# Searchable (model, column) pairs. Indexes are created by install_search_indexes
+# after migrate: FTS5 external-content tables kept in sync by triggers on
+# SQLite, GIN expression indexes (maintained by PostgreSQL itself) otherwise.
+SEARCHABLE = [(Question, "text"), (InterviewQA, "answer")]
+PG_CONFIG = "english"
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _fts_table(model) -> str:
+    return f"{model._meta.db_table}_fts"
+
+
+def _sqlite_statements(model, column: str) -> list[str]:
+    table, fts = model._meta.db_table, _fts_table(model)
+    return [
+        f"CREATE VIRTUAL TABLE {fts} USING fts5("
+        f"{column}, content='{table}', content_rowid='id', tokenize='porter unicode61')",
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {column}) VALUES (new.id, new.{column}); END",
+        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {column}) VALUES ('delete', old.id, old.{column}); END",
+        f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {column} ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {column}) VALUES ('delete', old.id, old.{column}); "
+        f"INSERT INTO {fts}(rowid, {column}) VALUES (new.id, new.{column}); END",
+    ]
+
+
+def install_search_indexes(using: str = "default") -> None:
+    """Create the full-text indexes if missing. Safe to run after every migrate."""
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        tables = set(connection.introspection.table_names(cursor))
+        for model, column in SEARCHABLE:
+            table = model._meta.db_table
+            if table not in tables:
+                continue
+            if connection.vendor == "sqlite":
+                if _fts_table(model) in tables:
+                    continue
+                for statement in _sqlite_statements(model, column):
+                    cursor.execute(statement)
+            elif connection.vendor == "postgresql":
+                cursor.execute(
+                    f"CREATE INDEX IF NOT EXISTS {table}_{column}_fts_idx ON {table} "
+                    f"USING GIN (to_tsvector('{PG_CONFIG}', COALESCE({column}, '')))"
+                )
+            else:
+                return
+            logger.info("Full-text index ready for %s.%s.", table, column)
+
+
+def _fts5_query(query: str) -> str:
+    """Keywords -> FTS5 query: every term required, the last one as a prefix."""
+    terms = _TERM_RE.findall(query)
+    if not terms:
+        return ""
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def _ranked_ids(model, column: str, query: str, limit: int, offset: int, user_id=None) -> list[int]:
+    """Primary keys of `model` rows matching `query`, best first."""
+    connection = connections["default"]
+    table = model._meta.db_table
+    owner_join = owner_filter = ""
+    params: list = []
+
+    if connection.vendor == "sqlite":
+        match = _fts5_query(query)
+        if not match:
+            return []
+        fts = _fts_table(model)
+        if user_id is not None:
+            owner_join = (
+                f" JOIN {table} t ON t.id = {fts}.rowid"
+                f" JOIN {Interview._meta.db_table} i ON i.id = t.interview_id"
+            )
+            owner_filter = " AND i.user_id = %s"
+        sql = (
+            f"SELECT {fts}.rowid FROM {fts}{owner_join}"
+            f" WHERE {fts} MATCH %s{owner_filter} ORDER BY {fts}.rank LIMIT %s OFFSET %s"
+        )
+        params = [match, *([user_id] if user_id is not None else []), limit, offset]
+
+    elif connection.vendor == "postgresql":
+        if not _TERM_RE.search(query):
+            return []
+        vector = f"to_tsvector('{PG_CONFIG}', COALESCE(t.{column}, ''))"
+        if user_id is not None:
+            owner_join = f" JOIN {Interview._meta.db_table} i ON i.id = t.interview_id"
+            owner_filter = " AND i.user_id = %s"
+        sql = (
+            f"SELECT t.id FROM {table} t{owner_join},"
+            f" websearch_to_tsquery('{PG_CONFIG}', %s) q"
+            f" WHERE {vector} @@ q{owner_filter}"
+            f" ORDER BY ts_rank({vector}, q) DESC, t.id LIMIT %s OFFSET %s"
+        )
+        params = [query, *([user_id] if user_id is not None else []), limit, offset]
+
+    else:
+        # No full-text support: unranked substring match.
+        rows = model.objects.filter(**{f"{column}__icontains": query})
+        if user_id is not None:
+            rows = rows.filter(interview__user_id=user_id)
+        return list(rows.order_by("-pk").values_list("pk", flat=True)[offset:offset + limit])
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [row[0] for row in cursor.fetchall()]
+
+
+def search_questions(query: str, limit: int, offset: int = 0) -> list[Question]:
+    ids = _ranked_ids(Question, "text", query, limit, offset)
+    by_id = Question.objects.in_bulk(ids)
+    return [by_id[pk] for pk in ids if pk in by_id]
+
+
+def search_answers(query: str, user_id: int, limit: int, offset: int = 0) -> list[InterviewQA]:
+    ids = _ranked_ids(InterviewQA, "answer", query, limit, offset, user_id=user_id)
+    by_id = InterviewQA.objects.select_related("question").in_bulk(ids)
+    return [by_id[pk] for pk in ids if pk in by_id]
@@ -1,5 +1,27 @@
+from datetime import timedelta
+
+from django.utils import timezone
 from rest_framework import serializers
-from .models import Agent, Question, Interview, InterviewQA
+from .models import Agent, Question, Interview, InterviewQA, UserProgress
+
+
+class SparseFieldsMixin:
+    """
+    Limit output to the comma-separated `?fields=` query parameter, if given.
+    Unknown names are ignored.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get('request')
+        if request is None:
+            return
+        requested = request.query_params.get('fields')
+        if not requested:
+            return
+        allowed = {name.strip() for name in requested.split(',')}
+        for name in set(self.fields) - allowed:
+            self.fields.pop(name)
 
 
 class AgentSerializer(serializers.ModelSerializer):
@@ -8,6 +30,12 @@ class AgentSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'prompt']
 
 
+class AgentSummarySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Agent
+        fields = ['id', 'name', 'voice']
+
+
 class QuestionSerializer(serializers.ModelSerializer):
     class Meta:
         model = Question
@@ -19,12 +47,20 @@ class InterviewQASerializer(serializers.ModelSerializer):
 
     class Meta:
         model = InterviewQA
-        fields = ['id', 'question', 'answer', 'score', 'feedback', 'order']
-        read_only_fields = ['score', 'feedback', 'order', 'question']
+        fields = ['id', 'question', 'answer', 'score', 'provisional_score', 'feedback', 'order', 'timings']
+        read_only_fields = ['score', 'provisional_score', 'feedback', 'order', 'question', 'timings']
 
 
-class InterviewListSerializer(serializers.ModelSerializer):
-    agent = AgentSerializer(read_only=True)
+class AnswerSearchResultSerializer(serializers.ModelSerializer):
+    question = QuestionSerializer(read_only=True)
+
+    class Meta:
+        model = InterviewQA
+        fields = ['id', 'interview', 'question', 'answer', 'score', 'feedback']
+
+
+class InterviewListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    agent = AgentSummarySerializer(read_only=True)
 
     class Meta:
         model = Interview
@@ -58,6 +94,9 @@ class InterviewDetailSerializer(serializers.ModelSerializer):
 class QASubmissionSerializer(serializers.Serializer):
     qa_id = serializers.IntegerField()
     answer = serializers.CharField(allow_blank=True)
+    timings = serializers.DictField(
+        child=serializers.IntegerField(min_value=0), required=False
+    )
 
 
 class CompleteInterviewSerializer(serializers.Serializer):
@@ -67,4 +106,125 @@ class CompleteInterviewSerializer(serializers.Serializer):
         if not value:
             raise serializers.ValidationError("At least one answer must be submitted.")
         return value
-    
\ No newline at end of file
+
+
+class UserProgressSerializer(serializers.ModelSerializer):
+    average_score = serializers.SerializerMethodField()
+    current_streak = serializers.SerializerMethodField()
+    trend = serializers.SerializerMethodField()
+    agents = serializers.SerializerMethodField()
+    best_category = serializers.SerializerMethodField()
+    worst_category = serializers.SerializerMethodField()
+
+    class Meta:
+        model = UserProgress
+        fields = [
+            'interviews_completed', 'average_score', 'best_score', 'worst_score',
+            'current_streak', 'longest_streak', 'last_active_date',
+            'trend', 'agents', 'best_category', 'worst_category',
+        ]
+
+    def get_average_score(self, obj):
+        if not obj.interviews_scored:
+            return None
+        return round(obj.score_total / obj.interviews_scored, 2)
+
+    def get_current_streak(self, obj):
+        # The stored streak only ends when the next interview is recorded.
+        if obj.last_active_date is None:
+            return 0
+        if timezone.localdate() - obj.last_active_date > timedelta(days=1):
+            return 0
+        return obj.current_streak
+
+    def get_trend(self, obj):
+        return [
+            {'date': day, 'score': score, 'interview_id': interview_id}
+            for day, score, interview_id in obj.recent_scores
+        ]
+
+    def get_agents(self, obj):
+        agents = []
+        for agent_id, stats in obj.agent_stats.items():
+            agents.append({
+                'agent_id': int(agent_id),
+                'name': stats['name'],
+                'interviews': stats['interviews'],
+                'average_score': round(stats['score_total'] / stats['interviews'], 2),
+                'average_question_score': (
+                    round(stats['question_score_total'] / stats['questions'], 2)
+                    if stats['questions'] else None
+                ),
+            })
+        agents.sort(key=lambda a: a['average_question_score'] or 0, reverse=True)
+        return agents
+
+    def get_best_category(self, obj):
+        agents = [a for a in self.get_agents(obj) if a['average_question_score'] is not None]
+        return agents[0]['name'] if agents else None
+
+    def get_worst_category(self, obj):
+        agents = [a for a in self.get_agents(obj) if a['average_question_score'] is not None]
+        return agents[-1]['name'] if agents else None
+
+
+# ----------------------------------------------------------------------
+# Hand-written read paths
+# ----------------------------------------------------------------------
+# Same output as InterviewDetailSerializer / InterviewListSerializer for
+# reads, without DRF's per-field machinery. Used by the hottest GET
+# endpoints; keep them in sync with the serializers above.
+
+def _datetime(value):
+    # Mirrors DRF's DateTimeField ISO-8601 output.
+    if value is None:
+        return None
+    text = timezone.localtime(value).isoformat()
+    if text.endswith('+00:00'):
+        text = text[:-6] + 'Z'
+    return text
+
+
+def interview_detail_data(interview: Interview) -> dict:
+    agent = interview.agent
+    return {
+        'id': interview.pk,
+        'agent': {'id': agent.pk, 'name': agent.name, 'prompt': agent.prompt} if agent else None,
+        'job_description': interview.job_description,
+        'number_of_questions': interview.number_of_questions,
+        'status': interview.status,
+        'overall_score': interview.overall_score,
+        'overall_feedback': interview.overall_feedback,
+        'qa_pairs': [
+            {
+                'id': qa.pk,
+                'question': {'id': qa.question_id, 'text': qa.question.text},
+                'answer': qa.answer,
+                'score': qa.score,
+                'provisional_score': qa.provisional_score,
+                'feedback': qa.feedback,
+                'order': qa.order,
+                'timings': qa.timings,
+            }
+            for qa in interview.qa_pairs.all()
+        ],
+        'created_at': _datetime(interview.created_at),
+        'completed_at': _datetime(interview.completed_at),
+    }
+
+
+def interview_list_data(interview: Interview, fields: set[str] | None = None) -> dict:
+    agent = interview.agent
+    data = {
+        'id': interview.pk,
+        'agent': {'id': agent.pk, 'name': agent.name, 'voice': agent.voice} if agent else None,
+        'job_description': interview.job_description,
+        'number_of_questions': interview.number_of_questions,
+        'status': interview.status,
+        'overall_score': interview.overall_score,
+        'created_at': _datetime(interview.created_at),
+        'completed_at': _datetime(interview.completed_at),
+    }
+    if fields:
+        data = {name: value for name, value in data.items() if name in fields}
+    return data
@@ -0,0 +1,41 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_migrate, post_save
+from django.dispatch import receiver
+
+from .models import Agent
+from .search import install_search_indexes
+
+AGENTS_VERSION_KEY = "agents:version"
+# Without a shared cache a bump only reaches the process that saved the
+# agent; the others pick up the change once their version expires.
+LOCAL_VERSION_TTL = 60
+
+
+def agents_version_ttl() -> int | None:
+    return None if settings.CACHE_SHARED else LOCAL_VERSION_TTL
+
+
+def get_agents_version() -> int:
+    # A fresh (time-based) version after expiry, so lists cached under an
+    # earlier one are never picked up again.
+    return cache.get_or_set(AGENTS_VERSION_KEY, time.time_ns, agents_version_ttl())
+
+
+@receiver(post_save, sender=Agent)
+@receiver(post_delete, sender=Agent)
+def bump_agents_version(sender, **kwargs):
+    """Invalidate every cached agent list by moving to a new version."""
+    try:
+        cache.incr(AGENTS_VERSION_KEY)
+    except ValueError:
+        cache.set(AGENTS_VERSION_KEY, time.time_ns(), agents_version_ttl())
+
+
+@receiver(post_migrate)
+def create_search_indexes(sender, using="default", **kwargs):
+    """Full-text indexes are raw SQL (FTS5 tables / GIN expressions), not model Meta."""
+    if sender.name == "src.interview":
+        install_search_indexes(using)
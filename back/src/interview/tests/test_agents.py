@@ -0,0 +1,42 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from src.interview.models import Agent
+from src.interview.signals import AGENTS_VERSION_KEY
+from src.user.models import CustomUser
+
+
+class AgentListCacheTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(email="agents@example.invalid")
+        cls.agent = Agent.objects.create(name="Before", prompt="-")
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def names(self):
+        return [agent["name"] for agent in self.client.get(reverse("agent-list")).json()]
+
+    def test_save_invalidates_list(self):
+        self.assertEqual(self.names(), ["Before"])
+        self.agent.name = "After"
+        self.agent.save()
+        self.assertEqual(self.names(), ["After"])
+
+    @override_settings(CACHE_SHARED=False)
+    def test_unshared_cache_bounds_staleness(self):
+        with mock.patch("src.interview.signals.LOCAL_VERSION_TTL", 60):
+            self.assertEqual(self.names(), ["Before"])
+            # Saved by another worker: this process's cache never sees the bump.
+            Agent.objects.filter(pk=self.agent.pk).update(name="After")
+            self.assertEqual(self.names(), ["Before"])
+            # Once the local version expires, the list is rebuilt.
+            cache.delete(AGENTS_VERSION_KEY)
+            self.assertEqual(self.names(), ["After"])
@@ -0,0 +1,55 @@
+import tempfile
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+from django.test import SimpleTestCase, override_settings
+
+from src.interview import cohorts
+from src.interview.cohorts import OVERALL, ScoreDistribution
+
+
+def distribution(*overall_scores: int) -> ScoreDistribution:
+    counts = np.zeros((2, cohorts.MAX_SCORE + 1), dtype=np.int64)
+    np.add.at(counts[OVERALL], list(overall_scores), 1)
+    return ScoreDistribution({1: counts})
+
+
+class DistributionRefreshTest(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        snapshot = str(Path(directory.name) / "score_cohorts.npz")
+        self.enterContext(override_settings(
+            SCORE_COHORTS={"SNAPSHOT_PATH": snapshot, "REFRESH_INTERVAL": 0, "SNAPSHOT_MAX_AGE": 0},
+        ))
+        self.enterContext(mock.patch.object(cohorts, "_distribution", distribution(5)))
+        self.enterContext(mock.patch.object(cohorts, "_refreshed_at", 0.0))
+        self.enterContext(mock.patch.object(cohorts, "_rebuilding", False))
+
+    def test_stale_distribution_is_served_while_rebuilding(self):
+        stale = cohorts._distribution
+        querying, release = threading.Event(), threading.Event()
+
+        def from_database():
+            querying.set()
+            release.wait(5)
+            return distribution(5, 9)
+
+        with mock.patch.object(ScoreDistribution, "from_database", from_database):
+            self.assertIs(cohorts.get_distribution(), stale)
+            self.assertTrue(querying.wait(5))
+
+            # Mid-rebuild, readers and writers don't wait for it.
+            self.assertIs(cohorts.get_distribution(), stale)
+            cohorts.record_scores(SimpleNamespace(agent_id=1, overall_score=7), [])
+            self.assertEqual(stale.size(1, OVERALL), 2)
+
+            release.set()
+            rebuild = next(t for t in threading.enumerate() if t.name == "score-cohorts")
+            rebuild.join(5)
+
+        self.assertEqual(cohorts._distribution.percentile(1, OVERALL, 9), 75.0)
+        self.assertFalse(cohorts._rebuilding)
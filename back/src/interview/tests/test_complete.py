@@ -0,0 +1,104 @@
+import asyncio
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import AsyncRequestFactory, TestCase
+from rest_framework.test import force_authenticate
+from django.utils import timezone
+
+from benchmarks.fixtures import ANSWER, evaluation_output
+from src.interview.models import Agent, Interview, InterviewQA, Question
+from src.interview.views import InterviewCompleteView, InterviewEvaluationStreamView, _background_tasks
+from src.user.models import CustomUser
+
+from .test_start import QUESTIONS
+
+
+async def failing_stream(messages, model=None):
+    raise RuntimeError("provider down")
+    yield
+
+
+class InterviewCompleteTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(email="complete@example.invalid")
+        cls.agent = Agent.objects.create(name="Agent", prompt="-")
+
+    def setUp(self):
+        cache.clear()
+        for target, value in [
+            ("src.interview.views.delete_room_later", mock.Mock()),
+            ("src.interview.views.InterviewCompleteView.throttle_classes", []),
+        ]:
+            self.enterContext(mock.patch(target, value))
+
+    def create_interview(self, completed_ago=timedelta(hours=1)) -> Interview:
+        interview = self.create_in_progress_interview()
+        Interview.objects.filter(pk=interview.pk).update(
+            status=Interview.Status.COMPLETED, completed_at=timezone.now() - completed_ago,
+        )
+        InterviewQA.objects.filter(interview=interview).update(answer=ANSWER)
+        interview.refresh_from_db()
+        return interview
+
+    def create_in_progress_interview(self) -> Interview:
+        interview = Interview.objects.create(
+            user=self.user, agent=self.agent, job_description="-", number_of_questions=len(QUESTIONS),
+            status=Interview.Status.IN_PROGRESS,
+        )
+        for order, text in enumerate(QUESTIONS, start=1):
+            InterviewQA.objects.create(interview=interview, question=Question.objects.create(text=text), order=order)
+        return interview
+
+    async def complete_streamed(self, interview: Interview):
+        answers = [{"qa_id": pk, "answer": ANSWER} async for pk in interview.qa_pairs.values_list("pk", flat=True)]
+        request = AsyncRequestFactory().post(
+            f"/interviews/{interview.pk}/complete/?stream=1", {"answers": answers}, content_type="application/json",
+        )
+        force_authenticate(request, self.user)
+        response = await InterviewCompleteView.as_view()(request, pk=interview.pk)
+        await asyncio.gather(*_background_tasks)
+        return response
+
+    async def test_streamed_complete_answers_with_provisional_scores(self):
+        interview = await sync_to_async(self.create_in_progress_interview)()
+
+        with mock.patch("src.agent.service.astream_llm", failing_stream):
+            response = await self.complete_streamed(interview)
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual([qa["answer"] for qa in response.data["qa_pairs"]], [ANSWER.strip()] * len(QUESTIONS))
+        self.assertNotIn(None, [qa["provisional_score"] for qa in response.data["qa_pairs"]])
+
+    async def test_background_failure_is_stored_on_the_interview(self):
+        interview = await sync_to_async(self.create_in_progress_interview)()
+
+        with mock.patch("src.agent.service.astream_llm", failing_stream):
+            await self.complete_streamed(interview)
+
+        await interview.arefresh_from_db()
+        self.assertEqual(interview.evaluation_error, "Evaluation failed: provider down")
+        events = InterviewEvaluationStreamView().events(interview.pk)
+        self.assertEqual(await anext(events), b'retry: 3000\n\n')
+        self.assertTrue((await anext(events)).startswith(b'event: error\n'))
+
+    def test_command_evaluates_unscored_interviews(self):
+        stale = self.create_interview()
+        Interview.objects.filter(pk=stale.pk).update(evaluation_error="Evaluation failed: provider down")
+        recent = self.create_interview(completed_ago=timedelta(0))
+        qa_ids = list(stale.qa_pairs.order_by("order").values_list("pk", flat=True))
+
+        with mock.patch("src.agent.service.call_llm", return_value=evaluation_output(qa_ids)):
+            call_command("reevaluate_interviews", stdout=StringIO())
+
+        stale.refresh_from_db()
+        recent.refresh_from_db()
+        self.assertEqual(stale.overall_score, 7)
+        self.assertIsNone(stale.evaluation_error)
+        self.assertEqual(list(stale.qa_pairs.values_list("score", flat=True)), [7] * len(QUESTIONS))
+        self.assertIsNone(recent.overall_score)
@@ -0,0 +1,56 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TransactionTestCase
+from django.utils import timezone
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.async_views import AsyncAPIView
+from src.interview.idempotency import RECORD_TTL, run_idempotent
+from src.interview.models import IdempotencyRecord
+from src.user.models import CustomUser
+
+
+class EchoView(AsyncAPIView):
+    async def post(self, request):
+        return await run_idempotent(request, lambda: self.echo(request))
+
+    async def echo(self, request):
+        return Response({'stream': request.query_params.get('stream')})
+
+
+class IdempotencyKeyTest(TransactionTestCase):
+    # A reused key is detected through an IntegrityError, which would break
+    # TestCase's enclosing transaction.
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(email="idempotency@example.invalid")
+
+    async def post(self, path, key="key-1"):
+        request = APIRequestFactory().post(path, {"answers": []}, format="json", headers={"Idempotency-Key": key})
+        force_authenticate(request, self.user)
+        return await EchoView.as_view()(request)
+
+    async def test_retry_is_replayed(self):
+        first = await self.post("/echo/?stream=1")
+        retry = await self.post("/echo/?stream=1")
+
+        self.assertEqual(retry.status_code, 200)
+        self.assertEqual(retry.data, first.data)
+        self.assertEqual(retry["Idempotent-Replayed"], "true")
+
+    async def test_key_reused_with_other_query_string(self):
+        await self.post("/echo/")
+        response = await self.post("/echo/?stream=1")
+
+        self.assertEqual(response.status_code, 422)
+
+    def test_purge_keeps_live_records(self):
+        fresh = IdempotencyRecord.objects.create(user=self.user, key="fresh", fingerprint="-")
+        expired = IdempotencyRecord.objects.create(user=self.user, key="expired", fingerprint="-")
+        IdempotencyRecord.objects.filter(pk=expired.pk).update(created_at=timezone.now() - RECORD_TTL * 2)
+
+        call_command("purge_idempotency_records", stdout=StringIO())
+
+        self.assertEqual(list(IdempotencyRecord.objects.values_list("pk", flat=True)), [fresh.pk])
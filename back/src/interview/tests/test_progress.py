@@ -0,0 +1,30 @@
+from django.test import TestCase
+from django.utils import timezone
+
+from src.interview.models import Agent, Interview, UserProgress
+from src.interview.progress import rebuild_progress, record_interview
+from src.user.models import CustomUser
+
+
+class ProgressRollupTest(TestCase):
+    def test_rebuild_matches_incremental_updates(self):
+        user = CustomUser.objects.create_user(email="progress@example.invalid")
+        agent = Agent.objects.create(name="Agent", prompt="-")
+        for score in (6, 8):
+            interview = Interview.objects.create(
+                user=user, agent=agent, status=Interview.Status.COMPLETED,
+                completed_at=timezone.now(), overall_score=score,
+            )
+            record_interview(interview)
+        # Completed, but its evaluation failed: counted by neither path.
+        Interview.objects.create(
+            user=user, agent=agent, status=Interview.Status.COMPLETED, completed_at=timezone.now(),
+        )
+        incremental = UserProgress.objects.get(user=user)
+
+        rebuild_progress()
+
+        rebuilt = UserProgress.objects.get(user=user)
+        for field in ("interviews_completed", "interviews_scored", "score_total", "best_score", "agent_stats"):
+            self.assertEqual(getattr(rebuilt, field), getattr(incremental, field), field)
+        self.assertEqual(rebuilt.interviews_completed, 2)
@@ -0,0 +1,67 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from src.interview.models import Agent, Interview, InterviewQA, Question
+from src.livekit.obtain_token import build_room_metadata
+from src.user.models import CustomUser
+
+# Pin the number of queries on hot read paths, so an N+1 shows up as a
+# failing test rather than as latency in production.
+
+
+class InterviewListQueriesTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(email="list-queries@example.invalid")
+        agents = [Agent.objects.create(name=f"Agent {n}", prompt="-") for n in range(3)]
+        for n in range(25):
+            Interview.objects.create(user=cls.user, agent=agents[n % len(agents)], job_description="-")
+
+    def setUp(self):
+        self.url = reverse("interview-list-create")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_page_is_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["results"]), 20)
+
+    def test_next_page_is_one_query(self):
+        next_url = self.client.get(self.url).json()["next"]
+        with self.assertNumQueries(1):
+            response = self.client.get(next_url)
+        self.assertEqual(len(response.json()["results"]), 5)
+
+    def test_fields_subset_is_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"fields": "id,status,agent"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.json()["results"][0]), {"id", "status", "agent"})
+
+
+class RoomMetadataQueriesTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = CustomUser.objects.create_user(email="metadata-queries@example.invalid")
+        agent = Agent.objects.create(name="Agent", prompt="-")
+        cls.interview = Interview.objects.create(
+            user=user, agent=agent, job_description="-", status=Interview.Status.IN_PROGRESS,
+        )
+        for order in range(1, 16):
+            InterviewQA.objects.create(
+                interview=cls.interview, question=Question.objects.create(text=f"Question {order}?"), order=order,
+            )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_metadata_is_two_queries(self):
+        # The interview with its agent, then its questions in one prefetch.
+        with self.assertNumQueries(2):
+            metadata, complete = build_room_metadata(self.interview.pk)
+        self.assertTrue(complete)
+        self.assertIn("Question 15?", metadata)
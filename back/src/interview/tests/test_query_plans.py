@@ -0,0 +1,17 @@
+from django.test import TestCase
+
+from src.interview.query_plans import full_scans, hot_queries, seed
+
+
+class HotQueryPlansTest(TestCase):
+    """Fails when an index the hot interview queries rely on goes missing."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.seeded = seed()
+
+    def test_hot_queries_use_indexes(self):
+        for name, queryset in hot_queries(*self.seeded):
+            with self.subTest(name):
+                plan = queryset.explain()
+                self.assertEqual(full_scans(plan), [], f"{name} is planned as a full scan:\n{plan}")
@@ -0,0 +1,34 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from src.agent.service import _get_or_create_question
+from src.interview.models import Question
+
+
+class QuestionLookupTest(TestCase):
+    def legacy_question(self, text: str) -> Question:
+        # As saved before text_hash existed.
+        question = Question.objects.create(text=text)
+        Question.objects.filter(pk=question.pk).update(text_hash=None)
+        return question
+
+    def test_reuses_question_without_hash(self):
+        legacy = self.legacy_question("Tell me about a hard bug?")
+
+        question = _get_or_create_question("Tell me about a hard bug?")
+
+        self.assertEqual(question.pk, legacy.pk)
+        self.assertEqual(Question.objects.count(), 1)
+        legacy.refresh_from_db()
+        self.assertEqual(legacy.text_hash, Question.hash_text(legacy.text))
+
+    def test_backfill_command(self):
+        questions = [self.legacy_question(f"Question {n}?") for n in range(5)]
+
+        call_command("backfill_question_hashes", chunk_size=2, stdout=StringIO())
+
+        for question in questions:
+            question.refresh_from_db()
+            self.assertEqual(question.text_hash, Question.hash_text(question.text))
@@ -0,0 +1,102 @@
+import asyncio
+import json
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from src.interview.models import Agent, Interview
+from src.interview.views import InterviewStartView
+from src.livekit.obtain_token import generating_key
+from src.user.models import CustomUser
+
+QUESTIONS = [f"Question {n}?" for n in range(1, 6)]
+
+
+def stream(lines: list[str], error: Exception | None = None, stalled: asyncio.Event | None = None):
+    """
+    A stand-in for astream_llm yielding one question line per delta, then
+    raising `error` or, with `stalled`, setting it and hanging.
+    """
+    async def astream_llm(messages, model=None):
+        for n, line in enumerate(lines, start=1):
+            yield f"{n}. {line}\n"
+        if error is not None:
+            raise error
+        if stalled is not None:
+            stalled.set()
+            await asyncio.Event().wait()
+    return astream_llm
+
+
+class InterviewStartTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(email="start@example.invalid")
+        cls.agent = Agent.objects.create(name="Agent", prompt="-")
+
+    def setUp(self):
+        cache.clear()
+        self.interview = Interview.objects.create(
+            user=self.user, agent=self.agent, job_description="-", number_of_questions=len(QUESTIONS),
+        )
+        self.metadata = []
+
+        async def update_room_metadata(room_name, metadata):
+            self.metadata.append(json.loads(metadata))
+
+        for target, value in [
+            ("src.interview.views._provision_room", mock.AsyncMock(return_value=True)),
+            ("src.interview.views.update_room_metadata", update_room_metadata),
+            ("src.interview.views.delete_room_later", mock.Mock()),
+            ("src.agent.service.find_similar_interview", mock.Mock(return_value=None)),
+            ("src.agent.service.remember_interview", mock.Mock()),
+            ("src.interview.views.InterviewStartView.throttle_classes", []),
+        ]:
+            patcher = mock.patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def start(self, **headers):
+        request = APIRequestFactory().post(f"/interviews/{self.interview.pk}/start/", headers=headers)
+        force_authenticate(request, self.user)
+        return await InterviewStartView.as_view()(request, pk=self.interview.pk)
+
+    async def test_failed_stream_discards_partial_questions(self):
+        with mock.patch("src.agent.service.astream_llm", stream(QUESTIONS[:2], RuntimeError("stream broke"))):
+            response = await self.start()
+
+        self.assertEqual(response.status_code, 502)
+        await self.interview.arefresh_from_db()
+        self.assertEqual(self.interview.status, Interview.Status.PENDING)
+        self.assertEqual(await self.interview.qa_pairs.acount(), 0)
+        self.assertEqual(self.metadata[-1]["questions"], [])
+
+        with mock.patch("src.agent.service.astream_llm", stream(QUESTIONS)):
+            response = await self.start()
+
+        self.assertEqual(response.status_code, 200)
+        orders = [order async for order in self.interview.qa_pairs.order_by("order").values_list("order", flat=True)]
+        self.assertEqual(orders, [1, 2, 3, 4, 5])
+
+    async def test_cancelled_start_can_be_retried(self):
+        # What ASGI does to the view when the client disconnects mid-generation.
+        stalled = asyncio.Event()
+        with mock.patch("src.agent.service.astream_llm", stream(QUESTIONS[:2], stalled=stalled)):
+            task = asyncio.create_task(self.start(**{"Idempotency-Key": "start-1"}))
+            await stalled.wait()
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        await self.interview.arefresh_from_db()
+        self.assertEqual(self.interview.status, Interview.Status.PENDING)
+        self.assertEqual(await self.interview.qa_pairs.acount(), 0)
+        self.assertIsNone(await cache.aget(generating_key(self.interview.pk)))
+
+        with mock.patch("src.agent.service.astream_llm", stream(QUESTIONS)):
+            response = await self.start(**{"Idempotency-Key": "start-1"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(await self.interview.qa_pairs.acount(), len(QUESTIONS))
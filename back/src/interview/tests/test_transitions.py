@@ -0,0 +1,112 @@
+import asyncio
+from collections import Counter
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TransactionTestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from benchmarks.fixtures import ANSWER, evaluation_output
+from src.interview.models import Agent, Interview, InterviewQA, Question
+from src.interview.views import InterviewCompleteView, InterviewStartView
+from src.user.models import CustomUser
+
+from .test_start import QUESTIONS, stream
+
+PARALLEL = 8
+
+
+class ParallelTransitionsTest(TransactionTestCase):
+    """
+    Concurrent starts/completes of one interview: one wins, the LLM is
+    called once. Not wrapped in a transaction, like requests in production.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = CustomUser.objects.create_user(email="transitions@example.invalid")
+        self.agent = Agent.objects.create(name="Agent", prompt="-")
+        self.llm_calls = 0
+        for target, value in [
+            ("src.interview.views._provision_room", mock.AsyncMock(return_value=True)),
+            ("src.interview.views.update_room_metadata", mock.AsyncMock()),
+            ("src.interview.views.delete_room_later", mock.Mock()),
+            ("src.agent.service.find_similar_interview", mock.Mock(return_value=None)),
+            ("src.agent.service.remember_interview", mock.Mock()),
+            ("src.interview.views.InterviewStartView.throttle_classes", []),
+            ("src.interview.views.InterviewCompleteView.throttle_classes", []),
+        ]:
+            patcher = mock.patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def count_calls(self, astream_llm):
+        async def counted(messages, model=None):
+            self.llm_calls += 1
+            async for delta in astream_llm(messages, model):
+                # Give the other requests a chance to run mid-generation.
+                await asyncio.sleep(0)
+                yield delta
+        return counted
+
+    async def post(self, view, pk, data=None, **headers):
+        request = APIRequestFactory().post(f"/interviews/{pk}/", data, format="json", headers=headers)
+        force_authenticate(request, self.user)
+        return await view.as_view()(request, pk=pk)
+
+    async def create_interview(self, **fields) -> Interview:
+        return await Interview.objects.acreate(
+            user=self.user, agent=self.agent, job_description="-", number_of_questions=len(QUESTIONS), **fields,
+        )
+
+    async def test_parallel_starts_generate_once(self):
+        interview = await self.create_interview()
+
+        with mock.patch("src.agent.service.astream_llm", self.count_calls(stream(QUESTIONS))):
+            responses = await asyncio.gather(*(
+                self.post(InterviewStartView, interview.pk) for _ in range(PARALLEL)
+            ))
+
+        self.assertEqual(self.llm_calls, 1)
+        self.assertEqual(Counter(r.status_code for r in responses), {200: 1, 400: PARALLEL - 1})
+        self.assertEqual(await interview.qa_pairs.acount(), len(QUESTIONS))
+
+    async def test_parallel_starts_with_one_key_generate_once(self):
+        interview = await self.create_interview()
+
+        with mock.patch("src.agent.service.astream_llm", self.count_calls(stream(QUESTIONS))):
+            responses = await asyncio.gather(*(
+                self.post(InterviewStartView, interview.pk, **{"Idempotency-Key": "start"})
+                for _ in range(PARALLEL)
+            ))
+            replay = await self.post(InterviewStartView, interview.pk, **{"Idempotency-Key": "start"})
+
+        self.assertEqual(self.llm_calls, 1)
+        self.assertEqual(Counter(r.status_code for r in responses), {200: 1, 409: PARALLEL - 1})
+        self.assertEqual(replay.status_code, 200)
+        self.assertEqual(replay["Idempotent-Replayed"], "true")
+
+    async def test_parallel_completes_evaluate_once(self):
+        interview = await self.create_interview(status=Interview.Status.IN_PROGRESS)
+        qa_ids = []
+        for order, text in enumerate(QUESTIONS, start=1):
+            question = await Question.objects.acreate(text=text)
+            qa = await InterviewQA.objects.acreate(interview=interview, question=question, order=order)
+            qa_ids.append(qa.pk)
+        data = {"answers": [{"qa_id": qa_id, "answer": ANSWER} for qa_id in qa_ids]}
+
+        async def acall_llm(messages, model=None):
+            self.llm_calls += 1
+            await asyncio.sleep(0)
+            return evaluation_output(qa_ids)
+
+        with mock.patch("src.agent.service.acall_llm", acall_llm):
+            responses = await asyncio.gather(*(
+                self.post(InterviewCompleteView, interview.pk, data) for _ in range(PARALLEL)
+            ))
+
+        self.assertEqual(self.llm_calls, 1)
+        self.assertEqual(Counter(r.status_code for r in responses), {200: 1, 400: PARALLEL - 1})
+        await interview.arefresh_from_db()
+        self.assertEqual(interview.status, Interview.Status.COMPLETED)
+        self.assertEqual(interview.overall_score, 7)
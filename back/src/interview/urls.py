@@ -5,12 +5,20 @@ from .cv_views import CVAnalysisView
 
 urlpatterns = [
     path('agents/', views.AgentListView.as_view(), name='agent-list'),
+    path('agents/summary/', views.AgentSummaryListView.as_view(), name='agent-summary-list'),
+    path('agents/<int:pk>/percentiles/', views.AgentPercentileView.as_view(), name='agent-percentiles'),
 
     path('interviews/', views.InterviewListCreateView.as_view(), name='interview-list-create'),
     path('interviews/<int:pk>/', views.InterviewDetailView.as_view(), name='interview-detail'),
+    path('interviews/latency/', views.TurnLatencyView.as_view(), name='interview-latency'),
+    path('interviews/export/', views.InterviewExportView.as_view(), name='interview-export'),
 
     path('interviews/<int:pk>/start/', views.InterviewStartView.as_view(), name='interview-start'),
     path('interviews/<int:pk>/complete/', views.InterviewCompleteView.as_view(), name='interview-complete'),
+    path('interviews/<int:pk>/evaluation/stream/', views.InterviewEvaluationStreamView.as_view(), name='interview-evaluation-stream'),
+
+    path('progress/', views.ProgressView.as_view(), name='progress'),
+    path('search/', views.SearchView.as_view(), name='search'),
 
     path('cv/analyse/', CVAnalysisView.as_view(), name='cv-analyse'),
 ]
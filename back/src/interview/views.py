@@ -1,30 +1,150 @@
 from rest_framework import generics, permissions, status
+from rest_framework.pagination import CursorPagination
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from django.shortcuts import get_object_or_404
+from asgiref.sync import sync_to_async
+from django.db.models import Count, Max
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIRequest
+from django.http import Http404, HttpResponse, StreamingHttpResponse
 from django.utils import timezone
+from django.utils.http import parse_etags
+import asyncio
+import hashlib
 import logging
+import re
+import time
 
-from .models import Agent, Interview, InterviewQA
+from core.async_views import AsyncAPIView
+from core.renderers import EventStreamRenderer, ORJSONRenderer, dumps
+from core.throttling import ADMISSION_THROTTLES
+from .cohorts import KINDS, MAX_SCORE, get_distribution
+from .export import aiterate, batched, csv_lines, export_queryset, gzipped, ndjson_lines
+from .idempotency import run_idempotent
+from .latency import latency_report
+from .search import search_answers, search_questions
+from .models import Agent, Interview, InterviewQA, UserProgress
+from .signals import agents_version_ttl, get_agents_version
 from .serializers import (
     AgentSerializer,
+    AnswerSearchResultSerializer,
+    AgentSummarySerializer,
     InterviewListSerializer,
     InterviewDetailSerializer,
+    QuestionSerializer,
     CompleteInterviewSerializer,
+    UserProgressSerializer,
+    interview_detail_data,
+    interview_list_data,
+)
+from src.agent.service import (
+    aevaluate_and_save_all,
+    asave_answers,
+    astream_evaluate_saved,
+    astream_generate_and_save_questions,
+    discard_questions,
+    evaluation_version_key,
+    save_evaluation_error,
+)
+from src.livekit.obtain_token import GENERATION_TTL, generating_key
+from src.livekit.rooms import (
+    delete_room_later,
+    dispatch_agent,
+    encode_metadata,
+    ensure_room,
+    interview_room_name,
+    update_room_metadata,
 )
-from src.agent.service import generate_and_save_questions, evaluate_and_save_all
 
 logger = logging.getLogger(__name__)
 
 
-class AgentListView(generics.ListAPIView):
+class AgentListView(APIView):
+    """
+    Agents change rarely, so the rendered list is cached per agent-set
+    version (bumped by the Agent save/delete signals) and served as-is,
+    with an ETag for conditional requests. Other workers see a bump at
+    once only with a shared cache; otherwise after LOCAL_VERSION_TTL.
+    """
     serializer_class = AgentSerializer
     permission_classes = [permissions.IsAuthenticated]
-    queryset = Agent.objects.all()
+    cache_variant = 'full'
+    max_age = 300
+
+    def get(self, request):
+        version = get_agents_version()
+        etag = f'"agents-{self.cache_variant}-{version}"'
+        headers = {'ETag': etag, 'Cache-Control': f'private, max-age={self.max_age}'}
+
+        if etag in parse_etags(request.headers.get('If-None-Match', '')):
+            return HttpResponse(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        key = f'agents:list:{self.cache_variant}:{version}'
+        content = cache.get(key)
+        if content is None:
+            data = self.serializer_class(Agent.objects.order_by('pk'), many=True).data
+            content = ORJSONRenderer().render(data)
+            cache.set(key, content, agents_version_ttl())
+
+        return HttpResponse(content, content_type='application/json', headers=headers)
+
+
+class AgentSummaryListView(AgentListView):
+    """Agent list without prompts, for the picker UI."""
+    serializer_class = AgentSummarySerializer
+    cache_variant = 'summary'
+
+
+class AgentPercentileView(APIView):
+    """
+    Percentile ranks of scores among everyone interviewed by this agent:
+    `?overall=7&question=6,8` ranks overall score 7 and question scores 6
+    and 8. Served from the in-memory cohort distribution, no DB query.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    max_scores = 50
+
+    def get(self, request, pk):
+        queries = {}
+        for kind in KINDS:
+            raw = request.query_params.get(kind, '')
+            try:
+                scores = [int(value) for value in raw.split(',') if value.strip()]
+            except ValueError:
+                return Response({'detail': f'{kind} must be comma-separated integers.'}, status=status.HTTP_400_BAD_REQUEST)
+            if len(scores) > self.max_scores or any(not 1 <= score <= MAX_SCORE for score in scores):
+                return Response(
+                    {'detail': f'{kind}: at most {self.max_scores} scores between 1 and {MAX_SCORE}.'},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            queries[kind] = scores
+
+        distribution = get_distribution()
+        return Response({
+            'agent': pk,
+            **{
+                kind: {
+                    'cohort_size': distribution.size(pk, KINDS[kind]),
+                    'percentiles': [
+                        {'score': score, 'percentile': distribution.percentile(pk, KINDS[kind], score)}
+                        for score in scores
+                    ],
+                }
+                for kind, scores in queries.items()
+            },
+        })
+
+
+class InterviewCursorPagination(CursorPagination):
+    ordering = '-created_at'
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
 
 
 class InterviewListCreateView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = InterviewCursorPagination
 
     def get_serializer_class(self):
         if self.request.method == 'POST':
@@ -32,7 +152,21 @@ class InterviewListCreateView(generics.ListCreateAPIView):
         return InterviewListSerializer
 
     def get_queryset(self):
-        return Interview.objects.filter(user=self.request.user).order_by('-created_at')
+        return (
+            Interview.objects
+            .filter(user=self.request.user)
+            .select_related('agent')
+            .defer('agent__prompt', 'overall_feedback')
+            .order_by('-created_at')
+        )
+
+    def list(self, request, *args, **kwargs):
+        requested = request.query_params.get('fields')
+        fields = {name.strip() for name in requested.split(',')} if requested else None
+
+        page = self.paginate_queryset(self.get_queryset())
+        data = [interview_list_data(interview, fields) for interview in page]
+        return self.get_paginated_response(data)
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
@@ -43,72 +177,418 @@ class InterviewDetailView(generics.RetrieveAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return Interview.objects.filter(user=self.request.user)
+        return (
+            Interview.objects
+            .filter(user=self.request.user)
+            .select_related('agent')
+            .prefetch_related('qa_pairs__question')
+        )
 
+    def get_etag(self):
+        """
+        Version of the interview and its QA rows, from one aggregate query.
+        Returns None if the interview doesn't exist for this user.
+        """
+        stamps = (
+            Interview.objects
+            .filter(pk=self.kwargs['pk'], user=self.request.user)
+            .annotate(qa_updated=Max('qa_pairs__updated_at'), qa_count=Count('qa_pairs'))
+            .values_list('updated_at', 'qa_updated', 'qa_count')
+            .first()
+        )
+        if stamps is None:
+            return None
+        return '"%s"' % hashlib.md5(repr(stamps).encode()).hexdigest()
 
-class InterviewStartView(APIView):
+    def retrieve(self, request, *args, **kwargs):
+        etag = self.get_etag()
+        if etag is None:
+            raise Http404
+
+        headers = {'ETag': etag, 'Cache-Control': 'private, no-cache'}
+        if_none_match = parse_etags(request.headers.get('If-None-Match', ''))
+        if etag in if_none_match or '*' in if_none_match:
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        response = Response(interview_detail_data(self.get_object()))
+        for header, value in headers.items():
+            response[header] = value
+        return response
+
+
+class InterviewExportView(APIView):
+    """
+    Streams the user's interviews with all questions, answers, scores and
+    feedback as NDJSON (default) or CSV (`?type=csv`), gzipped when the
+    client accepts it. Staff can export every user's interviews with `?all=1`.
+    Rows are read in chunks from a server-side cursor, so memory use does
+    not grow with the history size.
+    """
     permission_classes = [permissions.IsAuthenticated]
+    export_types = {
+        'ndjson': ('application/x-ndjson', ndjson_lines),
+        'csv': ('text/csv; charset=utf-8', csv_lines),
+    }
 
-    def post(self, request, pk):
-        interview = get_object_or_404(Interview, pk=pk, user=request.user)
+    def get(self, request):
+        export_type = request.query_params.get('type', 'ndjson')
+        if export_type not in self.export_types:
+            return Response(
+                {'detail': f'type must be one of: {", ".join(self.export_types)}.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        everyone = request.query_params.get('all') in ('1', 'true')
+        if everyone and not request.user.is_staff:
+            return Response({'detail': 'Only staff can export all interviews.'}, status=status.HTTP_403_FORBIDDEN)
+
+        content_type, render_lines = self.export_types[export_type]
+        lines = render_lines(export_queryset(None if everyone else request.user.pk))
+
+        use_gzip = bool(re.search(r'\bgzip\b', request.headers.get('Accept-Encoding', '')))
+        chunks = gzipped(lines) if use_gzip else batched(lines)
+        if isinstance(request._request, ASGIRequest):
+            chunks = aiterate(chunks)
+
+        response = StreamingHttpResponse(chunks, content_type=content_type)
+        filename = f'interviews-{timezone.now():%Y%m%d}.{export_type}'
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        response['Vary'] = 'Accept-Encoding'
+        if use_gzip:
+            response['Content-Encoding'] = 'gzip'
+        return response
+
+
+class SearchView(APIView):
+    """
+    Ranked full-text search over the question bank (`scope=questions`, the
+    default) or the user's own past answers (`scope=answers`). Paginated by
+    `page` / `page_size`; ranked results have no stable cursor, and `next`
+    is only set when another page exists, so no COUNT over the matches is needed.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    default_page_size = 20
+    max_page_size = 100
+
+    def get(self, request):
+        query = request.query_params.get('q', '').strip()
+        scope = request.query_params.get('scope', 'questions')
+        if not query:
+            return Response({'detail': 'q is required.'}, status=status.HTTP_400_BAD_REQUEST)
+        if scope not in ('questions', 'answers'):
+            return Response({'detail': 'scope must be questions or answers.'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            page = max(1, int(request.query_params.get('page', 1)))
+            page_size = min(self.max_page_size, max(1, int(request.query_params.get('page_size', self.default_page_size))))
+        except ValueError:
+            return Response({'detail': 'page and page_size must be integers.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        offset = (page - 1) * page_size
+        if scope == 'questions':
+            rows = search_questions(query, page_size + 1, offset)
+            serializer_class = QuestionSerializer
+        else:
+            rows = search_answers(query, request.user.pk, page_size + 1, offset)
+            serializer_class = AnswerSearchResultSerializer
+
+        return Response({
+            'query': query,
+            'scope': scope,
+            'page': page,
+            'next': page + 1 if len(rows) > page_size else None,
+            'results': serializer_class(rows[:page_size], many=True).data,
+        })
+
+
+class ProgressView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        progress = UserProgress.objects.filter(user=request.user).first() or UserProgress(user=request.user)
+        return Response(UserProgressSerializer(progress).data)
+
+
+class TurnLatencyView(APIView):
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        try:
+            days = max(1, int(request.query_params.get('days', 7)))
+        except ValueError:
+            return Response({'detail': 'days must be an integer.'}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({'days': days, 'results': latency_report(days)})
 
-        if interview.status != Interview.Status.PENDING:
+
+def _interview_detail_data(pk: int) -> dict:
+    interview = (
+        Interview.objects
+        .select_related('agent')
+        .prefetch_related('qa_pairs__question')
+        .get(pk=pk)
+    )
+    return interview_detail_data(interview)
+
+
+async def _aget_interview(pk: int, user) -> Interview:
+    interview = await Interview.objects.select_related('agent').filter(pk=pk, user=user).afirst()
+    if interview is None:
+        raise Http404
+    return interview
+
+
+async def _atransition(interview: Interview, current: str, new: str, **fields) -> bool:
+    """
+    Compare-and-set the interview's status with a conditional UPDATE.
+    Returns False (and leaves `interview` untouched) if it was not `current`.
+    """
+    values = {'status': new, 'updated_at': timezone.now(), **fields}
+    updated = await Interview.objects.filter(pk=interview.pk, status=current).aupdate(**values)
+    if not updated:
+        return False
+    for name, value in values.items():
+        setattr(interview, name, value)
+    return True
+
+
+async def _provision_room(room_name: str, voice: str) -> bool:
+    """Create the interview's room (which starts the agent job) with no questions yet."""
+    try:
+        await ensure_room(room_name, encode_metadata([], voice, complete=False))
+        await dispatch_agent(room_name)
+    except Exception:
+        # Not fatal: the token view creates the room when the candidate joins.
+        logger.exception("Could not provision LiveKit room %s.", room_name)
+        return False
+    return True
+
+
+class InterviewStartView(AsyncAPIView):
+    """
+    Generates the questions while the LiveKit room is provisioned and the
+    agent dispatched, so the agent is up by the time generation ends. Each
+    question is pushed to the room metadata as soon as it is saved.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    throttle_classes = ADMISSION_THROTTLES
+    throttle_scope = 'interview_start'
+
+    async def post(self, request, pk):
+        return await run_idempotent(request, lambda: self.start(request, pk))
+
+    async def start(self, request, pk):
+        interview = await _aget_interview(pk, request.user)
+
+        # Only one request wins the pending -> in progress transition, so
+        # concurrent or retried starts never generate twice.
+        if not await _atransition(interview, Interview.Status.PENDING, Interview.Status.IN_PROGRESS):
             return Response(
                 {'detail': 'Interview has already been started or completed.'},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        interview.status = Interview.Status.IN_PROGRESS
-        interview.save()
+        await cache.aset(generating_key(interview.pk), True, GENERATION_TTL)
+
+        room_name = interview_room_name(interview.pk)
+        voice = interview.agent.voice if interview.agent else 'alloy'
+        provisioning = asyncio.create_task(_provision_room(room_name, voice))
+
+        async def publish(qa_pairs, complete=False):
+            if not await provisioning:
+                return
+            questions = [{'qa_id': qa.pk, 'question': qa.question.text} for qa in qa_pairs]
+            try:
+                await update_room_metadata(room_name, encode_metadata(questions, voice, complete))
+            except Exception:
+                logger.exception("Could not update metadata of LiveKit room %s.", room_name)
+
+        async def abandon():
+            # Questions are saved (and published) as they stream in, so a
+            # failed start must drop them before the interview can be retried.
+            await sync_to_async(discard_questions)(interview)
+            await publish([])
+            await _atransition(interview, Interview.Status.IN_PROGRESS, Interview.Status.PENDING)
+            await cache.adelete(generating_key(interview.pk))
+            if await provisioning:
+                delete_room_later(room_name)
 
+        async def finish(qa_pairs):
+            await cache.adelete(generating_key(interview.pk))
+            await publish(qa_pairs, complete=True)
+
+        # Under ASGI a client that goes away (e.g. reloads the page) cancels
+        # the view. The clean-up is shielded from that cancellation so the
+        # interview is never left in progress with half its questions.
         try:
-            generate_and_save_questions(interview)
+            qa_pairs = await astream_generate_and_save_questions(interview, on_question=publish)
         except (RuntimeError, ValueError) as exc:
-            interview.status = Interview.Status.PENDING
-            interview.save()
+            await asyncio.shield(abandon())
             logger.exception("Question generation failed for Interview #%d.", interview.pk)
             return Response(
                 {'detail': f'Failed to generate questions: {exc}'},
                 status=status.HTTP_502_BAD_GATEWAY,
             )
+        except BaseException:
+            logger.warning("Question generation for Interview #%d was interrupted.", interview.pk)
+            await asyncio.shield(abandon())
+            raise
+
+        await asyncio.shield(finish(qa_pairs))
+        return Response(await sync_to_async(_interview_detail_data)(interview.pk))
+
+
+# Strong references to running background evaluations (the loop keeps only weak ones).
+# A task lost with its process leaves the interview without a score;
+# `reevaluate_interviews` picks those up.
+_background_tasks: set[asyncio.Task] = set()
+
 
-        interview.refresh_from_db()
-        return Response(InterviewDetailSerializer(interview).data)
+async def _evaluate_in_background(
+    interview: Interview, updated_qa: list[InterviewQA], messages: list[dict], prescored: set[int],
+) -> None:
+    try:
+        await astream_evaluate_saved(interview, updated_qa, messages, prescored)
+    except (RuntimeError, ValueError) as exc:
+        logger.exception("Evaluation failed for Interview #%d.", interview.pk)
+        await sync_to_async(save_evaluation_error)(interview, f'Evaluation failed: {exc}')
 
 
-class InterviewCompleteView(APIView):
+class InterviewCompleteView(AsyncAPIView):
+    """
+    Stores the answers and evaluates them. With `?stream=1` (ASGI only) it
+    answers 202 once the answers and their provisional scores are saved and
+    runs the LLM evaluation in the background; progress is then followed
+    through InterviewEvaluationStreamView.
+    """
     permission_classes = [permissions.IsAuthenticated]
+    throttle_classes = ADMISSION_THROTTLES
+    throttle_scope = 'interview_complete'
 
-    def post(self, request, pk):
-        interview = get_object_or_404(Interview, pk=pk, user=request.user)
+    async def post(self, request, pk):
+        return await run_idempotent(request, lambda: self.complete(request, pk))
 
-        if interview.status != Interview.Status.IN_PROGRESS:
-            return Response(
-                {'detail': 'Interview is not in progress.'},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+    async def complete(self, request, pk):
+        interview = await _aget_interview(pk, request.user)
 
         serializer = CompleteInterviewSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         answers = serializer.validated_data['answers']
 
-        interview.status = Interview.Status.COMPLETED
-        interview.completed_at = timezone.now()
-        interview.save()
+        # Only one request completes (and evaluates) the interview.
+        if not await _atransition(
+            interview, Interview.Status.IN_PROGRESS, Interview.Status.COMPLETED,
+            completed_at=timezone.now(), evaluation_error=None,
+        ):
+            return Response(
+                {'detail': 'Interview is not in progress.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        # The agent is done once the answers are in; free the room now rather
+        # than after its empty timeout.
+        delete_room_later(interview_room_name(interview.pk))
 
+        # A background task would die with the per-request loop under WSGI.
+        stream = request.query_params.get('stream') in ('1', 'true') and isinstance(request._request, ASGIRequest)
         try:
-            evaluate_and_save_all(interview, answers)
+            if stream:
+                # Answers, provisional and local scores are in before the 202;
+                # only the LLM call is left to the background.
+                updated_qa, messages, prescored = await asave_answers(interview, answers)
+                if messages is not None:
+                    task = asyncio.create_task(_evaluate_in_background(interview, updated_qa, messages, prescored))
+                    _background_tasks.add(task)
+                    task.add_done_callback(_background_tasks.discard)
+            else:
+                await aevaluate_and_save_all(interview, answers)
         except (RuntimeError, ValueError) as exc:
             logger.exception("Evaluation failed for Interview #%d.", interview.pk)
-            interview.refresh_from_db()
+            await sync_to_async(save_evaluation_error)(interview, f'Evaluation failed: {exc}')
             return Response(
                 {
-                    **InterviewDetailSerializer(interview).data,
+                    **await sync_to_async(_interview_detail_data)(interview.pk),
                     'warning': f'Interview completed but evaluation failed: {exc}',
                 },
                 status=status.HTTP_200_OK,
             )
 
-        interview.refresh_from_db()
-        return Response(InterviewDetailSerializer(interview).data)
-    
\ No newline at end of file
+        return Response(
+            await sync_to_async(_interview_detail_data)(interview.pk),
+            status=status.HTTP_202_ACCEPTED if stream else status.HTTP_200_OK,
+        )
+
+
+def _sse(event: str, data) -> bytes:
+    return b'event: ' + event.encode() + b'\ndata: ' + dumps(data) + b'\n\n'
+
+
+def _evaluation_state(pk: int) -> tuple[dict, list[dict]]:
+    # Interview first: once its overall score is visible, every QA score is too.
+    summary = Interview.objects.filter(pk=pk).values('overall_score', 'overall_feedback', 'evaluation_error').get()
+    scored = list(
+        InterviewQA.objects
+        .filter(interview_id=pk, score__isnull=False)
+        .order_by('order')
+        .values('id', 'order', 'score', 'feedback')
+    )
+    return summary, scored
+
+
+class InterviewEvaluationStreamView(AsyncAPIView):
+    """
+    Server-Sent Events feed of a completed interview's evaluation: one `qa`
+    event per scored answer as soon as it is saved, then `summary` with the
+    overall score, after which the stream ends. `error` and `timeout` also
+    end it. Serve under ASGI; each open stream holds no thread.
+
+    Scores are detected through a cache version key bumped by the evaluator,
+    with a periodic DB check as a fallback for caches not shared between
+    processes.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = [ORJSONRenderer, EventStreamRenderer]
+    poll_interval = 0.25
+    db_poll_interval = 3
+    keepalive_interval = 15
+    timeout = 180
+
+    async def get(self, request, pk):
+        interview = await _aget_interview(pk, request.user)
+        if interview.status != Interview.Status.COMPLETED:
+            return Response({'detail': 'Interview is not completed.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        response = StreamingHttpResponse(self.events(interview.pk), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    async def events(self, pk: int):
+        yield b'retry: 3000\n\n'
+        sent: set[int] = set()
+        version = object()
+        started = last_db = last_sent = time.monotonic()
+
+        while True:
+            current = await cache.aget(evaluation_version_key(pk))
+            now = time.monotonic()
+            if current != version or now - last_db >= self.db_poll_interval:
+                version, last_db = current, now
+                summary, scored = await sync_to_async(_evaluation_state)(pk)
+                error = summary.pop('evaluation_error')
+                for qa in scored:
+                    if qa['id'] not in sent:
+                        sent.add(qa['id'])
+                        last_sent = now
+                        yield _sse('qa', qa)
+                if summary['overall_score'] is not None:
+                    yield _sse('summary', summary)
+                    return
+                if error:
+                    yield _sse('error', {'detail': error})
+                    return
+
+            if now - started >= self.timeout:
+                yield _sse('timeout', {'detail': 'Evaluation is taking longer than expected.'})
+                return
+            if now - last_sent >= self.keepalive_interval:
+                last_sent = now
+                yield b': keep-alive\n\n'
+            await asyncio.sleep(self.poll_interval)
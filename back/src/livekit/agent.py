@@ -2,6 +2,7 @@ import asyncio
 import json
 import logging
 import os
+import time
 
 from decouple import config
 
@@ -10,10 +11,15 @@ os.environ.setdefault("LIVEKIT_API_KEY", config("LIVEKIT_API_KEY"))
 os.environ.setdefault("LIVEKIT_API_SECRET", config("LIVEKIT_API_SECRET"))
 os.environ.setdefault("OPENAI_API_KEY", config("OPENAI_API_KEY"))
 
-from livekit.agents import AutoSubscribe, JobContext, WorkerOptions, cli, Agent, RoomInputOptions
+from livekit.agents import AutoSubscribe, JobContext, JobExecutorType, JobProcess, WorkerOptions, cli, Agent, RoomInputOptions
 from livekit.agents import AgentSession
 from livekit.plugins import openai, silero
 
+try:
+    from .protocol import DataChannel
+except ImportError:  # run as a script: python agent.py
+    from protocol import DataChannel
+
 logger = logging.getLogger("interview-agent")
 
 VALID_VOICES = {"alloy", "echo", "fable", "onyx", "nova", "shimmer"}
@@ -29,9 +35,106 @@ ANSWER_TIMEOUT = 90.0
 # before we consider the answer complete.
 SILENCE_THRESHOLD = 2.5
 
+# Minimum seconds between two interim transcript messages sent to the
+# frontend. Hypotheses arriving faster than this are coalesced and only
+# the latest one is published.
+INTERIM_PUBLISH_INTERVAL = 0.15
+
+# How long to wait for the next question while the backend is still
+# generating them (they arrive as room metadata updates).
+QUESTION_WAIT_TIMEOUT = 60.0
+
+# How long the job stays up after the final message for the frontend to
+# acknowledge the outstanding answers.
+DELIVERY_TIMEOUT = 15.0
+
+# Run jobs as threads of one worker process sharing a single VAD whose
+# inference is batched across sessions (see batched_vad.py). Off: one
+# process and one VAD per job, the livekit-agents default.
+VAD_BATCHING = config("VAD_BATCHING", default=False, cast=bool)
+
+
+class QuestionFeed:
+    """
+    Questions and voice from the room metadata, kept current as the backend
+    updates it during generation. `complete` turns True once the list is final.
+    """
+
+    def __init__(self, room):
+        self.questions: list[dict] = []
+        self.voice: str = "alloy"
+        self.complete = False
+        self._changed = asyncio.Event()
+        room.on("room_metadata_changed", lambda old, new: self.update(new))
+        self.update(room.metadata)
+
+    def update(self, raw: str | None) -> None:
+        try:
+            metadata = json.loads(raw or "{}")
+        except json.JSONDecodeError:
+            logger.warning("Could not parse room metadata — ignoring update.")
+            return
+
+        questions = metadata.get("questions", [])
+        if len(questions) >= len(self.questions):
+            self.questions = questions
+        self.voice = metadata.get("voice", self.voice)
+        # Metadata written before this update existed has no flag: it is final.
+        self.complete = metadata.get("complete", True)
+        self._changed.set()
+
+    async def get(self, index: int) -> dict | None:
+        """Question `index`, waiting for it if it is still being generated; None past the end."""
+        while index >= len(self.questions):
+            if self.complete:
+                return None
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), QUESTION_WAIT_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.error("Timed out waiting for question %d.", index + 1)
+                return None
+        return self.questions[index]
+
+
+class TurnTimeline:
+    """
+    Monotonic marks for one question/answer turn.
+
+    Every mark is reported in whole milliseconds since the question was sent
+    to TTS, so a turn serialises to a handful of small integers:
+
+    - tts_first_audio / tts_end: first agent audio and playout end
+    - listen_open: listening window opens (after MIN_ANSWER_WAIT)
+    - first_transcript / last_transcript: first STT event, last final segment
+    - silence_cutoff: silence window (or timeout) closed the answer
+    - publish_max: slowest data-channel publish during the turn
+    """
+
+    def __init__(self):
+        self._origin = time.perf_counter()
+        self._marks: dict[str, float] = {}
+        self._publish_max = 0.0
+
+    def mark(self, name: str, *, first_only: bool = False) -> None:
+        if first_only and name in self._marks:
+            return
+        self._marks[name] = time.perf_counter()
+
+    def record_publish(self, seconds: float) -> None:
+        self._publish_max = max(self._publish_max, seconds)
+
+    def as_dict(self) -> dict[str, int]:
+        timings = {
+            name: round((at - self._origin) * 1000)
+            for name, at in self._marks.items()
+        }
+        timings["publish_max"] = round(self._publish_max * 1000)
+        return timings
+
 
 class InterviewAgent(Agent):
-    def __init__(self, questions: list[dict], room):
+    def __init__(self, feed: QuestionFeed, room):
         super().__init__(
             # Instruct the LLM to never speak on its own initiative.
             # Even though we bypass it for all spoken output, AgentSession
@@ -41,9 +144,13 @@ class InterviewAgent(Agent):
                 "and NEVER respond to anything the user says. Stay completely silent."
             )
         )
-        self.questions = questions
+        self.feed = feed
         self.answers: dict[int, str] = {}
+        self.timings: dict[int, dict[str, int]] = {}
+        # Timeline of the turn in progress, None between turns.
+        self._timeline: TurnTimeline | None = None
         self.room = room
+        self._channel = DataChannel(room)
 
         # Accumulates all transcript segments for the current question.
         self._transcript_parts: list[str] = []
@@ -54,29 +161,104 @@ class InterviewAgent(Agent):
         # The listener ignores transcripts outside this window (e.g. during TTS).
         self._listening: bool = False
 
+        # Index of the question currently being asked, echoed on interim messages.
+        self._current_index: int = 0
+        # Latest non-final STT hypothesis for the segment being spoken.
+        self._interim_text: str = ""
+        # Last interim text actually published — used to skip duplicates.
+        self._last_interim_sent: str = ""
+        self._last_interim_at: float = 0.0
+        # Pending throttled publish, if any. Only one is ever scheduled.
+        self._interim_task: asyncio.Task | None = None
+
     # ------------------------------------------------------------------
     # STT listener — attached once for the whole session lifetime
     # ------------------------------------------------------------------
 
     def _on_transcript(self, event) -> None:
         """
-        Called by AgentSession whenever a final user transcript is ready.
-        Appends to the running transcript and signals the collect loop.
+        Called by AgentSession whenever a user transcript is ready.
+        Final segments are appended to the running transcript and signal the
+        collect loop. Interim hypotheses are only forwarded to the frontend
+        (throttled) and never become part of the answer.
         Ignored if we're not in a listening window (e.g. during TTS playback).
         """
         if not self._listening:
             return
+
+        text = (getattr(event, "transcript", "") or "").strip()
+        if text and self._timeline:
+            self._timeline.mark("first_transcript", first_only=True)
+
         if not getattr(event, "is_final", True):
+            self._interim_text = text
+            self._schedule_interim()
             return
 
-        text = (getattr(event, "transcript", "") or "").strip()
         if not text:
             return
 
         logger.debug("Transcript segment: %r", text)
+        if self._timeline:
+            self._timeline.mark("last_transcript")
         self._transcript_parts.append(text)
         self._transcript_event.set()
 
+        self._interim_text = ""
+        self._schedule_interim()
+
+    # ------------------------------------------------------------------
+    # Interim transcript streaming
+    # ------------------------------------------------------------------
+
+    def _schedule_interim(self) -> None:
+        """
+        Make sure an interim publish is pending. If one is already scheduled
+        it will pick up the latest text when it fires, so nothing else to do.
+        """
+        if self._interim_task is not None and not self._interim_task.done():
+            return
+        self._interim_task = asyncio.create_task(self._flush_interim())
+
+    async def _flush_interim(self) -> None:
+        """
+        Publish the current live transcript (final segments + latest
+        hypothesis) at most once per INTERIM_PUBLISH_INTERVAL, and only
+        when it differs from what the frontend already has. Loops until the
+        published text is current: hypotheses arriving while a publish is
+        in flight find this task still running and leave it to us.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            delay = self._last_interim_at + INTERIM_PUBLISH_INTERVAL - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            if not self._listening:
+                return
+
+            text = " ".join([*self._transcript_parts, self._interim_text]).strip()
+            if text == self._last_interim_sent:
+                return
+
+            self._last_interim_sent = text
+            self._last_interim_at = loop.time()
+            await self._publish({
+                "type": "interim_transcript",
+                "index": self._current_index,
+                "text": text,
+            })
+
+    def _on_agent_state(self, event) -> None:
+        """Marks the first audible frame of the question being asked."""
+        if self._timeline and getattr(event, "new_state", None) == "speaking":
+            self._timeline.mark("tts_first_audio", first_only=True)
+
+    def _cancel_interim(self) -> None:
+        if self._interim_task is not None and not self._interim_task.done():
+            self._interim_task.cancel()
+        self._interim_task = None
+
     # ------------------------------------------------------------------
     # Per-question answer collection
     # ------------------------------------------------------------------
@@ -100,6 +282,8 @@ class InterviewAgent(Agent):
         # Reset state for this question
         self._transcript_parts = []
         self._transcript_event.clear()
+        self._interim_text = ""
+        self._last_interim_sent = ""
 
         # Step 1: wait for TTS to finish playing before we start listening.
         # This prevents the microphone echo of the agent's own voice being
@@ -108,6 +292,8 @@ class InterviewAgent(Agent):
 
         # Step 2: open the listening window
         self._listening = True
+        if self._timeline:
+            self._timeline.mark("listen_open")
 
         try:
             # Wait for the first segment — bail if they never say anything
@@ -132,6 +318,9 @@ class InterviewAgent(Agent):
 
         finally:
             self._listening = False
+            self._cancel_interim()
+            if self._timeline:
+                self._timeline.mark("silence_cutoff")
 
         # Step 4: join all captured segments into one answer string
         full_answer = " ".join(self._transcript_parts).strip()
@@ -148,20 +337,25 @@ class InterviewAgent(Agent):
 
         # Attach the transcript listener once, for the whole session
         self.session.on("user_input_transcribed", self._on_transcript)
+        self.session.on("agent_state_changed", self._on_agent_state)
 
         try:
-            for i, qa in enumerate(self.questions):
+            i = 0
+            qa = await self.feed.get(0)
+            while qa is not None:
                 qa_id = qa["qa_id"]
                 question_text = qa["question"]
-                is_last = i == len(self.questions) - 1
 
-                logger.info("Question %d/%d (qa_id=%d)", i + 1, len(self.questions), qa_id)
+                logger.info("Question %d (qa_id=%d)", i + 1, qa_id)
+                self._current_index = i
+                self._timeline = TurnTimeline()
 
                 # Tell the frontend which question is active
                 await self._publish({"type": "question_index", "index": i})
 
                 # Speak the question — say() goes straight to TTS, skips LLM
                 await self.session.say(question_text, allow_interruptions=False)
+                self._timeline.mark("tts_end")
 
                 # Tell the frontend the agent has finished speaking
                 await self._publish({"type": "question_asked"})
@@ -169,17 +363,23 @@ class InterviewAgent(Agent):
                 # Collect the candidate's spoken answer
                 answer = await self._collect_answer()
                 self.answers[qa_id] = answer
+                self.timings[qa_id] = self._timeline.as_dict()
+                self._timeline = None
 
                 logger.info("Answer captured for qa_id=%d: %r", qa_id, answer)
+                logger.debug("Turn timings for qa_id=%d: %r", qa_id, self.timings[qa_id])
 
                 # Send the captured answer to the frontend
                 await self._publish({
                     "type": "answer_captured",
                     "qa_id": qa_id,
                     "answer": answer,
-                })
+                    "timings": self.timings[qa_id],
+                }, critical=True)
 
-                if not is_last:
+                i += 1
+                qa = await self.feed.get(i)
+                if qa is not None:
                     # Brief scripted bridge — no LLM, no improvisation
                     await self.session.say("Moving to the next question.", allow_interruptions=False)
                 else:
@@ -192,25 +392,33 @@ class InterviewAgent(Agent):
                     await self._publish({
                         "type": "interview_complete",
                         "answers": [
-                            {"qa_id": k, "answer": v}
+                            {"qa_id": k, "answer": v, "timings": self.timings.get(k, {})}
                             for k, v in self.answers.items()
                         ],
-                    })
+                    }, critical=True)
+                    if not await self._channel.drain(DELIVERY_TIMEOUT):
+                        logger.warning("Frontend did not acknowledge every answer.")
         finally:
             # Always detach the listener — even if we crash mid-interview
             self.session.off("user_input_transcribed", self._on_transcript)
+            self.session.off("agent_state_changed", self._on_agent_state)
+            self._channel.close()
 
     # ------------------------------------------------------------------
     # Helper
     # ------------------------------------------------------------------
 
-    async def _publish(self, payload: dict) -> None:
-        """Publish a JSON message to the 'interview' data channel."""
+    async def _publish(self, payload: dict, *, critical: bool = False) -> None:
+        """
+        Publish a message to the 'interview' data channel (see protocol.py).
+        Critical messages are retransmitted until the frontend acks them.
+        """
+        data = {k: v for k, v in payload.items() if k != "type"}
+        started = time.perf_counter()
         try:
-            await self.room.local_participant.publish_data(
-                json.dumps(payload).encode(),
-                topic="interview",
-            )
+            await self._channel.send(payload["type"], data or None, critical=critical)
+            if self._timeline:
+                self._timeline.record_publish(time.perf_counter() - started)
         except Exception:
             logger.exception("Failed to publish data: %r", payload)
 
@@ -219,42 +427,62 @@ class InterviewAgent(Agent):
 # LiveKit entrypoint
 # ----------------------------------------------------------------------
 
-async def entrypoint(ctx: JobContext) -> None:
-    await ctx.connect(auto_subscribe=AutoSubscribe.AUDIO_ONLY)
+def prewarm(proc: JobProcess) -> None:
+    """Load the VAD model once per worker process, before any job is assigned."""
+    if VAD_BATCHING:
+        try:
+            from .batched_vad import shared_vad
+        except ImportError:  # run as a script: python agent.py
+            from batched_vad import shared_vad
+        proc.userdata["vad"] = shared_vad()
+    else:
+        proc.userdata["vad"] = silero.VAD.load()
+
+
+def build_session(voice: str, vad=None) -> AgentSession:
+    """Build the production AgentSession (Silero VAD + OpenAI STT/TTS)."""
+    return AgentSession(
+        vad=vad or silero.VAD.load(),
+        stt=openai.STT(),
+        # LLM is required by AgentSession but we instruct it to stay silent.
+        # It will never be triggered because we never call generate_reply().
+        llm=openai.LLM(temperature=0),
+        tts=openai.TTS(voice=voice),
+        # Disable automatic turn-taking so the LLM never auto-fires
+        # after VAD detects the user has stopped speaking.
+        allow_interruptions=False,
+    )
 
-    raw_metadata = ctx.room.metadata or "{}"
-    try:
-        metadata = json.loads(raw_metadata)
-    except json.JSONDecodeError:
-        logger.warning("Could not parse room metadata — using defaults.")
-        metadata = {}
 
-    questions: list[dict] = metadata.get("questions", [])
-    voice: str = metadata.get("voice", "alloy")
+async def run_interview(ctx: JobContext, session_factory=build_session) -> None:
+    """
+    Run one interview job. `session_factory(voice)` builds the AgentSession,
+    so alternative plugin stacks (e.g. the load-test stubs) can be swapped in
+    without touching the interview flow.
 
-    if not questions:
-        logger.error("No questions in room metadata — aborting job.")
-        return
+    The room is created when the interview starts, so the job usually begins
+    while questions are still being generated; they are picked up from room
+    metadata updates (see QuestionFeed).
+    """
+    await ctx.connect(auto_subscribe=AutoSubscribe.AUDIO_ONLY)
+    feed = QuestionFeed(ctx.room)
 
+    voice = feed.voice
     if voice not in VALID_VOICES:
         logger.warning("Unknown voice %r — falling back to 'alloy'.", voice)
         voice = "alloy"
 
-    logger.info("Starting interview: voice=%r, %d question(s).", voice, len(questions))
+    # Build the session (loading models) while waiting for the candidate to join.
+    session = session_factory(voice)
+    await ctx.wait_for_participant()
 
-    agent = InterviewAgent(questions=questions, room=ctx.room)
+    if await feed.get(0) is None:
+        logger.error("No questions in room metadata — aborting job.")
+        return
 
-    session = AgentSession(
-        vad=silero.VAD.load(),
-        stt=openai.STT(),
-        # LLM is required by AgentSession but we instruct it to stay silent.
-        # It will never be triggered because we never call generate_reply().
-        llm=openai.LLM(temperature=0),
-        tts=openai.TTS(voice=voice),
-        # Disable automatic turn-taking so the LLM never auto-fires
-        # after VAD detects the user has stopped speaking.
-        allow_interruptions=False,
-    )
+    logger.info("Starting interview: voice=%r, %d question(s) so far.", voice, len(feed.questions))
+
+    agent = InterviewAgent(feed=feed, room=ctx.room)
 
     await session.start(
         room=ctx.room,
@@ -263,5 +491,15 @@ async def entrypoint(ctx: JobContext) -> None:
     )
 
 
+async def entrypoint(ctx: JobContext) -> None:
+    await run_interview(ctx, lambda voice: build_session(voice, ctx.proc.userdata.get("vad")))
+
+
 if __name__ == "__main__":
-    cli.run_app(WorkerOptions(entrypoint_fnc=entrypoint))
\ No newline at end of file
+    cli.run_app(WorkerOptions(
+        entrypoint_fnc=entrypoint,
+        prewarm_fnc=prewarm,
+        job_executor_type=JobExecutorType.THREAD if VAD_BATCHING else JobExecutorType.PROCESS,
+        # Empty: automatic dispatch to every new room. Must match the backend's LIVEKIT_AGENT_NAME.
+        agent_name=config("LIVEKIT_AGENT_NAME", default=""),
+    ))
@@ -0,0 +1,183 @@
+"""
+Silero VAD with inference batched across every session of a worker process.
+
+The stock plugin runs one ONNX call per 32 ms window per session. Here all
+streams hand their windows to one BatchedInference thread, which gathers
+them for up to BATCH_WINDOW seconds (or until every active stream has
+submitted), runs a single batched call and fans the results back out.
+
+Batching only pays off when sessions share a process, i.e. with the
+worker's THREAD job executor (see agent.py, VAD_BATCHING).
+"""
+import asyncio
+import concurrent.futures
+import logging
+import queue
+import threading
+import time
+import weakref
+
+import numpy as np
+from livekit.plugins.silero.vad import VAD as SileroVAD
+from livekit.plugins.silero.vad import VADStream as SileroVADStream
+
+logger = logging.getLogger("interview-agent")
+
+# Longest a window waits for others to join its batch.
+BATCH_WINDOW = 0.010
+MAX_BATCH = 128
+STATE_SIZE = 128
+
+
+class BatchedInference:
+    """One thread running the Silero session on batches of windows from many streams."""
+
+    def __init__(self, session, sample_rate: int, max_wait: float = BATCH_WINDOW, max_batch: int = MAX_BATCH):
+        self._session = session
+        self._sr = np.array(sample_rate, dtype=np.int64)
+        self.window_size = 512 if sample_rate == 16000 else 256
+        self.context_size = 64 if sample_rate == 16000 else 32
+        self.max_wait = max_wait
+        self.max_batch = max_batch
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._active = 0
+        self._lock = threading.Lock()
+        threading.Thread(target=self._run, name="vad-batcher", daemon=True).start()
+
+    def register(self) -> None:
+        with self._lock:
+            self._active += 1
+
+    def unregister(self) -> None:
+        with self._lock:
+            self._active -= 1
+
+    def submit(self, model: "BatchedWindowModel", window: np.ndarray) -> concurrent.futures.Future:
+        future = concurrent.futures.Future()
+        self._queue.put((model, window.copy(), future))
+        return future
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            # Each stream has at most one window in flight, so once every active
+            # stream is in the batch there is nothing left to wait for.
+            while len(batch) < min(self.max_batch, self._active):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self.infer(batch)
+
+    def infer(self, batch: list) -> None:
+        size, ctx = len(batch), self.context_size
+        inputs = np.empty((size, ctx + self.window_size), dtype=np.float32)
+        state = np.empty((2, size, STATE_SIZE), dtype=np.float32)
+        for i, (model, window, _) in enumerate(batch):
+            inputs[i, :ctx] = model.context
+            inputs[i, ctx:] = window
+            state[:, i, :] = model.state
+
+        try:
+            output, new_state = self._session.run(None, {"input": inputs, "state": state, "sr": self._sr})
+        except Exception as exc:
+            logger.exception("Batched VAD inference failed (batch of %d).", size)
+            for _, _, future in batch:
+                future.set_exception(exc)
+            return
+
+        for i, (model, _, future) in enumerate(batch):
+            model.context = inputs[i, -ctx:].copy()
+            model.state = new_state[:, i, :].copy()
+            future.set_result(float(output[i, 0]))
+
+
+class BatchedWindowModel:
+    """Per-stream recurrent state; a drop-in for the plugin's OnnxModel."""
+
+    def __init__(self, batcher: BatchedInference, sample_rate: int):
+        self._batcher = batcher
+        self.sample_rate = sample_rate
+        self.window_size_samples = batcher.window_size
+        self.context_size = batcher.context_size
+        self.reset()
+        batcher.register()
+        self._release = weakref.finalize(self, batcher.unregister)
+
+    def close(self) -> None:
+        """Stop counting this stream as active (also done on garbage collection)."""
+        self._release()
+
+    def reset(self) -> None:
+        self.context = np.zeros(self.context_size, dtype=np.float32)
+        self.state = np.zeros((2, STATE_SIZE), dtype=np.float32)
+
+    def submit(self, window: np.ndarray) -> concurrent.futures.Future:
+        return self._batcher.submit(self, window)
+
+    def __call__(self, window: np.ndarray) -> float:
+        return self.submit(window).result()
+
+
+class _BatchingLoop:
+    """
+    Event loop proxy given to the plugin's VADStream: its
+    `run_in_executor(None, model, window)` goes to the batcher instead of a
+    thread that would block on the result. Everything else is the real loop.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+
+    def run_in_executor(self, executor, fn, *args):
+        if isinstance(fn, BatchedWindowModel):
+            return asyncio.wrap_future(fn.submit(*args), loop=self._loop)
+        return self._loop.run_in_executor(executor, fn, *args)
+
+    def __getattr__(self, name):
+        return getattr(self._loop, name)
+
+
+class BatchedVADStream(SileroVADStream):
+    def __init__(self, vad, opts, model: BatchedWindowModel):
+        super().__init__(vad, opts, model)
+        self._loop = _BatchingLoop(self._loop)
+
+    async def _main_task(self) -> None:
+        try:
+            await super()._main_task()
+        finally:
+            self._model.close()
+
+
+class BatchedVAD(SileroVAD):
+    """Silero VAD whose streams share one BatchedInference. Build with BatchedVAD.load(...)."""
+
+    def __init__(self, *, session, opts):
+        super().__init__(session=session, opts=opts)
+        self._batcher = BatchedInference(session, opts.sample_rate)
+
+    def stream(self) -> BatchedVADStream:
+        stream = BatchedVADStream(self, self._opts, BatchedWindowModel(self._batcher, self._opts.sample_rate))
+        self._streams.add(stream)
+        return stream
+
+
+_shared: BatchedVAD | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_vad() -> BatchedVAD:
+    """The process-wide BatchedVAD, loaded on first use."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = BatchedVAD.load()
+            logger.info("Loaded batched Silero VAD (window %.0f ms).", BATCH_WINDOW * 1000)
+        return _shared
+
@@ -0,0 +1,490 @@
+"""
+Synthetic-participant load test for the interview agent.
+
+Runs N fake candidates against a local LiveKit dev server
+(`livekit-server --dev`), each in its own `interview-<id>` room with
+metadata shaped like the one `livekit_token` provisions. The agent worker is
+started as a subprocess with stub STT/TTS plugins, so no OpenAI calls are made.
+
+Usage (from back/):
+
+    python -m src.livekit.loadtest run --concurrency 1,5,10,20
+    python -m src.livekit.loadtest run --concurrency 10 --audio answer.wav
+    python -m src.livekit.loadtest worker          # stub worker only
+
+Pre-recorded answers (16-bit mono WAV) are strongly recommended — the
+synthetic voice is only good enough to trip Silero VAD most of the time.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import wave
+from dataclasses import dataclass, field
+
+import numpy as np
+import psutil
+
+os.environ.setdefault("LIVEKIT_URL", "ws://localhost:7880")
+os.environ.setdefault("LIVEKIT_API_KEY", "devkey")
+os.environ.setdefault("LIVEKIT_API_SECRET", "secret")
+os.environ.setdefault("OPENAI_API_KEY", "loadtest-stub")
+
+from livekit import api, rtc
+
+from .protocol import TOPIC, Decoder, encode_ack
+
+SAMPLE_RATE = 48000
+FRAME_MS = 10
+SAMPLES_PER_FRAME = SAMPLE_RATE * FRAME_MS // 1000
+
+# An answer_captured arriving later than this after the candidate stopped
+# speaking counts as late. Mirrors the agent's SILENCE_THRESHOLD plus slack.
+DEFAULT_LATE_AFTER = 2.5 + 1.5
+
+QUESTION_BANK = [
+    "Tell me about a project you are proud of?",
+    "How do you handle disagreements within your team?",
+    "Describe a difficult bug you tracked down recently?",
+    "How do you prioritise competing deadlines?",
+    "Where do you see yourself growing next?",
+]
+
+
+# ----------------------------------------------------------------------
+# Stub worker
+# ----------------------------------------------------------------------
+
+def build_stub_session(voice: str):
+    from livekit.agents import AgentSession
+    from livekit.plugins import openai, silero
+
+    from .stubs import StubSTT, StubTTS
+
+    return AgentSession(
+        vad=silero.VAD.load(),
+        stt=StubSTT(),
+        # Never invoked — the interview flow only uses session.say().
+        llm=openai.LLM(temperature=0),
+        tts=StubTTS(),
+        allow_interruptions=False,
+    )
+
+
+async def stub_entrypoint(ctx) -> None:
+    from .agent import run_interview
+
+    await run_interview(ctx, session_factory=build_stub_session)
+
+
+def run_worker() -> None:
+    from livekit.agents import WorkerOptions, cli
+
+    sys.argv = [sys.argv[0], "start"]
+    cli.run_app(WorkerOptions(entrypoint_fnc=stub_entrypoint))
+
+
+# ----------------------------------------------------------------------
+# Candidate audio
+# ----------------------------------------------------------------------
+
+def load_wav(path: str) -> np.ndarray:
+    with wave.open(path, "rb") as wav:
+        if wav.getsampwidth() != 2 or wav.getnchannels() != 1:
+            raise ValueError("Answer audio must be 16-bit mono WAV.")
+        rate = wav.getframerate()
+        pcm = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+
+    if rate != SAMPLE_RATE:
+        positions = np.linspace(0, len(pcm) - 1, int(len(pcm) * SAMPLE_RATE / rate))
+        pcm = np.interp(positions, np.arange(len(pcm)), pcm).astype(np.int16)
+    return pcm
+
+
+def synthetic_speech(seconds: float) -> np.ndarray:
+    """Voiced, syllable-modulated harmonic signal — a crude speech imitation."""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    f0 = 120 + 20 * np.sin(2 * np.pi * 0.7 * t)
+    phase = 2 * np.pi * np.cumsum(f0) / SAMPLE_RATE
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 12))
+    syllables = 0.5 * (1 + np.sin(2 * np.pi * 4 * t)) ** 2
+    signal = voiced * syllables
+    return (signal / np.abs(signal).max() * 9000).astype(np.int16)
+
+
+# ----------------------------------------------------------------------
+# Fake candidate
+# ----------------------------------------------------------------------
+
+@dataclass
+class TurnResult:
+    index: int
+    tts_seconds: float | None = None        # question_index → question_asked
+    capture_seconds: float | None = None    # end of candidate speech → answer_captured
+    turn_seconds: float | None = None       # question_index → answer_captured
+
+
+@dataclass
+class SessionResult:
+    room: str
+    expected_turns: int
+    turns: dict[int, TurnResult] = field(default_factory=dict)
+    completed: bool = False
+    # Questions whose question_index never arrived (counted once the session ends).
+    dropped: int = 0
+    late: int = 0
+    error: str | None = None
+
+
+class FakeCandidate:
+    def __init__(self, room_name: str, questions: list[dict], answer_pcm: np.ndarray, late_after: float):
+        self.room_name = room_name
+        self.questions = questions
+        self.answer_pcm = answer_pcm
+        self.late_after = late_after
+        self.result = SessionResult(room=room_name, expected_turns=len(questions))
+
+        self._room = rtc.Room()
+        self._source = rtc.AudioSource(SAMPLE_RATE, 1)
+        self._speech: asyncio.Queue[np.ndarray] = asyncio.Queue()
+        self._done = asyncio.Event()
+        self._question_started: dict[int, float] = {}
+        self._current_index: int | None = None
+        self._answer_ended_at: float | None = None
+        self._seen_indexes: set[int] = set()
+        self._decoder = Decoder()
+        self._acks: set[asyncio.Task] = set()
+
+    async def run(self, url: str, token: str, timeout: float) -> SessionResult:
+        self._room.on("data_received", self._on_data)
+        try:
+            await self._room.connect(url, token)
+            track = rtc.LocalAudioTrack.create_audio_track("mic", self._source)
+            await self._room.local_participant.publish_track(
+                track,
+                rtc.TrackPublishOptions(source=rtc.TrackSource.SOURCE_MICROPHONE),
+            )
+            mic = asyncio.create_task(self._mic_loop())
+            try:
+                await asyncio.wait_for(self._done.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                self.result.error = "timeout"
+            finally:
+                mic.cancel()
+        except Exception as exc:
+            self.result.error = repr(exc)
+        finally:
+            await self._room.disconnect()
+
+        self.result.dropped = self.result.expected_turns - len(self._seen_indexes)
+        return self.result
+
+    async def _mic_loop(self) -> None:
+        """Publish real-time audio: queued answers, silence otherwise."""
+        silence = np.zeros(SAMPLES_PER_FRAME, dtype=np.int16)
+        pending: np.ndarray | None = None
+        offset = 0
+
+        while True:
+            if pending is None and not self._speech.empty():
+                pending, offset = self._speech.get_nowait(), 0
+
+            if pending is not None:
+                chunk = pending[offset:offset + SAMPLES_PER_FRAME]
+                offset += SAMPLES_PER_FRAME
+                if offset >= len(pending):
+                    pending = None
+                    self._answer_ended_at = time.perf_counter()
+                if len(chunk) < SAMPLES_PER_FRAME:
+                    chunk = np.pad(chunk, (0, SAMPLES_PER_FRAME - len(chunk)))
+            else:
+                chunk = silence
+
+            frame = rtc.AudioFrame(chunk.tobytes(), SAMPLE_RATE, 1, SAMPLES_PER_FRAME)
+            await self._source.capture_frame(frame)
+
+    def _on_data(self, packet: rtc.DataPacket) -> None:
+        if packet.topic != TOPIC:
+            return
+        data, ack = self._decoder.feed(packet.data)
+        if ack is not None:
+            task = asyncio.create_task(
+                self._room.local_participant.publish_data(encode_ack(ack), reliable=True, topic=TOPIC)
+            )
+            self._acks.add(task)
+            task.add_done_callback(self._acks.discard)
+        if data is None:
+            return
+
+        now = time.perf_counter()
+        kind = data.get("type")
+
+        if kind == "question_index":
+            index = data["index"]
+            if index in self._seen_indexes:
+                return
+            self._seen_indexes.add(index)
+            self._current_index = index
+            self._question_started[index] = now
+            self.result.turns[index] = TurnResult(index=index)
+
+        elif kind == "question_asked" and self._current_index is not None:
+            turn = self.result.turns[self._current_index]
+            turn.tts_seconds = now - self._question_started[self._current_index]
+            self._answer_ended_at = None
+            self._speech.put_nowait(self.answer_pcm)
+
+        elif kind == "answer_captured" and self._current_index is not None:
+            turn = self.result.turns[self._current_index]
+            turn.turn_seconds = now - self._question_started[self._current_index]
+            if self._answer_ended_at is not None:
+                turn.capture_seconds = now - self._answer_ended_at
+                if turn.capture_seconds > self.late_after:
+                    self.result.late += 1
+            else:
+                # Captured before the candidate finished (or the timeout fired).
+                turn.capture_seconds = 0.0
+                self.result.late += 1
+
+        elif kind == "interview_complete":
+            self.result.completed = True
+            self._done.set()
+
+
+# ----------------------------------------------------------------------
+# Resource sampling
+# ----------------------------------------------------------------------
+
+class ProcessSampler:
+    """Samples CPU% and RSS of the worker process tree once per second."""
+
+    def __init__(self, pid: int):
+        self._root = psutil.Process(pid)
+        self.cpu: list[float] = []
+        self.rss: list[int] = []
+        self._task: asyncio.Task | None = None
+
+    def _tree(self) -> list[psutil.Process]:
+        try:
+            return [self._root, *self._root.children(recursive=True)]
+        except psutil.NoSuchProcess:
+            return []
+
+    async def _loop(self) -> None:
+        for proc in self._tree():
+            proc.cpu_percent(None)
+        while True:
+            await asyncio.sleep(1.0)
+            cpu = rss = 0
+            for proc in self._tree():
+                try:
+                    cpu += proc.cpu_percent(None)
+                    rss += proc.memory_info().rss
+                except psutil.NoSuchProcess:
+                    continue
+            self.cpu.append(cpu)
+            self.rss.append(rss)
+
+    def start(self) -> None:
+        self.cpu.clear()
+        self.rss.clear()
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
+# ----------------------------------------------------------------------
+# Stages
+# ----------------------------------------------------------------------
+
+def _room_metadata(question_count: int, base_id: int, voice: str) -> dict:
+    """Same shape as the metadata built by livekit_token."""
+    return {
+        "questions": [
+            {"qa_id": base_id * 100 + i, "question": QUESTION_BANK[i % len(QUESTION_BANK)]}
+            for i in range(question_count)
+        ],
+        "voice": voice,
+        "complete": True,
+    }
+
+
+def _percentile(values: list[float], pct: float) -> float | None:
+    if not values:
+        return None
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[int(pct) - 1]
+
+
+async def run_stage(args, concurrency: int, stage: int, answer_pcm: np.ndarray, sampler) -> dict:
+    url = os.environ["LIVEKIT_URL"]
+    key = os.environ["LIVEKIT_API_KEY"]
+    secret = os.environ["LIVEKIT_API_SECRET"]
+
+    rooms: list[tuple[str, dict]] = []
+    base = args.first_interview_id + stage * 1000
+    for n in range(concurrency):
+        interview_id = base + n
+        rooms.append((f"interview-{interview_id}", _room_metadata(args.questions, interview_id, args.voice)))
+
+    async with api.LiveKitAPI(url=url, api_key=key, api_secret=secret) as lk:
+        await asyncio.gather(*(
+            lk.room.create_room(api.CreateRoomRequest(
+                name=name,
+                metadata=json.dumps(metadata),
+                empty_timeout=60,
+                max_participants=2,
+            ))
+            for name, metadata in rooms
+        ))
+
+        candidates = [
+            FakeCandidate(name, metadata["questions"], answer_pcm, args.late_after)
+            for name, metadata in rooms
+        ]
+        tokens = [
+            api.AccessToken(key, secret)
+            .with_identity(f"loadtest-{n}")
+            .with_grants(api.VideoGrants(room_join=True, room=name))
+            .to_jwt()
+            for n, (name, _) in enumerate(rooms)
+        ]
+
+        if sampler:
+            sampler.start()
+        started = time.perf_counter()
+        results = await asyncio.gather(*(
+            c.run(url, t, args.timeout) for c, t in zip(candidates, tokens)
+        ))
+        elapsed = time.perf_counter() - started
+        if sampler:
+            await sampler.stop()
+
+        await asyncio.gather(
+            *(lk.room.delete_room(api.DeleteRoomRequest(room=name)) for name, _ in rooms),
+            return_exceptions=True,
+        )
+
+    turns = [t for r in results for t in r.turns.values()]
+    turn_seconds = [t.turn_seconds for t in turns if t.turn_seconds is not None]
+    capture_seconds = [t.capture_seconds for t in turns if t.capture_seconds is not None]
+    tts_seconds = [t.tts_seconds for t in turns if t.tts_seconds is not None]
+
+    report = {
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 2),
+        "completed": sum(r.completed for r in results),
+        "errors": [r.error for r in results if r.error],
+        "turns": len(turn_seconds),
+        "dropped": sum(r.dropped for r in results),
+        "late": sum(r.late for r in results),
+        "turn_p50_s": _percentile(turn_seconds, 50),
+        "turn_p95_s": _percentile(turn_seconds, 95),
+        "tts_p50_s": _percentile(tts_seconds, 50),
+        "capture_p50_s": _percentile(capture_seconds, 50),
+        "capture_p95_s": _percentile(capture_seconds, 95),
+    }
+    if sampler and sampler.cpu:
+        report["cpu_pct_per_session"] = round(statistics.mean(sampler.cpu) / concurrency, 1)
+        report["cpu_pct_peak"] = round(max(sampler.cpu), 1)
+        report["rss_mb_per_session"] = round(max(sampler.rss) / concurrency / 2**20, 1)
+    return report
+
+
+def _format(value) -> str:
+    if value is None:
+        return "-"
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value)
+
+
+def print_report(reports: list[dict]) -> None:
+    columns = [
+        "concurrency", "completed", "turns", "dropped", "late",
+        "turn_p50_s", "turn_p95_s", "tts_p50_s", "capture_p50_s", "capture_p95_s",
+        "cpu_pct_per_session", "rss_mb_per_session",
+    ]
+    widths = [max(len(c), 8) for c in columns]
+    print("  ".join(c.rjust(w) for c, w in zip(columns, widths)))
+    for report in reports:
+        print("  ".join(_format(report.get(c)).rjust(w) for c, w in zip(columns, widths)))
+        for error in report["errors"]:
+            print(f"    ! {error}")
+
+
+async def run_load_test(args) -> list[dict]:
+    if args.audio:
+        answer_pcm = load_wav(args.audio)
+    else:
+        answer_pcm = synthetic_speech(args.answer_seconds)
+
+    worker = None
+    sampler = None
+    if args.worker_pid:
+        sampler = ProcessSampler(args.worker_pid)
+    elif not args.no_worker:
+        worker = subprocess.Popen([sys.executable, "-m", "src.livekit.loadtest", "worker"])
+        sampler = ProcessSampler(worker.pid)
+        # Give the worker time to load VAD and register with the server.
+        await asyncio.sleep(args.worker_warmup)
+
+    reports = []
+    try:
+        for stage, concurrency in enumerate(args.concurrency):
+            report = await run_stage(args, concurrency, stage, answer_pcm, sampler)
+            reports.append(report)
+            print_report([report])
+    finally:
+        if worker is not None:
+            worker.terminate()
+            worker.wait(timeout=30)
+
+    print()
+    print_report(reports)
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump(reports, fh, indent=2)
+    return reports
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("worker", help="Run the interview agent worker with stub STT/TTS.")
+
+    run = sub.add_parser("run", help="Run the load test.")
+    run.add_argument("--concurrency", type=lambda s: [int(x) for x in s.split(",")], default=[1, 5, 10])
+    run.add_argument("--questions", type=int, default=3)
+    run.add_argument("--voice", default="alloy")
+    run.add_argument("--audio", help="16-bit mono WAV file used as every answer.")
+    run.add_argument("--answer-seconds", type=float, default=4.0, help="Length of the synthetic answer.")
+    run.add_argument("--timeout", type=float, default=300.0, help="Per-session timeout in seconds.")
+    run.add_argument("--late-after", type=float, default=DEFAULT_LATE_AFTER)
+    run.add_argument("--first-interview-id", type=int, default=900000)
+    run.add_argument("--worker-warmup", type=float, default=5.0)
+    run.add_argument("--worker-pid", type=int, help="Sample an already running worker instead of spawning one.")
+    run.add_argument("--no-worker", action="store_true", help="Don't spawn a worker (and don't sample resources).")
+    run.add_argument("--json", help="Write the stage reports to this file.")
+
+    args = parser.parse_args()
+    if args.command == "worker":
+        run_worker()
+    else:
+        asyncio.run(run_load_test(args))
+
+
+if __name__ == "__main__":
+    main()
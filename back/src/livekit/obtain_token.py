@@ -1,65 +1,109 @@
-from rest_framework.decorators import api_view, permission_classes
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Prefetch
+from livekit.api import AccessToken, VideoGrants
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from livekit.api import AccessToken, VideoGrants, LiveKitAPI
-from livekit.api import CreateRoomRequest
-from django.conf import settings
-from src.interview.models import Interview
-from asgiref.sync import async_to_sync
-import json
+from core.async_views import AsyncAPIView
+from src.interview.models import Interview, InterviewQA
+from .rooms import encode_metadata, ensure_room, interview_room_name
 
+# Minted tokens are valid for TOKEN_TTL and reused for TOKEN_CACHE_TTL,
+# so a reused token always has at least five minutes left to connect.
+TOKEN_TTL = timedelta(minutes=15)
+TOKEN_CACHE_TTL = 600
 
-@api_view(["GET"])
-@permission_classes([IsAuthenticated])
-def livekit_token(request):
-    interview_id = request.query_params.get("interview_id")
+METADATA_CACHE_TTL = 3600
 
-    try:
-        interview = Interview.objects.prefetch_related("qa_pairs__question").select_related("agent").get(
-            pk=interview_id,
-            user=request.user,
-        )
-    except Interview.DoesNotExist:
-        return Response({"detail": "Interview not found."}, status=404)
+# Set by InterviewStartView while questions are being generated.
+GENERATION_TTL = 300
+
+
+def generating_key(interview_id: int) -> str:
+    return f"interview:generating:{interview_id}"
 
-    questions = [
-        {"qa_id": qa.pk, "question": qa.question.text}
-        for qa in interview.qa_pairs.order_by("order")
-    ]
+
+def build_room_metadata(interview_id: int) -> tuple[str, bool]:
+    """Encoded room metadata for the interview, and whether its question list is final."""
+    interview = (
+        Interview.objects
+        .select_related("agent")
+        .prefetch_related(
+            Prefetch("qa_pairs", queryset=InterviewQA.objects.select_related("question").order_by("order"))
+        )
+        .get(pk=interview_id)
+    )
 
     # Bundle everything the LiveKit worker needs into room metadata.
-    # The worker reads this once on job start — no extra API calls needed.
-    metadata = {
-        "questions": questions,
-        "voice": interview.agent.voice if interview.agent else "alloy",
-    }
-
-    room_name = f"interview-{interview_id}"
-    identity  = f"user-{request.user.id}"
-
-    async def create_room():
-        async with LiveKitAPI(
-            url=settings.LIVEKIT_URL,
-            api_key=settings.LIVEKIT_API_KEY,
-            api_secret=settings.LIVEKIT_API_SECRET,
-        ) as lk:
-            await lk.room.create_room(
-                CreateRoomRequest(
-                    name=room_name,
-                    metadata=json.dumps(metadata),
-                    empty_timeout=300,
-                    max_participants=2,
-                )
-            )
-
-    async_to_sync(create_room)()
-
-    token = (
-        AccessToken(settings.LIVEKIT_API_KEY, settings.LIVEKIT_API_SECRET)
-        .with_identity(identity)
-        .with_name(request.user.email)
-        .with_grants(VideoGrants(room_join=True, room=room_name))
-        .to_jwt()
+    # Questions still being generated arrive later as metadata updates.
+    complete = (
+        interview.status != Interview.Status.PENDING
+        and cache.get(generating_key(interview.pk)) is None
     )
+    metadata = encode_metadata(
+        questions=[
+            {"qa_id": qa.pk, "question": qa.question.text}
+            for qa in interview.qa_pairs.all()
+        ],
+        voice=interview.agent.voice if interview.agent else "alloy",
+        complete=complete,
+    )
+    return metadata, complete
+
+
+async def get_room_metadata(interview: Interview) -> str:
+    """Room metadata for `interview`, cached (once complete) until the interview changes."""
+    key = f"livekit:metadata:{interview.pk}:{interview.updated_at.timestamp()}"
+    metadata = await cache.aget(key)
+    if metadata is None:
+        metadata, complete = await sync_to_async(build_room_metadata)(interview.pk)
+        if complete:
+            await cache.aset(key, metadata, METADATA_CACHE_TTL)
+    return metadata
+
+
+async def get_access_token(user, room_name: str) -> str:
+    key = f"livekit:token:{user.pk}:{room_name}"
+    token = await cache.aget(key)
+    if token is None:
+        token = (
+            AccessToken(settings.LIVEKIT_API_KEY, settings.LIVEKIT_API_SECRET)
+            .with_identity(f"user-{user.pk}")
+            .with_name(user.email)
+            .with_grants(VideoGrants(room_join=True, room=room_name))
+            .with_ttl(TOKEN_TTL)
+            .to_jwt()
+        )
+        await cache.aset(key, token, TOKEN_CACHE_TTL)
+    return token
+
+
+class LiveKitTokenView(AsyncAPIView):
+    permission_classes = [IsAuthenticated]
+
+    async def get(self, request):
+        interview_id = request.query_params.get("interview_id")
+
+        interview = await (
+            Interview.objects
+            .filter(pk=interview_id, user=request.user)
+            .only("pk", "updated_at")
+            .afirst()
+        )
+        if interview is None:
+            return Response({"detail": "Interview not found."}, status=404)
+
+        # The room normally exists already (InterviewStartView provisions it
+        # and keeps its metadata current); this only recreates a reaped one.
+        room_name = interview_room_name(interview.pk)
+        metadata = await get_room_metadata(interview)
+        await ensure_room(room_name, metadata, update=False)
+
+        token = await get_access_token(request.user, room_name)
+        return Response({"token": token})
+
 
-    return Response({"token": token})
\ No newline at end of file
+livekit_token = LiveKitTokenView.as_view()
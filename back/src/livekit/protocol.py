@@ -0,0 +1,194 @@
+"""
+Wire format of the `interview` data topic, version 1.
+
+Every message is one compact JSON envelope:
+
+    {"v": 1, "s": <seq>, "t": <type>, "d": <data>, "a": 1}
+
+`s` increases per sender, `a` asks the receiver for {"v": 1, "s": <seq>,
+"t": "ack"} and is only set on critical messages (captured answers, the
+final answer set). Critical messages are retransmitted until acknowledged,
+so receivers drop repeated sequence numbers but still ack them.
+
+Envelopes above MAX_PACKET are zlib-compressed, base64-encoded and split
+into "chunk" envelopes sharing the original sequence number:
+
+    {"v": 1, "s": <seq>, "t": "chunk", "d": {"i": <index>, "n": <count>, "z": <base64 part>}}
+
+The frontend decoder lives in frontend/src/api/agentProtocol.js.
+"""
+import asyncio
+import base64
+import binascii
+import itertools
+import json
+import logging
+import zlib
+
+logger = logging.getLogger("interview-agent")
+
+VERSION = 1
+TOPIC = "interview"
+
+# LiveKit drops reliable data packets above ~15 KiB; stay under it with
+# room for the chunk envelope.
+MAX_PACKET = 14 * 1024
+CHUNK_OVERHEAD = 96
+
+# First retransmission after ACK_TIMEOUT seconds, doubling up to ACK_RETRIES times.
+ACK_TIMEOUT = 1.0
+ACK_RETRIES = 5
+
+CHUNK = "chunk"
+ACK = "ack"
+
+
+def _dumps(value) -> bytes:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def encode(seq: int, kind: str, data=None, *, ack: bool = False) -> list[bytes]:
+    """The packets carrying one message: the envelope itself, or its chunks."""
+    envelope = {"v": VERSION, "s": seq, "t": kind}
+    if data is not None:
+        envelope["d"] = data
+    if ack:
+        envelope["a"] = 1
+
+    raw = _dumps(envelope)
+    if len(raw) <= MAX_PACKET:
+        return [raw]
+
+    packed = base64.b64encode(zlib.compress(raw, 6)).decode("ascii")
+    size = MAX_PACKET - CHUNK_OVERHEAD
+    parts = [packed[i:i + size] for i in range(0, len(packed), size)]
+    return [
+        _dumps({"v": VERSION, "s": seq, "t": CHUNK, "d": {"i": i, "n": len(parts), "z": part}})
+        for i, part in enumerate(parts)
+    ]
+
+
+def encode_ack(seq: int) -> bytes:
+    return _dumps({"v": VERSION, "s": seq, "t": ACK})
+
+
+class Decoder:
+    """Reassembles chunks and filters retransmissions on the receiving side."""
+
+    def __init__(self):
+        self._chunks: dict[int, dict[int, str]] = {}
+        self._seen: set[int] = set()
+
+    def feed(self, raw: bytes) -> tuple[dict | None, int | None]:
+        """
+        One packet in; (message, seq to acknowledge) out. The message is
+        `{"type": t, **d}`, or None while chunks are missing, for repeats
+        and for anything that is not a well-formed version 1 envelope.
+        """
+        try:
+            return self._feed(raw)
+        except (ValueError, KeyError, TypeError, binascii.Error, zlib.error):
+            logger.warning("Dropped a malformed %d-byte packet.", len(raw))
+            return None, None
+
+    def _feed(self, raw: bytes) -> tuple[dict | None, int | None]:
+        envelope = json.loads(raw)
+        if not isinstance(envelope, dict) or envelope.get("v") != VERSION:
+            return None, None
+
+        if envelope.get("t") == CHUNK:
+            chunk = envelope["d"]
+            parts = self._chunks.setdefault(envelope["s"], {})
+            parts[chunk["i"]] = chunk["z"]
+            if len(parts) < chunk["n"]:
+                return None, None
+            # Dropped even if it turns out corrupt, so a bad set can't pile up.
+            del self._chunks[envelope["s"]]
+            packed = "".join(parts[i] for i in range(chunk["n"]))
+            envelope = json.loads(zlib.decompress(base64.b64decode(packed, validate=True)))
+            if not isinstance(envelope, dict):
+                return None, None
+
+        ack = envelope["s"] if envelope.get("a") else None
+        if ack is not None:
+            if ack in self._seen:
+                return None, ack
+            self._seen.add(ack)
+        return {"type": envelope.get("t"), **(envelope.get("d") or {})}, ack
+
+
+class DataChannel:
+    """
+    Sends protocol messages from the local participant of `room`.
+
+    `send(..., critical=True)` returns once the packets are published;
+    retransmission runs in the background until the ack arrives, and
+    `drain()` waits for all outstanding acks (e.g. before the job ends).
+    """
+
+    def __init__(self, room, topic: str = TOPIC):
+        self._room = room
+        self._topic = topic
+        self._seq = itertools.count(1)
+        self._pending: dict[int, asyncio.Event] = {}
+        self._tasks: set[asyncio.Task] = set()
+        room.on("data_received", self._on_data)
+
+    def close(self) -> None:
+        self._room.off("data_received", self._on_data)
+        for task in self._tasks:
+            task.cancel()
+
+    async def send(self, kind: str, data=None, *, critical: bool = False) -> None:
+        seq = next(self._seq)
+        packets = encode(seq, kind, data, ack=critical)
+        if critical:
+            acked = self._pending[seq] = asyncio.Event()
+            task = asyncio.create_task(self._retransmit(seq, packets, acked))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        if len(packets) > 1:
+            logger.debug("Message %d (%s) split into %d chunks.", seq, kind, len(packets))
+        await self._publish(packets)
+
+    async def drain(self, timeout: float) -> bool:
+        """Wait for every critical message to be acknowledged (or given up on)."""
+        if not self._tasks:
+            return True
+        _, pending = await asyncio.wait(set(self._tasks), timeout=timeout)
+        return not pending
+
+    async def _publish(self, packets: list[bytes]) -> None:
+        for packet in packets:
+            await self._room.local_participant.publish_data(packet, reliable=True, topic=self._topic)
+
+    async def _retransmit(self, seq: int, packets: list[bytes], acked: asyncio.Event) -> None:
+        try:
+            for attempt in range(ACK_RETRIES + 1):
+                try:
+                    await asyncio.wait_for(acked.wait(), ACK_TIMEOUT * 2 ** attempt)
+                    return
+                except asyncio.TimeoutError:
+                    pass
+                if attempt == ACK_RETRIES:
+                    break
+                logger.info("No ack for message %d, retransmitting (attempt %d).", seq, attempt + 1)
+                try:
+                    await self._publish(packets)
+                except Exception:
+                    logger.exception("Retransmission of message %d failed.", seq)
+            logger.warning("Message %d was never acknowledged.", seq)
+        finally:
+            self._pending.pop(seq, None)
+
+    def _on_data(self, packet) -> None:
+        if packet.topic != self._topic:
+            return
+        try:
+            envelope = json.loads(packet.data)
+        except ValueError:
+            return
+        if isinstance(envelope, dict) and envelope.get("v") == VERSION and envelope.get("t") == ACK:
+            acked = self._pending.get(envelope.get("s"))
+            if acked is not None:
+                acked.set()
@@ -0,0 +1,180 @@
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+from livekit.api import (
+    CreateAgentDispatchRequest,
+    CreateRoomRequest,
+    DeleteRoomRequest,
+    ListRoomsRequest,
+    LiveKitAPI,
+    UpdateRoomMetadataRequest,
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds an empty room survives on the LiveKit server.
+ROOM_EMPTY_TIMEOUT = 300
+
+# How long we keep our "this room is provisioned" marker (and the digest of
+# the metadata we gave it). The marker alone does not prove the room still
+# exists: once a participant has left, LiveKit closes the room after its
+# departure timeout (~20 s), so ensure_room checks with the server first.
+PROVISIONED_TTL = ROOM_EMPTY_TIMEOUT - 30
+
+
+class _LiveKitPool:
+    """
+    One LiveKitAPI client (and its aiohttp connection pool) per process.
+
+    The client lives on a dedicated event loop thread, so it can be shared by
+    every request no matter which loop the caller runs on — the ASGI server
+    loop or a short-lived async_to_sync loop under WSGI.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._client: LiveKitAPI | None = None
+
+    def _start(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="livekit-api", daemon=True).start()
+                self._loop = loop
+        return self._loop
+
+    async def _client_on_loop(self) -> LiveKitAPI:
+        if self._client is None:
+            self._client = LiveKitAPI(
+                url=settings.LIVEKIT_URL,
+                api_key=settings.LIVEKIT_API_KEY,
+                api_secret=settings.LIVEKIT_API_SECRET,
+            )
+        return self._client
+
+    async def run(self, fn):
+        """Await `fn(client)` on the pool's loop and return its result."""
+        return await asyncio.wrap_future(self.submit(fn))
+
+    def submit(self, fn):
+        """Schedule `fn(client)` on the pool's loop without waiting; returns a concurrent Future."""
+        loop = self._start()
+
+        async def call():
+            return await fn(await self._client_on_loop())
+
+        return asyncio.run_coroutine_threadsafe(call(), loop)
+
+
+pool = _LiveKitPool()
+
+
+def interview_room_name(interview_id: int) -> str:
+    return f"interview-{interview_id}"
+
+
+def encode_metadata(questions: list[dict], voice: str, complete: bool) -> str:
+    """
+    Room metadata read by the agent worker. `complete` is False while
+    questions are still being generated; the agent then waits for
+    metadata updates carrying more of them.
+    """
+    return json.dumps({"questions": questions, "voice": voice, "complete": complete})
+
+
+def _room_key(room_name: str) -> str:
+    return f"livekit:room:{room_name}"
+
+
+def _metadata_digest(metadata: str) -> str:
+    return hashlib.sha1(metadata.encode()).hexdigest()
+
+
+async def _room_exists(room_name: str) -> bool:
+    response = await pool.run(lambda lk: lk.room.list_rooms(ListRoomsRequest(names=[room_name])))
+    return any(room.name == room_name for room in response.rooms)
+
+
+async def ensure_room(room_name: str, metadata: str, update: bool = True) -> None:
+    """
+    Create `room_name` with `metadata` unless we already provisioned it.
+    If the room exists with different metadata, only the metadata is updated
+    (unless `update` is False: then an existing room is left as it is).
+    """
+    key = _room_key(room_name)
+    digest = _metadata_digest(metadata)
+    provisioned = await cache.aget(key)
+    if provisioned is not None and not await _room_exists(room_name):
+        # Closed behind our back (e.g. the candidate left and is rejoining):
+        # recreate it, or LiveKit would auto-create it without our metadata.
+        provisioned = None
+
+    if provisioned == digest or (provisioned is not None and not update):
+        return
+
+    if provisioned is None:
+        room = await pool.run(lambda lk: lk.room.create_room(
+            CreateRoomRequest(
+                name=room_name,
+                metadata=metadata,
+                empty_timeout=ROOM_EMPTY_TIMEOUT,
+                max_participants=2,
+            )
+        ))
+        logger.info("Provisioned LiveKit room %s.", room_name)
+
+        if not update and room.metadata != metadata:
+            await cache.aset(key, _metadata_digest(room.metadata), PROVISIONED_TTL)
+            return
+
+    # create_room returns an already existing room untouched, so its metadata
+    # may be stale (e.g. provisioned by another process).
+    if provisioned is not None or room.metadata != metadata:
+        await pool.run(lambda lk: lk.room.update_room_metadata(
+            UpdateRoomMetadataRequest(room=room_name, metadata=metadata)
+        ))
+        logger.info("Updated metadata of LiveKit room %s.", room_name)
+
+    await cache.aset(key, digest, PROVISIONED_TTL)
+
+
+async def update_room_metadata(room_name: str, metadata: str) -> None:
+    """Replace the metadata of a room known to exist."""
+    await pool.run(lambda lk: lk.room.update_room_metadata(
+        UpdateRoomMetadataRequest(room=room_name, metadata=metadata)
+    ))
+    await cache.aset(_room_key(room_name), _metadata_digest(metadata), PROVISIONED_TTL)
+
+
+async def dispatch_agent(room_name: str) -> None:
+    """
+    Explicitly dispatch the interview agent when the worker registers under
+    LIVEKIT_AGENT_NAME. Without a name, LiveKit dispatches the worker to
+    every new room automatically.
+    """
+    agent_name = settings.LIVEKIT_AGENT_NAME
+    if not agent_name:
+        return
+    await pool.run(lambda lk: lk.agent_dispatch.create_dispatch(
+        CreateAgentDispatchRequest(agent_name=agent_name, room=room_name)
+    ))
+    logger.info("Dispatched agent %s to LiveKit room %s.", agent_name, room_name)
+
+
+def delete_room_later(room_name: str) -> None:
+    """Delete `room_name` in the background (callable from sync and async code)."""
+    cache.delete(_room_key(room_name))
+
+    def done(future):
+        if future.exception() is not None:
+            logger.warning("Could not delete LiveKit room %s: %s", room_name, future.exception())
+        else:
+            logger.info("Deleted LiveKit room %s.", room_name)
+
+    pool.submit(lambda lk: lk.room.delete_room(DeleteRoomRequest(room=room_name))).add_done_callback(done)
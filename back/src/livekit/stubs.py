@@ -0,0 +1,96 @@
+"""
+Local stand-ins for the OpenAI STT/TTS plugins.
+
+Used by the load-test harness so many concurrent interview sessions can run
+against a local LiveKit server without network calls or API costs. Both stubs
+simulate realistic latencies so turn timings stay meaningful.
+"""
+import asyncio
+
+import numpy as np
+from livekit.agents import DEFAULT_API_CONNECT_OPTIONS, APIConnectOptions, stt, tts, utils
+from livekit.agents.types import NOT_GIVEN, NotGivenOr
+from livekit.agents.utils import AudioBuffer
+
+
+class StubSTT(stt.STT):
+    """
+    Non-streaming STT that returns a fixed transcript for every utterance.
+    AgentSession wraps it with the VAD-driven StreamAdapter, exactly as it
+    would for any batch STT.
+    """
+
+    def __init__(self, *, transcript: str = "This is a synthetic load-test answer.", latency: float = 0.3):
+        super().__init__(capabilities=stt.STTCapabilities(streaming=False, interim_results=False))
+        self._transcript = transcript
+        self._latency = latency
+
+    async def _recognize_impl(
+        self,
+        buffer: AudioBuffer,
+        *,
+        language: NotGivenOr[str] = NOT_GIVEN,
+        conn_options: APIConnectOptions,
+    ) -> stt.SpeechEvent:
+        await asyncio.sleep(self._latency)
+        return stt.SpeechEvent(
+            type=stt.SpeechEventType.FINAL_TRANSCRIPT,
+            alternatives=[stt.SpeechData(language="en", text=self._transcript)],
+        )
+
+
+class StubTTS(tts.TTS):
+    """
+    Non-streaming TTS producing a quiet tone whose duration is proportional
+    to the text length, after a configurable time-to-first-byte.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: int = 24000,
+        ttfb: float = 0.15,
+        seconds_per_char: float = 0.06,
+    ):
+        super().__init__(
+            capabilities=tts.TTSCapabilities(streaming=False),
+            sample_rate=sample_rate,
+            num_channels=1,
+        )
+        self._ttfb = ttfb
+        self._seconds_per_char = seconds_per_char
+
+    def synthesize(
+        self,
+        text: str,
+        *,
+        conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS,
+    ) -> "StubChunkedStream":
+        return StubChunkedStream(tts=self, input_text=text, conn_options=conn_options)
+
+
+class StubChunkedStream(tts.ChunkedStream):
+    CHUNK_SECONDS = 0.1
+
+    async def _run(self, output_emitter: tts.AudioEmitter) -> None:
+        stub: StubTTS = self._tts
+        sample_rate = stub.sample_rate
+
+        output_emitter.initialize(
+            request_id=utils.shortuuid(),
+            sample_rate=sample_rate,
+            num_channels=1,
+            mime_type="audio/pcm",
+        )
+
+        await asyncio.sleep(stub._ttfb)
+
+        total = int(max(0.5, len(self.input_text) * stub._seconds_per_char) * sample_rate)
+        chunk = int(self.CHUNK_SECONDS * sample_rate)
+        t = np.arange(total) / sample_rate
+        pcm = (np.sin(2 * np.pi * 220 * t) * 2000).astype(np.int16)
+
+        for start in range(0, total, chunk):
+            output_emitter.push(pcm[start:start + chunk].tobytes())
+
+        output_emitter.flush()
@@ -0,0 +1,83 @@
+import asyncio
+import json
+import random
+import string
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from src.livekit import protocol
+
+# Random letters, so the message still needs several chunks once compressed.
+_rng = random.Random(0)
+ANSWERS = [{"qa_id": n, "answer": "".join(_rng.choices(string.ascii_letters, k=2000))} for n in range(40)]
+
+
+class FakeRoom:
+    """The parts of rtc.Room a DataChannel uses, recording published packets."""
+
+    def __init__(self):
+        self.published: list[bytes] = []
+        self.handlers = {}
+        self.local_participant = self
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def off(self, event, handler):
+        self.handlers.pop(event, None)
+
+    async def publish_data(self, packet, reliable, topic):
+        self.published.append(packet)
+
+    def receive(self, data: bytes, topic=protocol.TOPIC):
+        self.handlers["data_received"](SimpleNamespace(data=data, topic=topic))
+
+
+class DecoderTest(SimpleTestCase):
+    def test_chunked_message_is_reassembled_once(self):
+        packets = protocol.encode(7, "answers", {"answers": ANSWERS}, ack=True)
+        self.assertGreater(len(packets), 1)
+        self.assertTrue(all(len(packet) <= protocol.MAX_PACKET for packet in packets))
+
+        decoder = protocol.Decoder()
+        shuffled = random.Random(1).sample(packets, len(packets))
+        results = [decoder.feed(packet) for packet in shuffled]
+
+        self.assertEqual(results[:-1], [(None, None)] * (len(packets) - 1))
+        self.assertEqual(results[-1], ({"type": "answers", "answers": ANSWERS}, 7))
+        # A retransmission is acknowledged again but not delivered twice.
+        self.assertEqual([decoder.feed(packet) for packet in packets][-1], (None, 7))
+
+    def test_malformed_packets_are_dropped(self):
+        chunk = {"v": 1, "s": 3, "t": "chunk"}
+        decoder = protocol.Decoder()
+        for raw in [
+            b"not json",
+            b'{"v": 1, "t": "answers", "a": 1}',
+            b'{"v": 1, "s": 1, "t": "answers", "d": [1, 2]}',
+            json.dumps({**chunk, "d": "z"}).encode(),
+            json.dumps({**chunk, "d": {"i": 0, "n": 1, "z": "not base64!"}}).encode(),
+            json.dumps({**chunk, "s": 4, "d": {"i": 0, "n": 1, "z": "bm90IHpsaWI="}}).encode(),
+        ]:
+            with self.subTest(raw=raw):
+                self.assertEqual(decoder.feed(raw), (None, None))
+        self.assertEqual(decoder.feed(protocol.encode(5, "end")[0]), ({"type": "end"}, None))
+
+
+class DataChannelTest(SimpleTestCase):
+    @mock.patch.object(protocol, "ACK_TIMEOUT", 0.01)
+    async def test_critical_message_is_retransmitted_until_acked(self):
+        room = FakeRoom()
+        channel = protocol.DataChannel(room)
+
+        await channel.send("answers", {"answers": []}, critical=True)
+        while len(room.published) < 3:
+            await asyncio.sleep(0.005)
+        room.receive(protocol.encode_ack(1))
+
+        self.assertTrue(await channel.drain(timeout=1))
+        self.assertEqual(set(room.published), {protocol.encode(1, "answers", {"answers": []}, ack=True)[0]})
+        channel.close()
+        self.assertEqual(room.handlers, {})
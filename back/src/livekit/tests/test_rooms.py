@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from src.livekit import rooms
+
+
+class FakeLiveKit:
+    """The room service calls ensure_room makes, against an in-memory set of rooms."""
+
+    def __init__(self):
+        self.rooms: dict[str, str] = {}
+        self.created = 0
+        self.room = self
+
+    async def list_rooms(self, request):
+        return SimpleNamespace(rooms=[
+            SimpleNamespace(name=name, metadata=metadata)
+            for name, metadata in self.rooms.items() if name in request.names
+        ])
+
+    async def create_room(self, request):
+        self.created += 1
+        self.rooms.setdefault(request.name, request.metadata)
+        return SimpleNamespace(name=request.name, metadata=self.rooms[request.name])
+
+    async def update_room_metadata(self, request):
+        self.rooms[request.room] = request.metadata
+
+
+class EnsureRoomTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.livekit = FakeLiveKit()
+
+        async def run(fn):
+            return await fn(self.livekit)
+
+        patcher = mock.patch.object(rooms.pool, "run", run)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_marker_hit_for_live_room_skips_creation(self):
+        metadata = rooms.encode_metadata([{"qa_id": 1, "question": "Q?"}], "alloy", True)
+        await rooms.ensure_room("interview-1", metadata)
+        await rooms.ensure_room("interview-1", metadata, update=False)
+
+        self.assertEqual(self.livekit.created, 1)
+
+    async def test_room_closed_behind_marker_is_recreated(self):
+        metadata = rooms.encode_metadata([{"qa_id": 1, "question": "Q?"}], "alloy", True)
+        await rooms.ensure_room("interview-1", metadata)
+        # LiveKit closed it after the candidate left (departure timeout).
+        del self.livekit.rooms["interview-1"]
+
+        await rooms.ensure_room("interview-1", metadata, update=False)
+
+        self.assertEqual(self.livekit.created, 2)
+        self.assertEqual(self.livekit.rooms["interview-1"], metadata)
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class UserConfig(AppConfig):
     name = 'src.user'
+
+    def ready(self):
+        from . import signals  # noqa: F401
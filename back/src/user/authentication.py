@@ -0,0 +1,59 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+
+
+def _cache():
+    return caches[getattr(settings, "AUTH_TOKEN_CACHE", "default")]
+
+
+def token_cache_key(key: str) -> str:
+    # Never use the raw token as a cache key.
+    return "auth:token:" + hashlib.sha256(key.encode()).hexdigest()
+
+
+def invalidate_token(key: str) -> None:
+    _cache().delete(token_cache_key(key))
+
+
+def invalidate_user_tokens(user_ids) -> None:
+    """
+    Drop the cached tokens of `user_ids`. Model signals cover save() and
+    delete(); code changing users or tokens in bulk (queryset update() or
+    delete(), raw SQL) must call this itself.
+    """
+    from rest_framework.authtoken.models import Token
+
+    for key in Token.objects.filter(user_id__in=user_ids).values_list("key", flat=True):
+        invalidate_token(key)
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication with a TTL cache of token -> (user, token).
+
+    Cache entries are dropped as soon as a token is deleted or its user is
+    saved (see src.user.signals); bulk updates, which send no signals, must
+    call invalidate_user_tokens. With the default local-memory cache that
+    only covers the current process, so entries then expire after a few
+    seconds (AUTH_TOKEN_CACHE_TTL). Set REDIS_URL to share the cache so
+    invalidation reaches every worker immediately.
+    """
+
+    def authenticate_credentials(self, key):
+        cache = _cache()
+        cache_key = token_cache_key(key)
+
+        cached = cache.get(cache_key)
+        if cached is not None:
+            user, token = cached
+            if not user.is_active:
+                raise exceptions.AuthenticationFailed("User inactive or deleted.")
+            return user, token
+
+        user, token = super().authenticate_credentials(key)
+        cache.set(cache_key, (user, token), getattr(settings, "AUTH_TOKEN_CACHE_TTL", 300))
+        return user, token
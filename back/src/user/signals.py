@@ -0,0 +1,19 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from .authentication import invalidate_token, invalidate_user_tokens
+from .models import CustomUser
+
+
+@receiver(post_delete, sender=Token)
+def drop_deleted_token(sender, instance, **kwargs):
+    invalidate_token(instance.key)
+
+
+@receiver(post_save, sender=CustomUser)
+def drop_user_tokens(sender, instance, created, **kwargs):
+    """Any user change (deactivation included) must not be hidden by a cached user."""
+    if created:
+        return
+    invalidate_user_tokens([instance.pk])
@@ -0,0 +1,33 @@
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework import exceptions
+from rest_framework.authtoken.models import Token
+
+from src.user.authentication import CachedTokenAuthentication, invalidate_user_tokens
+from src.user.models import CustomUser
+
+
+class CachedTokenAuthenticationTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = CustomUser.objects.create_user(email="auth@example.invalid")
+        self.token = Token.objects.create(user=self.user)
+        self.auth = CachedTokenAuthentication()
+
+    def test_deleted_token_is_rejected_at_once(self):
+        key = self.token.key
+        self.auth.authenticate_credentials(key)
+        self.token.delete()
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            self.auth.authenticate_credentials(key)
+
+    def test_bulk_deactivation_needs_explicit_invalidation(self):
+        self.auth.authenticate_credentials(self.token.key)
+        CustomUser.objects.filter(pk=self.user.pk).update(is_active=False)
+        # No signal: the cached user is still active.
+        self.auth.authenticate_credentials(self.token.key)
+
+        invalidate_user_tokens([self.user.pk])
+
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            self.auth.authenticate_credentials(self.token.key)
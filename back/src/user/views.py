@@ -37,7 +37,8 @@ class LogoutView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request):
-        request.user.auth_token.delete()
+        # request.auth is the Token; deleting it also evicts it from the auth cache.
+        request.auth.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -0,0 +1,47 @@
+// Decoder for the agent's `interview` data-channel protocol, version 1.
+// Wire format and retransmission rules: back/src/livekit/protocol.py
+
+const VERSION = 1
+const textEncoder = new TextEncoder()
+const textDecoder = new TextDecoder()
+
+async function inflate(base64) {
+  const bytes = Uint8Array.from(atob(base64), (c) => c.charCodeAt(0))
+  const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('deflate'))
+  return new Response(stream).text()
+}
+
+// Returns decode(payload) -> Promise<{ message, ack }>. `message` is
+// { type, ...data }, or null while chunks are missing and for repeats;
+// `ack` is the sequence number to acknowledge, if any.
+export function createDecoder() {
+  const chunks = new Map()
+  const seen = new Set()
+
+  return async function decode(payload) {
+    let envelope = JSON.parse(textDecoder.decode(payload))
+    if (envelope.v !== VERSION) return { message: null, ack: null }
+
+    if (envelope.t === 'chunk') {
+      const { i, n, z } = envelope.d
+      const entry = chunks.get(envelope.s) || { parts: [], received: 0 }
+      if (entry.parts[i] === undefined) entry.received += 1
+      entry.parts[i] = z
+      chunks.set(envelope.s, entry)
+      if (entry.received < n) return { message: null, ack: null }
+      chunks.delete(envelope.s)
+      envelope = JSON.parse(await inflate(entry.parts.join('')))
+    }
+
+    const ack = envelope.a ? envelope.s : null
+    if (ack != null) {
+      if (seen.has(ack)) return { message: null, ack }
+      seen.add(ack)
+    }
+    return { message: { type: envelope.t, ...envelope.d }, ack }
+  }
+}
+
+export function encodeAck(seq) {
+  return textEncoder.encode(JSON.stringify({ v: VERSION, s: seq, t: 'ack' }))
+}
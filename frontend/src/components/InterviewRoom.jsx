@@ -1,5 +1,6 @@
 import { useState, useEffect, useCallback, useRef } from 'react'
 import { useDataChannel } from '@livekit/components-react'
+import { createDecoder, encodeAck } from '../api/agentProtocol'
 
 const bodyFont = "'Inter', -apple-system, BlinkMacSystemFont, sans-serif"
 const headingFont = "'DM Sans', sans-serif"
@@ -16,12 +17,15 @@ export default function InterviewRoom({
   const [currentIndex, setCurrentIndex] = useState(0)
   const [answers, setAnswers] = useState({})
   const [scores, setScores] = useState({})
+  const [liveTranscript, setLiveTranscript] = useState('')
   const [status, setStatus] = useState('agent_speaking')
   const [sessionStartMs] = useState(() => Date.now())
   const [elapsedSec, setElapsedSec] = useState(0)
   const [notes, setNotes] = useState('')
   const [camError, setCamError] = useState(false)
   const videoRef = useRef(null)
+  const decodeRef = useRef(null)
+  if (!decodeRef.current) decodeRef.current = createDecoder()
 
   // Webcam init
   useEffect(() => {
@@ -59,38 +63,48 @@ export default function InterviewRoom({
     } catch (_) {}
   }, [interviewId])
 
-  useDataChannel('interview', (msg) => {
-    try {
-      const data = JSON.parse(new TextDecoder().decode(msg.payload))
+  const handleAgentMessage = (data) => {
+    if (data.type === 'question_index') {
+      setCurrentIndex(data.index)
+      setLiveTranscript('')
+      setStatus('agent_speaking')
+    }
 
-      if (data.type === 'question_index') {
-        setCurrentIndex(data.index)
-        setStatus('agent_speaking')
-      }
+    if (data.type === 'interim_transcript') {
+      setLiveTranscript(data.text)
+    }
 
-      if (data.type === 'question_asked') {
-        setStatus('listening')
-      }
+    if (data.type === 'question_asked') {
+      setStatus('listening')
+    }
 
-      if (data.type === 'answer_captured') {
-        const { qa_id, answer, score } = data
-        setAnswers(prev => {
-          const updated = { ...prev, [qa_id]: answer }
-          const stored = JSON.parse(localStorage.getItem(`interview_${interviewId}`) || '{}')
-          localStorage.setItem(`interview_${interviewId}`, JSON.stringify({ ...stored, answers: updated }))
-          return updated
-        })
-        if (score != null) setScores(prev => ({ ...prev, [qa_id]: score }))
-        setStatus('agent_speaking')
-      }
+    if (data.type === 'answer_captured') {
+      const { qa_id, answer, score } = data
+      setAnswers(prev => {
+        const updated = { ...prev, [qa_id]: answer }
+        const stored = JSON.parse(localStorage.getItem(`interview_${interviewId}`) || '{}')
+        localStorage.setItem(`interview_${interviewId}`, JSON.stringify({ ...stored, answers: updated }))
+        return updated
+      })
+      if (score != null) setScores(prev => ({ ...prev, [qa_id]: score }))
+      setLiveTranscript('')
+      setStatus('agent_speaking')
+    }
 
-      if (data.type === 'interview_complete') {
-        setStatus('done')
-        onComplete(data.answers)
-      }
-    } catch (e) {
-      console.error('Failed to parse agent message', e)
+    if (data.type === 'interview_complete') {
+      setStatus('done')
+      onComplete(data.answers)
     }
+  }
+
+  const { send } = useDataChannel('interview', (msg) => {
+    decodeRef.current(msg.payload)
+      .then(({ message, ack }) => {
+        // Ack repeats too: the agent retransmits until an ack gets through.
+        if (ack != null) send(encodeAck(ack), { reliable: true })
+        if (message) handleAgentMessage(message)
+      })
+      .catch((e) => console.error('Failed to parse agent message', e))
   })
 
   const currentQA = qaPairs[currentIndex]
@@ -290,6 +304,11 @@ export default function InterviewRoom({
                 <line x1="12" y1="19" x2="12" y2="22" />
               </svg>
             </div>
+            {isListening && liveTranscript && (
+              <p style={{ margin: '0 0 12px', fontSize: 15, color: '#0f172a', lineHeight: 1.5 }}>
+                {liveTranscript}
+              </p>
+            )}
             <p style={{ margin: 0, fontSize: 13, color: '#94a3b8' }}>Your microphone is active. The AI interviewer will guide you.</p>
           </div>
         </div>
@@ -71,14 +71,30 @@ export default function Dashboard() {
   const [interviews, setInterviews] = useState([])
   const [loading, setLoading] = useState(true)
   const [filter, setFilter] = useState('all') 
+  const [nextPage, setNextPage] = useState(null)
+  const [loadingMore, setLoadingMore] = useState(false)
 
   useEffect(() => {
     client.get('/interviews/')
-      .then(res => setInterviews(res.data || []))
+      .then(res => {
+        setInterviews(res.data?.results || [])
+        setNextPage(res.data?.next || null)
+      })
       .catch(() => navigate('/login'))
       .finally(() => setLoading(false))
   }, [navigate])
 
+  const loadMore = () => {
+    if (!nextPage) return
+    setLoadingMore(true)
+    client.get(nextPage)
+      .then(res => {
+        setInterviews(prev => [...prev, ...(res.data?.results || [])])
+        setNextPage(res.data?.next || null)
+      })
+      .finally(() => setLoadingMore(false))
+  }
+
   const handleLogout = () => {
     localStorage.removeItem('token')
     navigate('/login')
@@ -545,6 +561,26 @@ export default function Dashboard() {
                     </div>
                   )
                 })}
+                {nextPage && (
+                  <button
+                    onClick={loadMore}
+                    disabled={loadingMore}
+                    style={{
+                      alignSelf: 'center',
+                      padding: '8px 16px',
+                      borderRadius: radius.md,
+                      border: `1px solid ${colors.border}`,
+                      background: colors.surface,
+                      color: colors.textSecondary,
+                      fontSize: 13,
+                      fontWeight: 500,
+                      cursor: 'pointer',
+                      fontFamily: bodyFont,
+                    }}
+                  >
+                    {loadingMore ? 'Loading…' : 'Load more'}
+                  </button>
+                )}
               </div>
             )}
           </section>
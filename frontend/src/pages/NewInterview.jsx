@@ -30,7 +30,7 @@ export default function NewInterview() {
 
   useEffect(() => {
     let cancelled = false
-    client.get('/agents/')
+    client.get('/agents/summary/')
       .then((res) => {
         if (!cancelled) setAgents(Array.isArray(res.data) ? res.data : [])
       })
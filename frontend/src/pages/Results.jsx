@@ -5,6 +5,41 @@ import client from '../api/client'
 const POLL_INTERVAL = 3000
 const POLL_TIMEOUT = 120000 // stop polling after 2 minutes
 
+// Reads the evaluation event stream (fetch rather than EventSource, which
+// cannot send the Authorization header). Calls onEvent(name, data) per event.
+async function readEvaluationStream(id, onEvent, signal) {
+  const res = await fetch(`${client.defaults.baseURL}/interviews/${id}/evaluation/stream/`, {
+    headers: {
+      Accept: 'text/event-stream',
+      Authorization: `Token ${localStorage.getItem('token')}`,
+      'ngrok-skip-browser-warning': 'true',
+    },
+    signal,
+  })
+  if (!res.ok || !res.body) throw new Error(`Stream failed with status ${res.status}`)
+
+  const reader = res.body.getReader()
+  const decoder = new TextDecoder()
+  let buffer = ''
+  for (;;) {
+    const { value, done } = await reader.read()
+    if (done) return
+    buffer += decoder.decode(value, { stream: true })
+    let end
+    while ((end = buffer.indexOf('\n\n')) !== -1) {
+      const block = buffer.slice(0, end)
+      buffer = buffer.slice(end + 2)
+      let event = 'message'
+      let data = ''
+      for (const line of block.split('\n')) {
+        if (line.startsWith('event:')) event = line.slice(6).trim()
+        else if (line.startsWith('data:')) data += line.slice(5).trim()
+      }
+      if (data) onEvent(event, JSON.parse(data))
+    }
+  }
+}
+
 export default function Results() {
   const { id } = useParams()
   const navigate = useNavigate()
@@ -39,16 +74,50 @@ export default function Results() {
           setScoring(false)
         }
       }
+      return data
     } catch {
       clearInterval(pollTimer.current)
       navigate('/dashboard')
+      return null
     }
   }
 
-  useEffect(() => {
-    fetchInterview()
+  const startPolling = () => {
+    clearInterval(pollTimer.current)
     pollTimer.current = setInterval(fetchInterview, POLL_INTERVAL)
-    return () => clearInterval(pollTimer.current)
+  }
+
+  useEffect(() => {
+    const controller = new AbortController()
+
+    const onEvent = (event, data) => {
+      if (event === 'qa') {
+        setInterview(prev => prev && {
+          ...prev,
+          qa_pairs: prev.qa_pairs.map(qa => qa.id === data.id ? { ...qa, score: data.score, feedback: data.feedback } : qa),
+        })
+      } else if (event === 'summary') {
+        setInterview(prev => prev && { ...prev, ...data })
+        setScoring(false)
+      } else if (event === 'error') {
+        setScoring(false)
+      } else if (event === 'timeout') {
+        startPolling()
+      }
+    }
+
+    fetchInterview().then(data => {
+      if (!data || data.overall_score != null) return
+      // Live updates; fall back to polling if the stream is unavailable.
+      readEvaluationStream(id, onEvent, controller.signal).catch(err => {
+        if (err.name !== 'AbortError') startPolling()
+      })
+    })
+
+    return () => {
+      controller.abort()
+      clearInterval(pollTimer.current)
+    }
   }, [])
 
   if (loading) return <p style={{ textAlign: 'center', marginTop: 100 }}>Loading results...</p>
@@ -119,11 +188,15 @@ export default function Results() {
         }}>
           <div style={{ display: 'flex', justifyContent: 'space-between', alignItems: 'flex-start' }}>
             <p style={{ margin: '0 0 8px', color: '#888', fontSize: 13 }}>Question {i + 1}</p>
-            {qa.score && (
+            {qa.score ? (
               <span style={{ fontWeight: 'bold', color: scoreColor(qa.score), fontSize: 18 }}>
                 {qa.score}/10
               </span>
-            )}
+            ) : scoring && qa.provisional_score ? (
+              <span title="Quick estimate while the full evaluation runs" style={{ color: '#aaa', fontSize: 15 }}>
+                ~{qa.provisional_score}/10
+              </span>
+            ) : null}
           </div>
           <p style={{ margin: '0 0 12px', fontWeight: 600 }}>{qa.question.text}</p>
           <p style={{ margin: '0 0 8px', color: '#555', background: '#f9f9f9', padding: 10, borderRadius: 6 }}>
@@ -108,7 +108,12 @@ export default function Session() {
     initialized.current = true
     const init = async () => {
       try {
-        const startRes = await client.post(`/interviews/${id}/start/`)
+        // The token does not depend on the questions, so fetch it while they generate.
+        const [startRes, tokenRes] = await Promise.all([
+          // Same key on every attempt: a retried or reloaded start replays the first result.
+          client.post(`/interviews/${id}/start/`, null, { headers: { 'Idempotency-Key': `interview-${id}-start` } }),
+          client.get(`/livekit/get_token/?interview_id=${id}`),
+        ])
         const data = startRes.data
         const qa_pairs = data.qa_pairs || []
         setQaPairs(qa_pairs)
@@ -123,7 +128,6 @@ export default function Session() {
           answers: {},
         }))
 
-        const tokenRes = await client.get(`/livekit/get_token/?interview_id=${id}`)
         setToken(tokenRes.data.token)
         setPhase('interview')
       } catch (err) {
@@ -138,7 +142,9 @@ export default function Session() {
   const handleInterviewComplete = async (answers) => {
     setPhase('submitting')
     try {
-      await client.post(`/interviews/${id}/complete/`, { answers })
+      await client.post(`/interviews/${id}/complete/?stream=1`, { answers }, {
+        headers: { 'Idempotency-Key': `interview-${id}-complete` },
+      })
       localStorage.removeItem(`interview_${id}`)
       navigate(`/interviews/${id}/results`)
     } catch (err) {